@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academies', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='academyprofile',
+            name='academy_image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='학원 이미지 변환본'),
+        ),
+    ]
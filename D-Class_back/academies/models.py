@@ -38,6 +38,13 @@ class AcademyProfile(models.Model):
         blank=True,
         verbose_name='학원 이미지'
     )
+    # WebP 변환본 정보 (common.images에서 백그라운드로 생성, 원본 이름이 source와 다르면 갱신 전)
+    academy_image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name='학원 이미지 변환본'
+    )
     address = models.CharField(max_length=200, verbose_name='주소')
     phone = models.CharField(max_length=20, blank=True, verbose_name='전화번호')
     operating_hours = models.CharField(
@@ -84,5 +91,21 @@ class AcademyProfile(models.Model):
         verbose_name = '학원 프로필'
         verbose_name_plural = '학원 프로필'
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 학원명 변경 시에만 공고 검색 벡터를 갱신하도록 DB에 저장된 학원명 보관
+        instance._loaded_academy_name = instance.__dict__.get('academy_name')
+        return instance
+    
+    @property
+    def academy_name_changed(self):
+        """DB에서 불러온 뒤 학원명이 바뀌었는지 여부"""
+        return not hasattr(self, '_loaded_academy_name') or self._loaded_academy_name != self.__dict__.get('academy_name')
+    
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._loaded_academy_name = self.__dict__.get('academy_name')
+    
     def __str__(self):
         return self.academy_name
@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from common.images import image_variant_urls
 from .models import AcademyProfile
 from users.models import User
 
@@ -6,6 +7,7 @@ from users.models import User
 class AcademyProfileSerializer(serializers.ModelSerializer):
     """학원 프로필 시리얼라이저 (공개)"""
     is_verified = serializers.BooleanField(source='user.is_verified', read_only=True)
+    academy_image_variants = serializers.SerializerMethodField()
     average_rating = serializers.SerializerMethodField()
     review_count = serializers.SerializerMethodField()
     job_postings = serializers.SerializerMethodField()
@@ -15,23 +17,22 @@ class AcademyProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = AcademyProfile
         fields = [
-            'id', 'academy_name', 'academy_image', 'is_verified',
+            'id', 'academy_name', 'academy_image', 'academy_image_variants', 'is_verified',
             'address', 'phone', 'operating_hours', 'main_genres',
             'description', 'facilities', 'average_rating', 'review_count',
             'job_postings', 'reviews', 'location'
         ]
     
+    def get_academy_image_variants(self, obj):
+        return image_variant_urls(obj.academy_image.name, obj.academy_image_variants, self.context.get('request'))
+    
     def get_average_rating(self, obj):
-        from reviews.models import Review
-        from django.db.models import Avg
-        reviews = Review.objects.filter(academy=obj.user)
-        if reviews.exists():
-            return round(reviews.aggregate(avg=Avg('rating'))['avg'], 1)
-        return None
+        from reviews.stats import get_review_stats
+        return get_review_stats(obj.user).average_rating
     
     def get_review_count(self, obj):
-        from reviews.models import Review
-        return Review.objects.filter(academy=obj.user).count()
+        from reviews.stats import get_review_stats
+        return get_review_stats(obj.user).review_count
     
     def get_job_postings(self, obj):
         from job_postings.models import JobPosting
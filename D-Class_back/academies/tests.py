@@ -1,3 +1,53 @@
-from django.test import TestCase
+import io
+import shutil
+import tempfile
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+
+from common.images import update_variants
+from users.models import User
+from .models import AcademyProfile
+
+
+def make_image(name='academy.jpg', size=(1200, 800)):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, (200, 80, 40)).save(buffer, 'JPEG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/jpeg')
+
+
+class AcademyProfileConditionalResponseTest(TestCase):
+    """학원 프로필 ETag - 이미지 변환본 반영 후 304가 아니라 새 응답을 받아야 함"""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        media = override_settings(MEDIA_ROOT=self.media_root, OUTBOX_WORKER_THREAD=False)
+        media.enable()
+        self.addCleanup(media.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+
+        self.user = User.objects.create_user(
+            email='academy@example.com', password='password1234!',
+            name='테스트 학원', phone='010-0000-0000', role='academy',
+        )
+        self.profile = AcademyProfile.objects.create(user=self.user, academy_image=make_image())
+        self.url = f'/api/v1/academies/{self.user.id}/'
+        self.client = APIClient()
+
+    def test_etag_changes_after_update_variants(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data['academy_image_variants'])
+        etag = response.headers['ETag']
+
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        profile = AcademyProfile.objects.get(pk=self.profile.pk)
+        self.assertTrue(update_variants(profile, 'academy_image'))
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertIn('srcset', response.data['academy_image_variants'])
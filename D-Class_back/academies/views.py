@@ -1,12 +1,14 @@
 from rest_framework import generics
 from rest_framework.permissions import AllowAny
+from django.db.models import Count, Max
 from django.shortcuts import get_object_or_404
+from common.mixins import ConditionalResponseMixin
 from .models import AcademyProfile
 from .serializers import AcademyProfileSerializer
 from users.models import User
 
 
-class AcademyProfileDetailView(generics.RetrieveAPIView):
+class AcademyProfileDetailView(ConditionalResponseMixin, generics.RetrieveAPIView):
     """학원 프로필 조회 (공개)"""
     permission_classes = [AllowAny]
     serializer_class = AcademyProfileSerializer
@@ -16,8 +18,37 @@ class AcademyProfileDetailView(generics.RetrieveAPIView):
     def get_queryset(self):
         return AcademyProfile.objects.select_related('user')
     
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().retrieve, *args, **kwargs)
+    
+    def get_conditional_validators(self, request):
+        """학원 프로필/평점 통계 + 공고·리뷰의 최종 수정 시각과 개수"""
+        from job_postings.models import JobPosting
+        from reviews.models import Review
+        academy_id = self.kwargs.get('academy_id')
+        profile = AcademyProfile.objects.filter(
+            user_id=academy_id, user__role='academy'
+        ).values_list('updated_at', 'user__is_verified', 'user__review_stats__updated_at').first()
+        if profile is None:
+            return None
+        postings = JobPosting.objects.filter(academy_id=academy_id).aggregate(
+            updated_at=Max('updated_at'), count=Count('id')
+        )
+        reviews = Review.objects.filter(academy_id=academy_id).aggregate(
+            updated_at=Max('updated_at'), count=Count('id')
+        )
+        return [
+            *profile,
+            postings['updated_at'], postings['count'],
+            reviews['updated_at'], reviews['count'],
+        ]
+    
     def get_object(self):
         academy_id = self.kwargs.get('academy_id')
-        user = get_object_or_404(User, id=academy_id, role='academy')
+        user = get_object_or_404(
+            User.objects.select_related('review_stats'), id=academy_id, role='academy'
+        )
         profile, created = AcademyProfile.objects.get_or_create(user=user)
+        # 리뷰 통계를 함께 조회한 사용자 객체 재사용
+        profile.user = user
         return profile
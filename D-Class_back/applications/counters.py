@@ -0,0 +1,123 @@
+from django.db import transaction
+from django.db.models import Count, F, Q
+
+from .models import Application
+
+
+STATUSES = [status for status, _ in Application.STATUS_CHOICES]
+
+
+def status_count_field(status):
+    """상태별 지원 수 카운터 필드명 (예: 'pending' -> 'pending_count')"""
+    return f'{status}_count'
+
+
+def adjust_application_counts(job_posting_id, added_status=None, removed_status=None):
+    """
+    공고의 지원 수 카운터 갱신 (F() 표현식으로 원자적 UPDATE 1회)
+    생성: added_status만, 취소/삭제: removed_status만, 상태 변경: 둘 다 지정
+    """
+    from job_postings.models import JobPosting
+    from job_postings.signals import bump_job_posting_response_cache
+
+    if added_status == removed_status:
+        return
+    changes = {}
+    if added_status in STATUSES:
+        field = status_count_field(added_status)
+        changes[field] = F(field) + 1
+    if removed_status in STATUSES:
+        field = status_count_field(removed_status)
+        changes[field] = F(field) - 1
+    if added_status is None:
+        changes['application_count'] = F('application_count') - 1
+    elif removed_status is None:
+        changes['application_count'] = F('application_count') + 1
+    if changes:
+        JobPosting.objects.filter(pk=job_posting_id).update(**changes)
+        # update()는 시그널이 없으므로 공개 공고 응답(지원 수 포함) 캐시를 직접 무효화
+        bump_job_posting_response_cache()
+
+
+def lock_application_status(application):
+    """지원 행을 잠그고 DB에 저장된 현재 상태 조회 (트랜잭션 내에서 호출)"""
+    return Application.objects.select_for_update().filter(
+        pk=application.pk
+    ).values_list('status', flat=True).first()
+
+
+def change_application_status(application, new_status, **fields):
+    """
+    지원 상태 변경 + 공고 카운터 갱신 (같은 트랜잭션)
+    행을 잠그고 DB의 현재 상태 기준으로 카운터를 옮기므로 동시 요청에도 중복 반영되지 않음
+    """
+    with transaction.atomic():
+        previous_status = lock_application_status(application)
+        application.status = new_status
+        for name, value in fields.items():
+            setattr(application, name, value)
+        application.save()
+        if previous_status is not None:
+            adjust_application_counts(application.job_posting_id, new_status, previous_status)
+
+
+def delete_application(application):
+    """지원 삭제 + 공고 카운터 차감 (같은 트랜잭션)"""
+    with transaction.atomic():
+        previous_status = lock_application_status(application)
+        job_posting_id = application.job_posting_id
+        application.delete()
+        if previous_status is not None:
+            adjust_application_counts(job_posting_id, removed_status=previous_status)
+
+
+def reconcile_application_counts(queryset=None, dry_run=False):
+    """
+    Application 테이블 기준으로 공고 카운터 재계산
+    실제 값과 다른 공고만 갱신하고 (공고, 기존 값, 실제 값) 목록 반환
+    """
+    from job_postings.models import JobPosting
+
+    if queryset is None:
+        queryset = JobPosting.objects.all()
+    counter_fields = ['application_count'] + [status_count_field(status) for status in STATUSES]
+    actual = queryset.order_by().annotate(
+        actual_application_count=Count('applications'),
+        **{
+            f'actual_{status_count_field(status)}': Count(
+                'applications', filter=Q(applications__status=status)
+            )
+            for status in STATUSES
+        }
+    ).only('id', *counter_fields)
+
+    drifted = []
+    for posting in actual.iterator():
+        stored = {field: getattr(posting, field) for field in counter_fields}
+        expected = {field: getattr(posting, f'actual_{field}') for field in counter_fields}
+        if stored == expected:
+            continue
+        if not dry_run:
+            expected = _fix_application_counts(posting.pk)
+        drifted.append((posting.pk, stored, expected))
+    return drifted
+
+
+def _fix_application_counts(job_posting_id):
+    """공고 행을 잠근 상태에서 다시 집계하여 저장 (진행 중인 F() 갱신과 충돌하지 않도록)"""
+    from job_postings.models import JobPosting
+    from job_postings.signals import bump_job_posting_response_cache
+
+    with transaction.atomic():
+        JobPosting.objects.select_for_update().filter(pk=job_posting_id).values_list('pk').first()
+        applications = Application.objects.filter(job_posting_id=job_posting_id)
+        counts = dict(
+            applications.order_by().values_list('status').annotate(count=Count('id'))
+        )
+        expected = {
+            'application_count': sum(counts.values()),
+            **{status_count_field(status): counts.get(status, 0) for status in STATUSES},
+        }
+        JobPosting.objects.filter(pk=job_posting_id).update(**expected)
+        bump_job_posting_response_cache()
+    return expected
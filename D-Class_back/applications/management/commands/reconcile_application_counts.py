@@ -0,0 +1,44 @@
+"""
+공고 지원 수 카운터(application_count, 상태별 수) 보정
+Usage: python manage.py reconcile_application_counts [--dry-run] [--posting 1]
+"""
+from django.core.management.base import BaseCommand
+
+from applications.counters import reconcile_application_counts
+from job_postings.models import JobPosting
+
+
+class Command(BaseCommand):
+    help = 'Reconcile counter-cached application counts on job postings'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--posting',
+            type=int,
+            action='append',
+            dest='posting_ids',
+            help='보정할 공고 ID (여러 번 지정 가능, 미지정 시 전체)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='수정하지 않고 차이만 출력',
+        )
+
+    def handle(self, *args, **options):
+        queryset = JobPosting.objects.all()
+        if options['posting_ids']:
+            queryset = queryset.filter(pk__in=options['posting_ids'])
+
+        drifted = reconcile_application_counts(queryset, dry_run=options['dry_run'])
+        for posting_id, stored, expected in drifted:
+            changes = ', '.join(
+                f'{field} {stored[field]} -> {expected[field]}'
+                for field in expected if stored[field] != expected[field]
+            )
+            self.stdout.write(f'  - posting {posting_id}: {changes}')
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'{len(drifted)} postings have drifted counts'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Reconciled {len(drifted)} postings'))
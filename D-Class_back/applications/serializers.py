@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from common.images import image_variant_urls
 from .models import Application
 from instructors.serializers import InstructorProfileSerializer
 from job_postings.serializers import JobPostingListSerializer
@@ -85,6 +86,7 @@ class ApplicationInstructorSerializer(serializers.ModelSerializer):
                 'id': obj.instructor.id,
                 'name': obj.instructor.name,
                 'profile_image': profile.profile_image.url if profile.profile_image else None,
+                'profile_image_variants': image_variant_urls(profile.profile_image.name, profile.profile_image_variants),
                 'is_verified': obj.instructor.is_verified,
                 'specialties': profile.specialties
             }
@@ -130,6 +132,7 @@ class ApplicationDetailSerializer(serializers.ModelSerializer):
                 'id': obj.instructor.id,
                 'name': obj.instructor.name,
                 'profile_image': profile.profile_image.url if profile.profile_image else None,
+                'profile_image_variants': image_variant_urls(profile.profile_image.name, profile.profile_image_variants),
                 'is_verified': obj.instructor.is_verified,
                 'specialties': profile.specialties,
                 'bio': profile.bio,
@@ -187,14 +190,10 @@ class ApplicationDetailSerializer(serializers.ModelSerializer):
         return review.id if review else None
     
     def _get_average_rating(self, instructor):
-        from reviews.models import Review
-        from django.db.models import Avg
-        reviews = Review.objects.filter(instructor=instructor)
-        if reviews.exists():
-            return round(reviews.aggregate(avg=Avg('rating'))['avg'], 1)
-        return None
+        from reviews.stats import get_review_stats
+        return get_review_stats(instructor).average_rating
     
     def _get_review_count(self, instructor):
-        from reviews.models import Review
-        return Review.objects.filter(instructor=instructor).count()
+        from reviews.stats import get_review_stats
+        return get_review_stats(instructor).review_count
 
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from common.sync import record_tombstone
+from .models import Application
+
+
+@receiver(post_delete, sender=Application)
+def record_application_tombstone(sender, instance, **kwargs):
+    """지원 취소/삭제 기록 (강사 지원 현황 ?since= 증분 동기화 응답의 deleted)"""
+    record_tombstone('application', instance.pk, instance.instructor_id)
@@ -4,14 +4,38 @@ from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.decorators import action
 from django_filters.rest_framework import DjangoFilterBackend
+from django.db import transaction
+from django.utils import timezone
 from .models import Application
+from .counters import (
+    adjust_application_counts,
+    change_application_status,
+    delete_application,
+    lock_application_status
+)
 from .serializers import (
     ApplicationCreateSerializer,
     ApplicationListSerializer,
     ApplicationInstructorSerializer,
     ApplicationDetailSerializer
 )
-from notifications.models import Notification
+from common.push import push_hub
+from common.sync import DeltaSyncMixin
+from instructors.models import InstructorProfile
+from notifications.delivery import notify
+
+
+def get_academy_name(academy):
+    return academy.academy_profile.academy_name if hasattr(academy, 'academy_profile') else academy.name
+
+
+def push_application_event(user_id, application):
+    """지원 상태 변경을 실시간 알림 스트림으로 전달 (커밋 이후)"""
+    push_hub.publish_on_commit(user_id, 'application', {
+        'id': application.id,
+        'job_posting': application.job_posting_id,
+        'status': application.status,
+    })
 
 
 class ApplicationViewSet(viewsets.ModelViewSet):
@@ -32,7 +56,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
             # 학원: 내 공고의 지원자 목록
             return Application.objects.filter(
                 job_posting__academy=user
-            ).select_related('instructor', 'job_posting').prefetch_related(
+            ).select_related('instructor', 'instructor__review_stats', 'job_posting').prefetch_related(
                 'instructor__instructor_profile'
             )
         return Application.objects.none()
@@ -63,16 +87,30 @@ class ApplicationViewSet(viewsets.ModelViewSet):
             raise PermissionDenied('강사만 지원할 수 있습니다')
         if user.verification_status != 'approved':
             raise PermissionDenied('인증이 완료된 강사만 지원할 수 있습니다')
-        application = serializer.save(instructor=user, status='pending')
-        
-        # 학원에게 알림 발송
-        Notification.objects.create(
-            user=application.job_posting.academy,
-            type='new_application',
-            title='새 지원 알림',
-            content=f'{application.instructor.name}님이 "{application.job_posting.title}" 공고에 지원하셨습니다',
-            related_url=f'/applications/{application.id}/'
-        )
+        with transaction.atomic():
+            application = serializer.save(instructor=user, status='pending')
+            adjust_application_counts(application.job_posting_id, added_status=application.status)
+            
+            # 학원에게 알림 발송 (아웃박스 - 커밋 이후 워커가 생성)
+            notify(
+                user_id=application.job_posting.academy_id,
+                type='new_application',
+                title='새 지원 알림',
+                content=f'{application.instructor.name}님이 "{application.job_posting.title}" 공고에 지원하셨습니다',
+                related_url=f'/applications/{application.id}/'
+            )
+            push_application_event(application.job_posting.academy_id, application)
+    
+    def perform_update(self, serializer):
+        # 상태가 변경되면 공고 지원 수 카운터도 함께 갱신
+        with transaction.atomic():
+            previous_status = lock_application_status(serializer.instance)
+            application = serializer.save()
+            if previous_status is not None:
+                adjust_application_counts(application.job_posting_id, application.status, previous_status)
+    
+    def perform_destroy(self, instance):
+        delete_application(instance)
     
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated])
     def accept(self, request, pk=None):
@@ -85,22 +123,23 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        application.status = 'accepted'
-        application.save()
-        
-        # 강사 프로필 연락처 공개
-        if hasattr(application.instructor, 'instructor_profile'):
-            application.instructor.instructor_profile.contact_visible = True
-            application.instructor.instructor_profile.save()
-        
-        # 강사에게 알림 발송
-        Notification.objects.create(
-            user=application.instructor,
-            type='application_accepted',
-            title='지원 결과 알림',
-            content=f'{application.job_posting.academy.academy_profile.academy_name if hasattr(application.job_posting.academy, "academy_profile") else application.job_posting.academy.name}의 "{application.job_posting.title}" 공고에 최종 합격하셨습니다',
-            related_url=f'/applications/{application.id}/'
-        )
+        with transaction.atomic():
+            change_application_status(application, 'accepted')
+            
+            # 강사 프로필 연락처 공개 (채용 확정과 같은 트랜잭션)
+            InstructorProfile.objects.filter(user_id=application.instructor_id).update(
+                contact_visible=True, updated_at=timezone.now()
+            )
+            
+            # 강사에게 알림 발송 (아웃박스 - 커밋 이후 워커가 생성)
+            notify(
+                user_id=application.instructor_id,
+                type='application_accepted',
+                title='지원 결과 알림',
+                content=f'{get_academy_name(application.job_posting.academy)}의 "{application.job_posting.title}" 공고에 최종 합격하셨습니다',
+                related_url=f'/applications/{application.id}/'
+            )
+            push_application_event(application.instructor_id, application)
         
         return Response({
             'message': '채용이 확정되었습니다',
@@ -120,18 +159,18 @@ class ApplicationViewSet(viewsets.ModelViewSet):
             )
         
         reason = request.data.get('reason', '')
-        application.status = 'rejected'
-        application.rejection_reason = reason
-        application.save()
-        
-        # 강사에게 알림 발송
-        Notification.objects.create(
-            user=application.instructor,
-            type='application_rejected',
-            title='지원 결과 알림',
-            content=f'{application.job_posting.academy.academy_profile.academy_name if hasattr(application.job_posting.academy, "academy_profile") else application.job_posting.academy.name}의 "{application.job_posting.title}" 공고에 불합격 처리되었습니다',
-            related_url=f'/applications/{application.id}/'
-        )
+        with transaction.atomic():
+            change_application_status(application, 'rejected', rejection_reason=reason)
+            
+            # 강사에게 알림 발송 (아웃박스 - 커밋 이후 워커가 생성)
+            notify(
+                user_id=application.instructor_id,
+                type='application_rejected',
+                title='지원 결과 알림',
+                content=f'{get_academy_name(application.job_posting.academy)}의 "{application.job_posting.title}" 공고에 불합격 처리되었습니다',
+                related_url=f'/applications/{application.id}/'
+            )
+            push_application_event(application.instructor_id, application)
         
         return Response({
             'message': '불합격 처리되었습니다',
@@ -159,22 +198,25 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         
         # 알림 발송을 위해 필요한 정보 저장
         application_id = application.id
-        academy = application.job_posting.academy
-        job_posting_title = application.job_posting.title
-        job_posting_id = application.job_posting.id
-        instructor_name = application.instructor.name
-        
-        # 지원 삭제
-        application.delete()
-        
-        # 학원에게 알림 발송
-        Notification.objects.create(
-            user=academy,
-            type='application_cancelled',
-            title='지원 취소 알림',
-            content=f'{instructor_name}님이 "{job_posting_title}" 공고 지원을 취소하셨습니다',
-            related_url=f'/job-postings/{job_posting_id}/'
-        )
+        job_posting = application.job_posting
+        
+        with transaction.atomic():
+            # 지원 삭제 (공고 지원 수 카운터 함께 차감)
+            delete_application(application)
+            
+            # 학원에게 알림 발송 (아웃박스 - 커밋 이후 워커가 생성)
+            notify(
+                user_id=job_posting.academy_id,
+                type='application_cancelled',
+                title='지원 취소 알림',
+                content=f'{request.user.name}님이 "{job_posting.title}" 공고 지원을 취소하셨습니다',
+                related_url=f'/job-postings/{job_posting.id}/'
+            )
+            push_hub.publish_on_commit(job_posting.academy_id, 'application', {
+                'id': application_id,
+                'job_posting': job_posting.id,
+                'status': 'cancelled',
+            })
         
         return Response({
             'message': '지원이 취소되었습니다',
@@ -182,10 +224,13 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         }, status=status.HTTP_200_OK)
 
 
-class MyApplicationsView(generics.ListAPIView):
+class MyApplicationsView(DeltaSyncMixin, generics.ListAPIView):
     """내 지원 현황 조회 (강사)"""
     permission_classes = [IsAuthenticated]
     serializer_class = ApplicationListSerializer
+    # 응답에 공고 정보가 포함되므로 공고 수정도 변경으로 취급
+    sync_timestamp_fields = ['updated_at', 'job_posting__updated_at']
+    sync_tombstone_label = 'application'
     
     def get_queryset(self):
         if self.request.user.role != 'instructor':
@@ -196,6 +241,11 @@ class MyApplicationsView(generics.ListAPIView):
             'job_posting__academy__academy_profile'
         )
     
+    def list(self, request, *args, **kwargs):
+        if self.is_sync_request(request):
+            return self.sync_response(request)
+        return super().list(request, *args, **kwargs)
+    
     def get_serializer_context(self):
         """Serializer context에 request 추가"""
         context = super().get_serializer_context()
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Board, Post, PostImage
+from .models import Board, Comment, Post, PostImage
 
 
 @admin.register(Board)
@@ -16,8 +16,16 @@ class PostImageInline(admin.TabularInline):
 
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
-    list_display = ['title', 'author', 'board', 'views', 'created_at']
+    list_display = ['title', 'author', 'board', 'views', 'comments_count', 'created_at']
     list_filter = ['board', 'created_at']
     search_fields = ['title', 'content', 'author__name']
-    readonly_fields = ['views', 'created_at', 'updated_at']
+    readonly_fields = ['views', 'comments_count', 'created_at', 'updated_at']
     inlines = [PostImageInline]
+
+
+@admin.register(Comment)
+class CommentAdmin(admin.ModelAdmin):
+    list_display = ['post', 'author', 'depth', 'is_deleted', 'created_at']
+    list_filter = ['is_deleted', 'created_at']
+    search_fields = ['content', 'author__name', 'post__title']
+    readonly_fields = ['path', 'depth', 'created_at', 'updated_at']
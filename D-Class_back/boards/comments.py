@@ -0,0 +1,81 @@
+from django.db import transaction
+from django.db.models import Count, F, Q
+from rest_framework.exceptions import ValidationError
+
+from .models import Comment, Post
+
+
+def adjust_comments_count(post_id, delta):
+    """게시글 댓글 수 갱신 (F() 표현식으로 원자적 UPDATE 1회)"""
+    Post.objects.filter(pk=post_id).update(comments_count=F('comments_count') + delta)
+
+
+def create_comment(post, author, content, parent=None):
+    """댓글 저장 + 경로 지정 + 게시글 댓글 수 증가 (같은 트랜잭션)"""
+    with transaction.atomic():
+        # 상위 댓글 삭제와 동시에 답글이 달리지 않도록 상위 댓글 행 잠금
+        if parent is not None and not Comment.objects.select_for_update().filter(
+            pk=parent.pk, is_deleted=False
+        ).exists():
+            raise ValidationError({'parent': ['삭제된 댓글에는 답글을 작성할 수 없습니다']})
+        comment = Comment.objects.create(
+            post=post,
+            author=author,
+            parent=parent,
+            depth=parent.depth + 1 if parent else 0,
+            content=content,
+        )
+        # 경로에 자신의 ID가 포함되므로 저장 후 지정
+        comment.path = comment.build_path()
+        Comment.objects.filter(pk=comment.pk).update(path=comment.path)
+        adjust_comments_count(post.pk, 1)
+    return comment
+
+
+def delete_comment(comment):
+    """
+    댓글 삭제 + 게시글 댓글 수 차감 (같은 트랜잭션)
+    답글이 있으면 내용만 지우고 남겨 스레드를 유지
+    """
+    with transaction.atomic():
+        locked = Comment.objects.select_for_update().filter(
+            pk=comment.pk, is_deleted=False
+        ).values_list('pk', flat=True).first()
+        if locked is None:
+            return
+        if comment.replies.exists():
+            Comment.objects.filter(pk=comment.pk).update(is_deleted=True, content='')
+        else:
+            comment.delete()
+        adjust_comments_count(comment.post_id, -1)
+
+
+def reconcile_comment_counts(queryset=None, dry_run=False):
+    """
+    Comment 테이블 기준으로 게시글 댓글 수 재계산 (삭제 표시된 댓글 제외)
+    실제 값과 다른 게시글만 갱신하고 (게시글, 기존 값, 실제 값) 목록 반환
+    """
+    if queryset is None:
+        queryset = Post.objects.all()
+    actual = queryset.order_by().annotate(
+        actual_comments_count=Count('comments', filter=Q(comments__is_deleted=False))
+    ).only('id', 'comments_count')
+
+    drifted = []
+    for post in actual.iterator():
+        if post.comments_count == post.actual_comments_count:
+            continue
+        expected = post.actual_comments_count
+        if not dry_run:
+            expected = _fix_comments_count(post.pk)
+        drifted.append((post.pk, post.comments_count, expected))
+    return drifted
+
+
+def _fix_comments_count(post_id):
+    """게시글 행을 잠근 상태에서 다시 집계하여 저장 (진행 중인 F() 갱신과 충돌하지 않도록)"""
+    with transaction.atomic():
+        Post.objects.select_for_update().filter(pk=post_id).values_list('pk').first()
+        expected = Comment.objects.filter(post_id=post_id, is_deleted=False).count()
+        Post.objects.filter(pk=post_id).update(comments_count=expected)
+    return expected
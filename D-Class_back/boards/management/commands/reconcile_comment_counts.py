@@ -0,0 +1,40 @@
+"""
+게시글 댓글 수 카운터(comments_count) 보정
+Usage: python manage.py reconcile_comment_counts [--dry-run] [--post 1]
+"""
+from django.core.management.base import BaseCommand
+
+from boards.comments import reconcile_comment_counts
+from boards.models import Post
+
+
+class Command(BaseCommand):
+    help = 'Reconcile counter-cached comment counts on board posts'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--post',
+            type=int,
+            action='append',
+            dest='post_ids',
+            help='보정할 게시글 ID (여러 번 지정 가능, 미지정 시 전체)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='수정하지 않고 차이만 출력',
+        )
+
+    def handle(self, *args, **options):
+        queryset = Post.objects.all()
+        if options['post_ids']:
+            queryset = queryset.filter(pk__in=options['post_ids'])
+
+        drifted = reconcile_comment_counts(queryset, dry_run=options['dry_run'])
+        for post_id, stored, expected in drifted:
+            self.stdout.write(f'  - post {post_id}: comments_count {stored} -> {expected}')
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'{len(drifted)} posts have drifted counts'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Reconciled {len(drifted)} posts'))
@@ -0,0 +1,25 @@
+"""
+게시글 인기 점수(?sort=hot) 재계산 (조회수 반영 스레드에서도 주기적으로 실행됨)
+Usage: python manage.py refresh_hot_scores [--days 14]
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from boards.ranking import HOT_WINDOW, refresh_hot_scores
+
+
+class Command(BaseCommand):
+    help = 'Recompute time-decayed hot scores for recent board posts'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=HOT_WINDOW.days,
+            help='최근 며칠 동안 작성된 글을 재계산할지 (기본 14일, 마이그레이션 이후 전체 재계산은 큰 값 지정)',
+        )
+
+    def handle(self, *args, **options):
+        updated = refresh_hot_scores(timedelta(days=options['days']))
+        self.stdout.write(self.style.SUCCESS(f'Updated hot scores for {updated} posts'))
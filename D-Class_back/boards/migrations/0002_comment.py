@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:28
+
+from django.conf import settings
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('boards', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='댓글 수'),
+        ),
+        migrations.CreateModel(
+            name='Comment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('path', models.CharField(blank=True, max_length=55, verbose_name='경로')),
+                ('depth', models.PositiveSmallIntegerField(default=0, verbose_name='깊이')),
+                ('content', models.TextField(validators=[django.core.validators.MaxLengthValidator(1000)], verbose_name='내용')),
+                ('is_deleted', models.BooleanField(default=False, verbose_name='삭제 여부')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='작성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='board_comments', to=settings.AUTH_USER_MODEL, verbose_name='작성자')),
+                ('parent', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='replies', to='boards.comment', verbose_name='상위 댓글')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='boards.post', verbose_name='게시글')),
+            ],
+            options={
+                'verbose_name': '댓글',
+                'verbose_name_plural': '댓글',
+                'ordering': ['path'],
+                'indexes': [models.Index(fields=['post', 'path'], name='boards_comm_post_id_cf4b53_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:30
+
+from django.db import migrations, models
+
+
+def backfill_hot_scores(apps, schema_editor):
+    # 기존 글 전체에 점수 지정 (이후에는 최근 글만 주기적으로 재계산)
+    from boards.ranking import compute_hot_score
+
+    Post = apps.get_model('boards', 'Post')
+    posts = Post.objects.using(schema_editor.connection.alias).only('id', 'views', 'comments_count', 'created_at')
+    changed = []
+    for post in posts.iterator(chunk_size=1000):
+        post.hot_score = compute_hot_score(post.views, post.comments_count, post.created_at)
+        changed.append(post)
+    Post.objects.using(schema_editor.connection.alias).bulk_update(changed, ['hot_score'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0002_comment'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='hot_score',
+            field=models.FloatField(default=0, verbose_name='인기 점수'),
+        ),
+        migrations.RunPython(backfill_hot_scores, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['board', '-hot_score'], name='boards_post_board_i_793732_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0003_post_hot_score'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='postimage',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='이미지 변환본'),
+        ),
+    ]
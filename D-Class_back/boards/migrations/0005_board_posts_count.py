@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-18 13:00
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_posts_count(apps, schema_editor):
+    # 기존 게시판의 게시글 수를 UPDATE 1회로 채움 (이후에는 게시글 작성/삭제 시 F() 갱신)
+    Board = apps.get_model('boards', 'Board')
+    Post = apps.get_model('boards', 'Post')
+    counts = Post.objects.filter(board=OuterRef('pk')).order_by().values('board').annotate(total=Count('id')).values('total')
+    Board.objects.using(schema_editor.connection.alias).update(posts_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0004_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='posts_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='게시글 수'),
+        ),
+        migrations.RunPython(backfill_posts_count, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
 from django.conf import settings
 from django.core.validators import MaxLengthValidator
+from django.utils import timezone
 
 
 class Board(models.Model):
@@ -9,6 +10,8 @@ class Board(models.Model):
     name = models.CharField(max_length=100, unique=True, verbose_name='게시판 이름')
     description = models.TextField(blank=True, verbose_name='설명')
     is_active = models.BooleanField(default=True, verbose_name='활성화')
+    # 게시글 작성/삭제 시 F() 갱신 (게시판 목록 조회 시 COUNT 집계 없이 사용)
+    posts_count = models.PositiveIntegerField(default=0, verbose_name='게시글 수')
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
     
@@ -42,6 +45,10 @@ class Post(models.Model):
         verbose_name='내용'
     )
     views = models.PositiveIntegerField(default=0, verbose_name='조회수')
+    # 댓글 작성/삭제 시 F() 갱신 (reconcile_comment_counts로 보정)
+    comments_count = models.PositiveIntegerField(default=0, verbose_name='댓글 수')
+    # ?sort=hot 정렬용 시간 감쇠 인기 점수 (boards.ranking에서 주기적으로 재계산)
+    hot_score = models.FloatField(default=0, verbose_name='인기 점수')
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='작성일')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
     
@@ -52,10 +59,18 @@ class Post(models.Model):
         indexes = [
             models.Index(fields=['board', '-created_at']),
             models.Index(fields=['author', '-created_at']),
+            models.Index(fields=['board', '-hot_score']),
         ]
     
     def __str__(self):
         return f'{self.title} - {self.author.name}'
+    
+    def save(self, *args, **kwargs):
+        if self._state.adding and not self.hot_score:
+            # 새 글은 재계산 전에도 인기순 목록에 바로 노출되도록 작성 시각 기준 점수로 시작
+            from .ranking import compute_hot_score
+            self.hot_score = compute_hot_score(self.views, self.comments_count, timezone.now())
+        super().save(*args, **kwargs)
 
 
 class PostImage(models.Model):
@@ -71,6 +86,13 @@ class PostImage(models.Model):
         upload_to='boards/posts/',
         verbose_name='이미지'
     )
+    # WebP 변환본 정보 (common.images에서 백그라운드로 생성, 원본 이름이 source와 다르면 갱신 전)
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name='이미지 변환본'
+    )
     order = models.PositiveIntegerField(default=0, verbose_name='순서')
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
     
@@ -81,3 +103,59 @@ class PostImage(models.Model):
     
     def __str__(self):
         return f'{self.post.title} - 이미지 {self.order + 1}'
+
+
+class Comment(models.Model):
+    """
+    게시글 댓글 (답글 포함)
+    path: 최상위 댓글부터 자신까지의 ID를 고정 길이로 이어 붙인 경로 - path 순 정렬이 곧 스레드 순서
+    """
+    
+    PATH_SEGMENT_LENGTH = 10
+    MAX_DEPTH = 5
+    
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='comments',
+        verbose_name='게시글'
+    )
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='board_comments',
+        verbose_name='작성자'
+    )
+    parent = models.ForeignKey(
+        'self',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='replies',
+        verbose_name='상위 댓글'
+    )
+    path = models.CharField(max_length=(PATH_SEGMENT_LENGTH + 1) * MAX_DEPTH, blank=True, verbose_name='경로')
+    depth = models.PositiveSmallIntegerField(default=0, verbose_name='깊이')
+    content = models.TextField(
+        validators=[MaxLengthValidator(1000)],
+        verbose_name='내용'
+    )
+    # 답글이 있는 댓글은 스레드 유지를 위해 내용만 지우고 남김
+    is_deleted = models.BooleanField(default=False, verbose_name='삭제 여부')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='작성일')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
+    
+    class Meta:
+        verbose_name = '댓글'
+        verbose_name_plural = '댓글'
+        ordering = ['path']
+        indexes = [
+            models.Index(fields=['post', 'path']),
+        ]
+    
+    def __str__(self):
+        return f'{self.post.title} - {self.author.name}'
+    
+    def build_path(self):
+        segment = str(self.pk).zfill(self.PATH_SEGMENT_LENGTH)
+        return f'{self.parent.path}/{segment}' if self.parent_id else segment
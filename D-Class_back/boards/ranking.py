@@ -0,0 +1,60 @@
+import math
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.cache import cache
+from django.utils import timezone
+
+
+# 점수 기준 시각 (작성 시각의 초 단위 차이를 점수로 사용)
+HOT_EPOCH = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+# 이 시간(초)만큼 늦게 작성된 글은 반응이 10배 적어도 같은 점수 (12.5시간)
+HOT_DECAY_SECONDS = 45000
+# 댓글 1개를 조회수 몇 회로 볼지
+COMMENT_WEIGHT = 5
+# 재계산 대상 기간 - 이보다 오래된 글은 반응이 늘어도 순위에 영향이 없음
+HOT_WINDOW = timedelta(days=14)
+# 재계산 주기 (초)
+HOT_REFRESH_INTERVAL = 300
+HOT_LOCK_KEY = 'boards:hot_score:refresh_lock'
+HOT_REFRESHED_KEY = 'boards:hot_score:refreshed_at'
+BATCH_SIZE = 1000
+
+
+def compute_hot_score(views, comments_count, created_at):
+    """
+    시간 감쇠 인기 점수 = log10(조회수 + 댓글 수 × 가중치) + (작성 시각 - 기준 시각) / 감쇠 시간
+    최신성을 작성 시각으로 반영하므로 시간이 지나도 기존 점수를 낮출 필요 없이 새 글이 위로 올라감
+    """
+    engagement = max(views + comments_count * COMMENT_WEIGHT, 1)
+    return round(math.log10(engagement) + (created_at - HOT_EPOCH).total_seconds() / HOT_DECAY_SECONDS, 6)
+
+
+def refresh_hot_scores(window=HOT_WINDOW):
+    """최근 게시글의 인기 점수 재계산 (값이 바뀐 글만 bulk_update) - 갱신한 게시글 수 반환"""
+    from .models import Post
+
+    changed = []
+    rows = Post.objects.filter(
+        created_at__gte=timezone.now() - window
+    ).only('id', 'views', 'comments_count', 'created_at', 'hot_score')
+    for post in rows.iterator(chunk_size=BATCH_SIZE):
+        score = compute_hot_score(post.views, post.comments_count, post.created_at)
+        if score != post.hot_score:
+            post.hot_score = score
+            changed.append(post)
+    Post.objects.bulk_update(changed, ['hot_score'], batch_size=BATCH_SIZE)
+    cache.set(HOT_REFRESHED_KEY, timezone.now(), timeout=None)
+    return len(changed)
+
+
+def refresh_hot_scores_if_stale():
+    """갱신 주기가 지났으면 재계산 (여러 워커 중 한 곳에서만 실행)"""
+    refreshed_at = cache.get(HOT_REFRESHED_KEY)
+    if refreshed_at and timezone.now() - refreshed_at < timedelta(seconds=HOT_REFRESH_INTERVAL):
+        return
+    if not cache.add(HOT_LOCK_KEY, 1, timeout=HOT_REFRESH_INTERVAL):
+        return
+    try:
+        refresh_hot_scores()
+    finally:
+        cache.delete(HOT_LOCK_KEY)
@@ -0,0 +1,70 @@
+import time
+from collections import namedtuple
+
+from common.cache import bump_cache_version, get_cache_version
+
+
+CACHE_NAMESPACE = 'boards:registry'
+# 다른 워커의 변경 여부(캐시 버전)를 확인하는 주기 (초)
+SYNC_INTERVAL = 5
+DEFAULT_BOARD_NAME = '발레 작품 이야기'
+DEFAULT_BOARD_DESCRIPTION = '발레 작품 해설을 공유하는 게시판입니다'
+
+# 구성 후 변경하지 않는 게시판 목록 (boards: 이름순 tuple, by_name/by_id: 조회용 dict)
+BoardSnapshot = namedtuple('BoardSnapshot', ['version', 'boards', 'by_name', 'by_id'])
+
+
+class BoardRegistry:
+    """
+    프로세스별 게시판 목록 (이름 -> ID, 설명, 활성 여부)
+    최초 조회 시 쿼리 1회로 구성하고, 게시판 저장/삭제 시 캐시 버전 변경으로 전체 워커에서 다시 구성
+    다시 구성할 때는 새 스냅샷을 만들어 참조만 교체하므로, 조회 중인 스레드는 기존 스냅샷을 그대로 사용
+    (게시글 수는 게시글 작성/삭제마다 바뀌므로 포함하지 않음 - Board.posts_count 사용)
+    """
+
+    def __init__(self):
+        self.current = None
+        self.checked_at = 0
+
+    def snapshot(self):
+        """현재 게시판 목록 (호출한 곳에서는 지역 변수로 받아 사용)"""
+        current = self.current
+        now = time.monotonic()
+        if current is not None and now - self.checked_at < SYNC_INTERVAL:
+            return current
+        self.checked_at = now
+        version = get_cache_version(CACHE_NAMESPACE)
+        if current is None or version != current.version:
+            current = self.load(version)
+        return current
+
+    def load(self, version):
+        from .models import Board
+
+        fields = ['id', 'name', 'description', 'is_active']
+        boards = tuple(Board.objects.order_by('name').values(*fields))
+        snapshot = BoardSnapshot(
+            version=version,
+            boards=boards,
+            by_name={board['name']: board for board in boards},
+            by_id={board['id']: board for board in boards},
+        )
+        self.current = snapshot
+        return snapshot
+
+    def get_id(self, name):
+        """활성 게시판 ID (없거나 비활성이면 None)"""
+        board = self.snapshot().by_name.get(name)
+        return board['id'] if board and board['is_active'] else None
+
+    def active_boards(self):
+        """활성 게시판 목록 (이름순, 게시글 수 제외)"""
+        return [board for board in self.snapshot().boards if board['is_active']]
+
+    def invalidate(self):
+        """현재 워커는 다음 조회 시 바로 버전 확인 후 다시 구성, 다른 워커는 버전 확인 주기에 다시 구성"""
+        bump_cache_version(CACHE_NAMESPACE)
+        self.checked_at = 0
+
+
+board_registry = BoardRegistry()
@@ -1,66 +1,109 @@
 from rest_framework import serializers
-from .models import Board, Post, PostImage
+from common.images import image_variant_urls, media_url
+from .models import Board, Comment, Post, PostImage
+from .registry import DEFAULT_BOARD_DESCRIPTION, DEFAULT_BOARD_NAME, board_registry
 from users.models import User
 
 
 class PostImageSerializer(serializers.ModelSerializer):
     """게시글 이미지 시리얼라이저"""
+    image_variants = serializers.SerializerMethodField()
     
     class Meta:
         model = PostImage
-        fields = ['id', 'image', 'order']
+        fields = ['id', 'image', 'image_variants', 'order']
         read_only_fields = ['id']
+    
+    def get_image_variants(self, obj):
+        return image_variant_urls(obj.image.name, obj.image_variants, self.context.get('request'))
+
+
+def set_author_image(instance):
+    """목록 조회 시 본 쿼리에서 함께 조회한 작성자 이미지 정보를 작성자에 전달 (프로필 조회 없음)"""
+    if hasattr(instance, 'author_image_path'):
+        instance.author.profile_image_path = instance.author_image_path
+        instance.author.profile_image_variants = instance.author_image_variants
 
 
 class AuthorSerializer(serializers.ModelSerializer):
     """작성자 정보 시리얼라이저"""
     profile_image = serializers.SerializerMethodField()
+    profile_image_variants = serializers.SerializerMethodField()
     
     class Meta:
         model = User
-        fields = ['id', 'name', 'profile_image', 'is_verified']
+        fields = ['id', 'name', 'profile_image', 'profile_image_variants', 'is_verified']
     
-    def get_profile_image(self, obj):
+    def get_image(self, obj):
+        """(이미지 이름, 변환본 정보) - 강사 프로필 이미지 우선, 없으면 학원 이미지"""
+        if hasattr(obj, 'profile_image_path'):
+            return obj.profile_image_path, obj.profile_image_variants
         if hasattr(obj, 'instructor_profile') and obj.instructor_profile.profile_image:
-            return obj.instructor_profile.profile_image.url
+            profile = obj.instructor_profile
+            return profile.profile_image.name, profile.profile_image_variants
         elif hasattr(obj, 'academy_profile') and obj.academy_profile.academy_image:
-            return obj.academy_profile.academy_image.url
-        return None
+            profile = obj.academy_profile
+            return profile.academy_image.name, profile.academy_image_variants
+        return None, None
+    
+    def get_profile_image(self, obj):
+        name, _ = self.get_image(obj)
+        return media_url(name, self.context.get('request'))
+    
+    def get_profile_image_variants(self, obj):
+        return image_variant_urls(*self.get_image(obj), self.context.get('request'))
 
 
 class PostListSerializer(serializers.ModelSerializer):
     """게시글 목록 시리얼라이저"""
     author = AuthorSerializer(read_only=True)
     thumbnail = serializers.SerializerMethodField()
+    thumbnail_srcset = serializers.SerializerMethodField()
     images_count = serializers.SerializerMethodField()
-    comments_count = serializers.SerializerMethodField()
     
     class Meta:
         model = Post
         fields = [
-            'id', 'title', 'author', 'thumbnail', 'views',
+            'id', 'title', 'author', 'thumbnail', 'thumbnail_srcset', 'views',
             'images_count', 'comments_count', 'created_at'
         ]
     
-    def get_thumbnail(self, obj):
+    def to_representation(self, instance):
+        set_author_image(instance)
+        return super().to_representation(instance)
+    
+    def get_first_image(self, obj):
+        """(첫 이미지 이름, 변환본 정보)"""
+        if hasattr(obj, 'thumbnail_path'):
+            return obj.thumbnail_path, obj.thumbnail_variants
         first_image = obj.images.first()
         if first_image:
-            return first_image.image.url
-        return None
+            return first_image.image.name, first_image.image_variants
+        return None, None
+    
+    def get_thumbnail(self, obj):
+        """썸네일 변환본 (변환 전이면 원본)"""
+        name, variants = self.get_first_image(obj)
+        urls = image_variant_urls(name, variants, self.context.get('request'))
+        if urls is not None:
+            return urls['thumbnail']
+        return media_url(name, self.context.get('request'))
+    
+    def get_thumbnail_srcset(self, obj):
+        urls = image_variant_urls(*self.get_first_image(obj), self.context.get('request'))
+        return urls['srcset'] if urls is not None else None
     
     def get_images_count(self, obj):
+        if hasattr(obj, 'images_total'):
+            return obj.images_total
         return obj.images.count()
     
-    def get_comments_count(self, obj):
-        # 추후 댓글 기능 구현 시 사용
-        return 0
 
 
 class PostDetailSerializer(serializers.ModelSerializer):
     """게시글 상세 시리얼라이저"""
     author = AuthorSerializer(read_only=True)
     images = PostImageSerializer(many=True, read_only=True)
-    comments_count = serializers.SerializerMethodField()
     is_author = serializers.SerializerMethodField()
     
     class Meta:
@@ -70,11 +113,7 @@ class PostDetailSerializer(serializers.ModelSerializer):
             'views', 'comments_count', 'is_author',
             'created_at', 'updated_at'
         ]
-        read_only_fields = ['views', 'created_at', 'updated_at']
-    
-    def get_comments_count(self, obj):
-        # 추후 댓글 기능 구현 시 사용
-        return 0
+        read_only_fields = ['views', 'comments_count', 'created_at', 'updated_at']
     
     def get_is_author(self, obj):
         request = self.context.get('request')
@@ -112,11 +151,15 @@ class PostCreateSerializer(serializers.ModelSerializer):
         
         # 기본 게시판 설정 (발레 작품 이야기)
         if 'board' not in validated_data or not validated_data.get('board'):
-            board, _ = Board.objects.get_or_create(
-                name='발레 작품 이야기',
-                defaults={'description': '발레 작품 해설을 공유하는 게시판입니다'}
-            )
-            validated_data['board'] = board
+            validated_data.pop('board', None)
+            board_id = board_registry.get_id(DEFAULT_BOARD_NAME)
+            if board_id is None:
+                board, _ = Board.objects.get_or_create(
+                    name=DEFAULT_BOARD_NAME,
+                    defaults={'description': DEFAULT_BOARD_DESCRIPTION}
+                )
+                board_id = board.pk
+            validated_data['board_id'] = board_id
         
         post = super().create(validated_data)
         
@@ -183,14 +226,59 @@ class PostUpdateSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
+class CommentSerializer(serializers.ModelSerializer):
+    """댓글 시리얼라이저 (목록은 스레드 순서, depth로 들여쓰기)"""
+    author = AuthorSerializer(read_only=True)
+    parent = serializers.PrimaryKeyRelatedField(
+        queryset=Comment.objects.all(),
+        required=False,
+        allow_null=True
+    )
+    is_author = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = Comment
+        fields = [
+            'id', 'parent', 'depth', 'author', 'content',
+            'is_deleted', 'is_author', 'created_at', 'updated_at'
+        ]
+        read_only_fields = ['id', 'depth', 'is_deleted', 'created_at', 'updated_at']
+    
+    def to_representation(self, instance):
+        set_author_image(instance)
+        return super().to_representation(instance)
+    
+    def get_is_author(self, obj):
+        request = self.context.get('request')
+        if request and request.user.is_authenticated:
+            return obj.author_id == request.user.pk
+        return False
+    
+    def validate_content(self, value):
+        if len(value.strip()) == 0:
+            raise serializers.ValidationError('내용을 입력해주세요')
+        return value.strip()
+    
+    def validate_parent(self, value):
+        if value is None:
+            return value
+        if self.instance is not None and value.pk != self.instance.parent_id:
+            raise serializers.ValidationError('상위 댓글은 변경할 수 없습니다')
+        post = self.context.get('post')
+        if post is not None and value.post_id != post.pk:
+            raise serializers.ValidationError('같은 게시글의 댓글에만 답글을 작성할 수 있습니다')
+        if value.is_deleted:
+            raise serializers.ValidationError('삭제된 댓글에는 답글을 작성할 수 없습니다')
+        if value.depth + 1 >= Comment.MAX_DEPTH:
+            raise serializers.ValidationError('더 이상 답글을 작성할 수 없습니다')
+        return value
+
+
 class BoardSerializer(serializers.ModelSerializer):
     """게시판 시리얼라이저"""
-    posts_count = serializers.SerializerMethodField()
     
     class Meta:
         model = Board
         fields = ['id', 'name', 'description', 'posts_count', 'is_active']
-    
-    def get_posts_count(self, obj):
-        return obj.posts.count()
+        read_only_fields = ['posts_count']
 
@@ -0,0 +1,23 @@
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Board, Post
+from .registry import board_registry
+
+
+@receiver([post_save, post_delete], sender=Board)
+def invalidate_board_registry(sender, **kwargs):
+    """게시판 추가/수정/삭제 시 게시판 목록 다시 구성 (커밋 이후)"""
+    transaction.on_commit(board_registry.invalidate)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def update_board_posts_count(sender, instance, signal, created=False, **kwargs):
+    """게시글 작성/삭제 시 게시판 게시글 수 갱신 (같은 트랜잭션, 게시판 목록은 다시 구성하지 않음)"""
+    if signal is post_save and not created:
+        return
+    delta = 1 if signal is post_save else -1
+    Board.objects.filter(pk=instance.board_id).update(posts_count=F('posts_count') + delta)
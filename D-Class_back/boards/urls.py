@@ -3,7 +3,9 @@ from rest_framework.routers import DefaultRouter
 from .views import (
     BoardViewSet,
     PostViewSet,
-    BoardPostListView
+    BoardPostListView,
+    PostCommentListCreateView,
+    CommentDetailView
 )
 
 app_name = 'boards'
@@ -14,6 +16,8 @@ router.register(r'posts', PostViewSet, basename='post')
 
 urlpatterns = [
     path('boards/<str:board_name>/posts/', BoardPostListView.as_view(), name='board-posts'),
+    path('posts/<int:post_id>/comments/', PostCommentListCreateView.as_view(), name='post-comments'),
+    path('comments/<int:pk>/', CommentDetailView.as_view(), name='comment-detail'),
     path('', include(router.urls)),
 ]
 
@@ -0,0 +1,122 @@
+import atexit
+import logging
+import os
+import threading
+from collections import Counter, defaultdict
+
+from django.core.cache import cache
+from django.db import close_old_connections
+from django.db.models import F
+
+from .ranking import refresh_hot_scores_if_stale
+
+
+logger = logging.getLogger(__name__)
+
+# 버퍼를 DB에 반영하는 주기 (초)
+FLUSH_INTERVAL = 10
+# 버퍼의 게시글 수가 이 개수를 넘으면 주기와 관계없이 반영
+MAX_BUFFER_SIZE = 1000
+# 같은 사용자(비로그인은 IP)의 같은 게시글 조회는 이 시간 동안 한 번만 집계 (초)
+VIEW_DEDUP_WINDOW = 60 * 30
+
+
+class PostViewCounter:
+    """
+    게시글 조회수 프로세스 버퍼 (write-behind)
+    요청에서는 메모리 Counter만 증가시키고, 백그라운드 스레드가 주기적으로
+    증가량이 같은 게시글끼리 묶어 UPDATE ... SET views = views + n 으로 반영 (인기 점수 재계산도 함께)
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = Counter()
+        self.wake = threading.Event()
+        self.thread = None
+        self.pid = None
+
+    def record(self, post_id, viewer=None):
+        """조회 1회 집계 - 중복 조회로 집계하지 않으면 False"""
+        if viewer is not None and not cache.add(f'boards:viewed:{post_id}:{viewer}', 1, VIEW_DEDUP_WINDOW):
+            return False
+        self.ensure_worker()
+        with self.lock:
+            self.counts[post_id] += 1
+            size = len(self.counts)
+        if size >= MAX_BUFFER_SIZE:
+            self.wake.set()
+        return True
+
+    def pending(self, post_id):
+        """아직 DB에 반영되지 않은 이 프로세스의 조회수"""
+        with self.lock:
+            return self.counts.get(post_id, 0)
+
+    def drain(self):
+        with self.lock:
+            counts, self.counts = self.counts, Counter()
+        return counts
+
+    def flush(self):
+        """버퍼 내용을 증가량별 UPDATE 1회로 반영 (삭제된 게시글은 무시됨)"""
+        from .models import Post
+
+        counts = self.drain()
+        if not counts:
+            return 0
+        by_delta = defaultdict(list)
+        for post_id, delta in counts.items():
+            by_delta[delta].append(post_id)
+        while by_delta:
+            delta, post_ids = by_delta.popitem()
+            try:
+                # updated_at(auto_now)은 update()에서 갱신되지 않으므로 조회수 변경이 수정일에 영향 없음
+                Post.objects.filter(pk__in=post_ids).update(views=F('views') + delta)
+            except Exception:
+                # 반영하지 못한 증가량만 버퍼에 되돌려 다음 주기에 다시 시도 (버퍼가 과도하게 커지면 버림)
+                by_delta[delta] = post_ids
+                with self.lock:
+                    if len(self.counts) <= MAX_BUFFER_SIZE * 10:
+                        for failed_delta, failed_ids in by_delta.items():
+                            self.counts.update({post_id: failed_delta for post_id in failed_ids})
+                raise
+        return len(counts)
+
+    def ensure_worker(self):
+        """현재 프로세스의 반영 스레드 시작 (gunicorn fork 이후 워커별로 시작)"""
+        if self.pid == os.getpid() and self.thread is not None:
+            return
+        with self.lock:
+            if self.pid == os.getpid() and self.thread is not None:
+                return
+            if self.pid is not None:
+                # fork 이전 부모 프로세스의 버퍼는 부모가 반영
+                self.counts = Counter()
+            else:
+                atexit.register(self.shutdown)
+            self.pid = os.getpid()
+            self.thread = threading.Thread(target=self.run, name='post-view-flush', daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while True:
+            self.wake.wait(FLUSH_INTERVAL)
+            self.wake.clear()
+            try:
+                self.flush()
+                refresh_hot_scores_if_stale()
+            except Exception:
+                logger.exception('게시글 조회수 반영 실패')
+            finally:
+                close_old_connections()
+
+    def shutdown(self):
+        if self.pid != os.getpid():
+            return
+        try:
+            self.flush()
+        except Exception:
+            logger.exception('게시글 조회수 반영 실패')
+
+
+post_view_counter = PostViewCounter()
@@ -1,26 +1,89 @@
 from rest_framework import viewsets, generics, status
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly, AllowAny
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied, NotFound
 from rest_framework.decorators import action
+from rest_framework.throttling import BaseThrottle
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q, Count
+from django.db.models import Case, CharField, Count, F, IntegerField, JSONField, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, NullIf
 from django.utils import timezone
-from .models import Board, Post, PostImage
+from common.pagination import CursorOrPageNumberPagination, KeysetCursorPagination
+from .comments import create_comment, delete_comment
+from .registry import DEFAULT_BOARD_NAME, board_registry
+from .models import Board, Comment, Post, PostImage
+from .view_counter import post_view_counter
 from .serializers import (
     BoardSerializer,
     PostListSerializer,
     PostDetailSerializer,
     PostCreateSerializer,
-    PostUpdateSerializer
+    PostUpdateSerializer,
+    CommentSerializer
 )
 
 
+def author_image_path():
+    """작성자 프로필 이미지 경로 - 강사 프로필 이미지 우선, 없으면 학원 이미지 (빈 문자열은 이미지 없음)"""
+    return Coalesce(
+        NullIf('author__instructor_profile__profile_image', Value(''), output_field=CharField()),
+        NullIf('author__academy_profile__academy_image', Value(''), output_field=CharField()),
+    )
+
+
+def author_image_variants():
+    """author_image_path에 해당하는 이미지의 WebP 변환본 정보"""
+    return Case(
+        When(
+            author__instructor_profile__profile_image__gt='',
+            then=F('author__instructor_profile__profile_image_variants')
+        ),
+        default=F('author__academy_profile__academy_image_variants'),
+        output_field=JSONField(),
+    )
+
+
+def annotate_post_list(queryset):
+    """
+    목록용 조회 - 썸네일 경로, 이미지 수, 작성자 프로필 이미지 경로를 본 쿼리에서 함께 조회
+    (게시글 수와 관계없이 쿼리 수 고정, 목록에 없는 본문은 제외)
+    """
+    images = PostImage.objects.filter(post=OuterRef('pk'))
+    first_image = images.order_by('order', 'created_at')
+    images_count = images.order_by().values('post').annotate(count=Count('id')).values('count')
+    return queryset.select_related('author').defer('content').annotate(
+        thumbnail_path=Subquery(first_image.values('image')[:1], output_field=CharField()),
+        thumbnail_variants=Subquery(first_image.values('image_variants')[:1], output_field=JSONField()),
+        images_total=Coalesce(Subquery(images_count, output_field=IntegerField()), Value(0)),
+        author_image_path=author_image_path(),
+        author_image_variants=author_image_variants(),
+    )
+
+
+def sort_posts(queryset, request):
+    """?sort=hot: 미리 계산된 인기 점수순 ((board, -hot_score) 인덱스), 그 외: 최신순"""
+    if request.query_params.get('sort') == 'hot':
+        return queryset.order_by('-hot_score', '-id')
+    return queryset.order_by('-created_at')
+
+
 class BoardViewSet(viewsets.ReadOnlyModelViewSet):
     """게시판 관리 ViewSet (읽기 전용)"""
     queryset = Board.objects.filter(is_active=True)
     permission_classes = [AllowAny]
     serializer_class = BoardSerializer
+    
+    def list(self, request, *args, **kwargs):
+        """게시판 목록 (프로세스 게시판 목록 + 게시판 행의 게시글 수 - COUNT 집계 없음)"""
+        boards = board_registry.active_boards()
+        counts = dict(Board.objects.filter(
+            pk__in=[board['id'] for board in boards]
+        ).values_list('id', 'posts_count'))
+        boards = [{**board, 'posts_count': counts.get(board['id'], 0)} for board in boards]
+        page = self.paginate_queryset(boards)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(boards)
 
 
 class PostViewSet(viewsets.ModelViewSet):
@@ -28,24 +91,23 @@ class PostViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['board']
+    pagination_class = CursorOrPageNumberPagination
+    cursor_ordering_fields = ['created_at', 'hot_score']
     
     def get_queryset(self):
-        queryset = Post.objects.select_related(
-            'author', 'board'
-        ).prefetch_related(
-            'images', 'author__instructor_profile', 'author__academy_profile'
-        )
+        if self.action == 'list':
+            queryset = sort_posts(annotate_post_list(Post.objects.all()), self.request)
+        else:
+            queryset = Post.objects.select_related(
+                'author', 'board'
+            ).prefetch_related(
+                'images', 'author__instructor_profile', 'author__academy_profile'
+            )
         
         # 기본 게시판 필터링 (발레 작품 이야기)
-        board_name = self.request.query_params.get('board_name', '발레 작품 이야기')
-        try:
-            board = Board.objects.get(name=board_name, is_active=True)
-            queryset = queryset.filter(board=board)
-        except Board.DoesNotExist:
-            pass
-        
-        # comments_count는 추후 댓글 기능 구현 시 추가
-        # .annotate(comments_count=Count('comments', distinct=True))
+        board_id = board_registry.get_id(self.request.query_params.get('board_name', DEFAULT_BOARD_NAME))
+        if board_id is not None:
+            queryset = queryset.filter(board_id=board_id)
         
         return queryset
     
@@ -79,11 +141,20 @@ class PostViewSet(viewsets.ModelViewSet):
     
     @action(detail=True, methods=['post'], permission_classes=[AllowAny])
     def increment_views(self, request, pk=None):
-        """조회수 증가"""
-        post = self.get_object()
-        post.views += 1
-        post.save(update_fields=['views'])
-        return Response({'views': post.views}, status=status.HTTP_200_OK)
+        """조회수 증가 (버퍼에 집계 후 주기적으로 반영 - 요청 중 DB 쓰기 없음)"""
+        views = None
+        if pk.isdigit():
+            post_id = int(pk)
+            views = Post.objects.filter(pk=post_id).values_list('views', flat=True).first()
+        if views is None:
+            raise NotFound('게시글을 찾을 수 없습니다')
+        # 로그인 사용자는 사용자 ID, 비로그인은 IP(NUM_PROXIES 설정 반영) 기준으로 중복 조회 제외
+        if request.user.is_authenticated:
+            viewer = f'user:{request.user.pk}'
+        else:
+            viewer = f'ip:{BaseThrottle().get_ident(request)}'
+        post_view_counter.record(post_id, viewer)
+        return Response({'views': views + post_view_counter.pending(post_id)}, status=status.HTTP_200_OK)
 
 
 class BoardPostListView(generics.ListAPIView):
@@ -91,18 +162,80 @@ class BoardPostListView(generics.ListAPIView):
     permission_classes = [AllowAny]
     serializer_class = PostListSerializer
     filter_backends = [DjangoFilterBackend]
+    pagination_class = CursorOrPageNumberPagination
+    cursor_ordering_fields = ['created_at', 'hot_score']
     
     def get_queryset(self):
-        board_name = self.kwargs.get('board_name', '발레 작품 이야기')
-        try:
-            board = Board.objects.get(name=board_name, is_active=True)
-        except Board.DoesNotExist:
+        board_id = board_registry.get_id(self.kwargs.get('board_name', DEFAULT_BOARD_NAME))
+        if board_id is None:
             return Post.objects.none()
         
-        return Post.objects.filter(
-            board=board
-        ).select_related(
-            'author', 'board'
-        ).prefetch_related(
-            'images', 'author__instructor_profile', 'author__academy_profile'
-        ).order_by('-created_at')
+        return sort_posts(annotate_post_list(Post.objects.filter(board_id=board_id)), self.request)
+
+
+class PostCommentListCreateView(generics.ListCreateAPIView):
+    """
+    게시글 댓글 목록 조회/작성
+    목록은 경로(path) 순 커서 페이지네이션 - 답글이 상위 댓글 바로 뒤에 오는 스레드 순서
+    """
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    serializer_class = CommentSerializer
+    pagination_class = KeysetCursorPagination
+    cursor_ordering_fields = ['path']
+    
+    def get_post(self):
+        if not hasattr(self, '_post'):
+            self._post = Post.objects.filter(pk=self.kwargs['post_id']).only('id').first()
+            if self._post is None:
+                raise NotFound('게시글을 찾을 수 없습니다')
+        return self._post
+    
+    def get_queryset(self):
+        return Comment.objects.filter(
+            post=self.get_post()
+        ).select_related('author').annotate(
+            author_image_path=author_image_path(),
+            author_image_variants=author_image_variants()
+        ).order_by('path')
+    
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.request.method == 'POST':
+            context['post'] = self.get_post()
+        return context
+    
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        comment = create_comment(
+            self.get_post(),
+            request.user,
+            serializer.validated_data['content'],
+            serializer.validated_data.get('parent')
+        )
+        return Response(self.get_serializer(comment).data, status=status.HTTP_201_CREATED)
+
+
+class CommentDetailView(generics.RetrieveUpdateDestroyAPIView):
+    """댓글 조회/수정/삭제 (수정/삭제는 작성자만)"""
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    serializer_class = CommentSerializer
+    http_method_names = ['get', 'patch', 'delete', 'head', 'options']
+    
+    def get_queryset(self):
+        return Comment.objects.select_related('author').annotate(
+            author_image_path=author_image_path(),
+            author_image_variants=author_image_variants()
+        )
+    
+    def perform_update(self, serializer):
+        if serializer.instance.author != self.request.user:
+            raise PermissionDenied('본인이 작성한 댓글만 수정할 수 있습니다')
+        if serializer.instance.is_deleted:
+            raise NotFound('삭제된 댓글입니다')
+        serializer.save()
+    
+    def perform_destroy(self, instance):
+        if instance.author != self.request.user:
+            raise PermissionDenied('본인이 작성한 댓글만 삭제할 수 있습니다')
+        delete_comment(instance)
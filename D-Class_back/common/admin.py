@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Term, FAQCategory, FAQ, Inquiry
+from .models import Term, FAQCategory, FAQ, Inquiry, SearchLog, OutboxEvent
 
 
 @admin.register(Term)
@@ -32,3 +32,24 @@ class InquiryAdmin(admin.ModelAdmin):
     search_fields = ['user__name', 'title', 'content']
     list_filter = ['category', 'status', 'created_at']
     readonly_fields = ['created_at', 'updated_at', 'answered_at']
+
+
+@admin.register(SearchLog)
+class SearchLogAdmin(admin.ModelAdmin):
+    list_display = ['keyword', 'source', 'count', 'created_at']
+    list_filter = ['source', 'created_at']
+    search_fields = ['keyword']
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    list_display = ['id', 'topic', 'status', 'attempts', 'available_at', 'created_at']
+    list_filter = ['topic', 'status']
+    readonly_fields = ['topic', 'payload', 'attempts', 'last_error', 'created_at']
+    actions = ['retry_events']
+    
+    @admin.action(description='선택한 작업 다시 시도')
+    def retry_events(self, request, queryset):
+        from django.utils import timezone
+        updated = queryset.update(status='pending', attempts=0, available_at=timezone.now())
+        self.message_user(request, f'{updated}개 작업을 다시 대기 상태로 변경했습니다.')
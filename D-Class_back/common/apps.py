@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class CommonConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'common'
+
+    def ready(self):
+        # 아웃박스 이메일 발송/이미지 변환 작업 등록
+        from . import mail  # noqa: F401
+        from .images import connect_image_signals
+        connect_image_signals()
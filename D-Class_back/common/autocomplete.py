@@ -0,0 +1,322 @@
+import heapq
+import logging
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .cache import bump_cache_version, get_cache_version
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_NAMESPACE = 'search_autocomplete'
+MIN_QUERY_LENGTH = 2
+MAX_SUGGESTIONS = 10
+# 갱신 스레드가 다른 워커의 변경(캐시 버전)을 확인하는 주기 (초)
+SYNC_INTERVAL = 10
+# 지원 수 등 signals로 잡히지 않는 인기도 변화를 반영하기 위한 전체 재구성 주기 (초)
+REBUILD_INTERVAL = 600
+# 증분 동기화 시 updated_at 비교 여유 (초)
+SYNC_SKEW = 2
+# 검색어별 결과 메모 최대 개수 (인덱스가 바뀌면 비움)
+MAX_MEMO_SIZE = 10000
+# 삭제 기록(SyncTombstone) 구분값 -> 인덱스 출처 종류
+POSTING_TOMBSTONE = 'job_posting'
+ACADEMY_TOMBSTONE = 'academy_profile'
+TOMBSTONE_SOURCES = {POSTING_TOMBSTONE: 'posting', ACADEMY_TOMBSTONE: 'academy'}
+
+# 같은 인기도일 때 노출 우선순위
+KIND_PRIORITY = {'region': 0, 'district': 1, 'academy': 2, 'posting': 3}
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSUNG = [
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+]
+CHOSUNG_SET = set(CHOSUNG)
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize(text):
+    """소문자 변환 + 공백 제거 ('발레 강사'와 '발레강사'를 같은 검색어로 취급)"""
+    return WHITESPACE_RE.sub('', (text or '').lower())
+
+
+def to_chosung(text):
+    """한글 음절을 초성으로 변환 (예: '발레강사' -> 'ㅂㄹㄱㅅ'), 그 외 문자는 그대로"""
+    chars = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            chars.append(CHOSUNG[(code - HANGUL_BASE) // 588])
+        else:
+            chars.append(char)
+    return ''.join(chars)
+
+
+def is_chosung_query(query):
+    return all(char in CHOSUNG_SET for char in query)
+
+
+def bigrams(text):
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class Term:
+    """자동완성 후보 (같은 문구는 여러 공고/학원이 공유하며 인기도는 합산)"""
+    __slots__ = ('text', 'kind', 'normalized', 'chosung', 'weight')
+
+    def __init__(self, text, kind):
+        self.text = text
+        self.kind = kind
+        self.normalized = normalize(text)
+        self.chosung = to_chosung(self.normalized)
+        self.weight = 0
+
+
+class AutocompleteIndex:
+    """
+    프로세스 메모리 내 n-gram(bigram) 자동완성 인덱스
+    검색어의 bigram 후보 집합 교집합 -> 포함 여부 확인 -> (접두어 일치, 인기도) 순 정렬
+    초성 검색어(예: 'ㅂㄹ')는 초성 문자열의 bigram 인덱스를 사용
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.reset()
+
+    def reset(self):
+        self.terms = {}
+        # 출처(공고/학원 프로필)별 기여 항목: source -> [(term_key, weight), ...]
+        self.sources = {}
+        self.grams = defaultdict(set)
+        self.chosung_grams = defaultdict(set)
+        # 같은 키 입력이 반복되므로 검색어별 결과를 메모 (인덱스 변경 시 비움)
+        self.memo = {}
+
+    def set_source(self, source, entries):
+        """출처의 후보 목록 교체 (기존 기여분 제거 후 새 항목 반영)"""
+        with self.lock:
+            self.remove_source(source)
+            self.memo.clear()
+            contributions = []
+            for text, kind, weight in entries:
+                text = (text or '').strip()
+                if len(normalize(text)) < MIN_QUERY_LENGTH:
+                    continue
+                key = (kind, normalize(text))
+                term = self.terms.get(key)
+                if term is None:
+                    term = self.terms[key] = Term(text, kind)
+                    for gram in bigrams(term.normalized):
+                        self.grams[gram].add(key)
+                    for gram in bigrams(term.chosung):
+                        self.chosung_grams[gram].add(key)
+                term.weight += weight
+                contributions.append((key, weight))
+            if contributions:
+                self.sources[source] = contributions
+
+    def remove_source(self, source):
+        with self.lock:
+            contributions = self.sources.pop(source, [])
+            if contributions:
+                self.memo.clear()
+            for key, weight in contributions:
+                term = self.terms.get(key)
+                if term is None:
+                    continue
+                term.weight -= weight
+                if term.weight <= 0:
+                    self._drop_term(key, term)
+
+    def _drop_term(self, key, term):
+        del self.terms[key]
+        for grams, text in ((self.grams, term.normalized), (self.chosung_grams, term.chosung)):
+            for gram in bigrams(text):
+                keys = grams.get(gram)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del grams[gram]
+
+    def suggest(self, query, limit=MAX_SUGGESTIONS):
+        query = normalize(query)
+        if len(query) < MIN_QUERY_LENGTH:
+            return []
+        memo_key = (query, limit)
+        with self.lock:
+            suggestions = self.memo.get(memo_key)
+            if suggestions is None:
+                suggestions = self._search(query, limit)
+                if len(self.memo) >= MAX_MEMO_SIZE:
+                    self.memo.clear()
+                self.memo[memo_key] = suggestions
+        return list(suggestions)
+
+    def _search(self, query, limit):
+        chosung = is_chosung_query(query)
+        grams = self.chosung_grams if chosung else self.grams
+
+        candidates = None
+        for gram in sorted(bigrams(query), key=lambda g: len(grams.get(g, ()))):
+            keys = grams.get(gram)
+            if not keys:
+                return []
+            candidates = keys if candidates is None else candidates & keys
+            if not candidates:
+                return []
+
+        matches = []
+        for key in candidates:
+            term = self.terms.get(key)
+            if term is None:
+                continue
+            target = term.chosung if chosung else term.normalized
+            position = target.find(query)
+            if position < 0:
+                continue
+            matches.append(((position == 0, term.weight, -KIND_PRIORITY[term.kind]), term.text))
+
+        suggestions = []
+        for _, text in heapq.nlargest(limit * 2, matches, key=lambda match: match[0]):
+            # 종류가 다른 같은 문구(예: 학원명 = 공고 제목)는 한 번만 노출
+            if text not in suggestions:
+                suggestions.append(text)
+            if len(suggestions) == limit:
+                break
+        return suggestions
+
+
+def posting_entries(posting):
+    """활성 공고가 기여하는 후보: 제목(지원 수 가중), 지역, 시/구, 학원명"""
+    if posting.status != 'active':
+        return []
+    entries = [
+        (posting.title, 'posting', 1 + posting.application_count),
+        (posting.get_region_display(), 'region', 1),
+        (posting.district, 'district', 1),
+    ]
+    academy = posting.academy
+    if hasattr(academy, 'academy_profile'):
+        entries.append((academy.academy_profile.academy_name, 'academy', 1))
+    return entries
+
+
+def profile_entries(profile):
+    return [(profile.academy_name, 'academy', 1)]
+
+
+def index_postings(index, queryset):
+    for posting in queryset.select_related('academy', 'academy__academy_profile').defer('search_vector'):
+        index.set_source(('posting', posting.pk), posting_entries(posting))
+
+
+def index_profiles(index, queryset):
+    for profile in queryset:
+        index.set_source(('academy', profile.user_id), profile_entries(profile))
+
+
+class AutocompleteService:
+    """
+    프로세스별 인덱스 관리
+    요청에서는 인덱스만 조회하고, 백그라운드 스레드가 최초 구성/주기적 재구성/변경분 반영을 담당 (요청 경로에서 DB 미사용)
+    """
+
+    def __init__(self):
+        self.index = AutocompleteIndex()
+        self.built_at = None
+        self.synced_at = None
+        self.version = None
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.thread = None
+        self.pid = None
+
+    def suggest(self, query, limit=MAX_SUGGESTIONS):
+        """인덱스 조회 (워커 시작 직후 최초 구성이 끝나기 전에는 빈 목록)"""
+        self.ensure_worker()
+        return self.index.suggest(query, limit)
+
+    def ensure_worker(self):
+        """현재 프로세스의 갱신 스레드 시작 (gunicorn fork 이후 워커별로 시작)"""
+        if self.pid == os.getpid() and self.thread is not None:
+            return
+        with self.lock:
+            if self.pid == os.getpid() and self.thread is not None:
+                return
+            self.pid = os.getpid()
+            self.thread = threading.Thread(target=self.run, name='autocomplete-refresh', daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception('자동완성 인덱스 갱신 실패')
+            finally:
+                close_old_connections()
+            self.wake.wait(SYNC_INTERVAL)
+            self.wake.clear()
+
+    def refresh(self):
+        """재구성 주기가 지났으면 전체 재구성, 아니면 다른 워커의 변경(캐시 버전)이 있을 때만 변경분 반영"""
+        if self.built_at is None or time.monotonic() - self.built_at >= REBUILD_INTERVAL:
+            self.rebuild()
+            return
+        version = get_cache_version(CACHE_NAMESPACE)
+        if version != self.version:
+            # 반영 중에 생긴 변경은 다음 버전에서 다시 반영되도록 먼저 기록
+            self.version = version
+            self.sync()
+
+    def rebuild(self):
+        """DB에서 전체 재구성 (새 인덱스를 만든 뒤 교체)"""
+        from academies.models import AcademyProfile
+        from job_postings.models import JobPosting
+
+        version = get_cache_version(CACHE_NAMESPACE)
+        synced_at = timezone.now()
+        index = AutocompleteIndex()
+        index_postings(index, JobPosting.objects.filter(status='active'))
+        index_profiles(index, AcademyProfile.objects.all())
+        self.index = index
+        self.version = version
+        self.synced_at = synced_at
+        self.built_at = time.monotonic()
+
+    def sync(self):
+        """
+        마지막 반영 이후 변경된 공고/학원 프로필만 반영
+        삭제는 updated_at으로 알 수 없으므로 삭제 기록(SyncTombstone)으로 확인 (마감/비활성 공고는 재색인 시 제거됨)
+        """
+        from academies.models import AcademyProfile
+        from job_postings.models import JobPosting
+        from .models import SyncTombstone
+
+        since = self.synced_at - timedelta(seconds=SYNC_SKEW)
+        self.synced_at = timezone.now()
+        # 삭제 후 같은 학원이 프로필을 다시 만든 경우를 위해 삭제를 먼저 반영
+        deleted = SyncTombstone.objects.filter(
+            model_label__in=TOMBSTONE_SOURCES, deleted_at__gte=since
+        ).values_list('model_label', 'object_id')
+        for label, pk in deleted:
+            self.index.remove_source((TOMBSTONE_SOURCES[label], pk))
+        index_postings(self.index, JobPosting.objects.filter(updated_at__gte=since))
+        index_profiles(self.index, AcademyProfile.objects.filter(updated_at__gte=since))
+
+    def changed(self):
+        """공고/학원 프로필 변경 알림 (커밋 이후) - 모든 워커가 다음 갱신 때 변경분 반영, 현재 워커는 바로 반영"""
+        bump_cache_version(CACHE_NAMESPACE)
+        self.wake.set()
+
+
+autocomplete = AutocompleteService()
@@ -0,0 +1,125 @@
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def get_cache_version(namespace):
+    """
+    네임스페이스의 현재 캐시 버전
+    버전 키가 없으면(최초 또는 eviction) 현재 시각으로 시작하여 이전 버전 키와 겹치지 않도록 함
+    """
+    key = f'{namespace}:version'
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_cache_version(namespace):
+    """네임스페이스 버전 변경 (이전 버전의 캐시 항목은 더 이상 조회되지 않고 만료됨)"""
+    key = f'{namespace}:version'
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, int(time.time() * 1000), timeout=None)
+
+
+def bump_cache_version_on_commit(namespace):
+    """
+    커밋 이후 네임스페이스 버전 변경
+    커밋 전에 올리면 그 사이의 요청이 변경 전 데이터를 새 버전으로 캐시할 수 있음
+    """
+    transaction.on_commit(lambda: bump_cache_version(namespace))
+
+
+def incr_counter(key, delta=1):
+    """캐시에 저장되는 카운터 증가 (Redis 사용 시 워커 간 공유)"""
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        if not cache.add(key, delta, timeout=None):
+            cache.incr(key, delta)
+
+
+def get_response_cache_stats(namespace, actions):
+    """액션별 응답 캐시 hit/miss 수와 hit 비율"""
+    stats = {}
+    for action in actions:
+        hits = cache.get(f'{namespace}:{action}:hits', 0)
+        misses = cache.get(f'{namespace}:{action}:misses', 0)
+        total = hits + misses
+        stats[action] = {
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': round(hits / total, 4) if total else None,
+        }
+    return stats
+
+
+def reset_response_cache_stats(namespace, actions):
+    cache.delete_many([
+        f'{namespace}:{action}:{counter}'
+        for action in actions
+        for counter in ('hits', 'misses')
+    ])
+
+
+class AnonymousResponseCacheMixin:
+    """
+    비로그인 GET 응답 캐시
+    키: 네임스페이스 버전 + 액션 + URL 인자 + 정규화된 쿼리스트링
+    데이터 변경 시 bump_cache_version(response_cache_namespace)로 한 번에 무효화
+    """
+    response_cache_namespace = None
+    response_cache_actions = ['list', 'retrieve']
+
+    def get_response_cache_timeout(self):
+        return settings.RESPONSE_CACHE_TIMEOUT
+
+    def is_response_cacheable(self, request):
+        return (
+            self.response_cache_namespace is not None and
+            request.method == 'GET' and
+            self.action in self.response_cache_actions and
+            not request.user.is_authenticated
+        )
+
+    def get_response_cache_key(self, request):
+        # 파라미터 순서/빈 값과 무관하게 같은 요청은 같은 키 사용
+        params = sorted(
+            (key, value)
+            for key, values in request.query_params.lists()
+            for value in values
+            if value != ''
+        )
+        kwargs = sorted(self.kwargs.items())
+        # 페이지네이션 링크가 절대 URL이므로 scheme/호스트도 키에 포함
+        raw = f'{request.scheme}://{request.get_host()}|{self.action}|{urlencode(kwargs)}|{urlencode(params)}'
+        digest = hashlib.md5(raw.encode()).hexdigest()
+        version = get_cache_version(self.response_cache_namespace)
+        return f'{self.response_cache_namespace}:response:{version}:{digest}'
+
+    def cached_response(self, request, handler, *args, **kwargs):
+        """캐시된 응답이 있으면 반환하고, 없으면 handler 결과를 캐시"""
+        if not self.is_response_cacheable(request):
+            return handler(request, *args, **kwargs)
+
+        namespace = self.response_cache_namespace
+        key = self.get_response_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            incr_counter(f'{namespace}:{self.action}:hits')
+            return Response(data)
+
+        incr_counter(f'{namespace}:{self.action}:misses')
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, self.get_response_cache_timeout())
+        return response
@@ -0,0 +1,33 @@
+from django.db import connection
+from django.db.migrations.operations import AddIndex
+from django.db.models import Q
+
+
+def is_postgresql():
+    return connection.vendor == 'postgresql'
+
+
+def json_array_overlap(field_name, values):
+    """
+    JSON 배열 필드가 values 중 하나라도 포함하는지 검사하는 조건
+    PostgreSQL에서는 GIN 인덱스를 사용하는 단일 ?| 조건으로 변환
+    """
+    values = [value for value in values if value]
+    if is_postgresql():
+        return Q(**{f'{field_name}__has_any_keys': values})
+    q_objects = Q()
+    for value in values:
+        q_objects |= Q(**{f'{field_name}__contains': [value]})
+    return q_objects
+
+
+class PostgresAddIndex(AddIndex):
+    """PostgreSQL 전용 인덱스(GIN, BRIN 등) 추가 - 그 외 DB(개발용 SQLite 등)에서는 생략"""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
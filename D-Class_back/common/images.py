@@ -0,0 +1,164 @@
+import hashlib
+import io
+
+from django.apps import apps
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import Q
+from django.db.models.signals import post_save
+from django.utils import timezone
+
+from .outbox import enqueue, outbox_handler
+
+
+IMAGE_TOPIC = 'image.variants'
+# 변환본 이름 -> 긴 변 최대 길이 (px, 원본보다 크게 확대하지 않음)
+VARIANT_SIZES = {
+    'thumbnail': 320,
+    'medium': 800,
+    'large': 1600,
+}
+WEBP_QUALITY = 80
+VARIANT_DIR = 'variants'
+
+# 변환 대상 이미지 필드 ('앱.모델' -> 원본 필드, 변환 결과는 '<필드>_variants' JSONField)
+IMAGE_FIELDS = {
+    'boards.PostImage': 'image',
+    'instructors.InstructorProfile': 'profile_image',
+    'academies.AcademyProfile': 'academy_image',
+}
+
+
+def variants_field(field_name):
+    return f'{field_name}_variants'
+
+
+def render_variants(data):
+    """
+    원본 이미지 바이트 -> {변환본 이름: (WebP 바이트, 너비, 높이)}
+    EXIF 방향대로 회전한 뒤 다시 인코딩하므로 EXIF(촬영 위치 등)는 결과에 남지 않음
+    """
+    from PIL import Image, ImageOps
+
+    largest = max(VARIANT_SIZES.values())
+    with Image.open(io.BytesIO(data)) as image:
+        if max(image.size) > largest:
+            # JPEG는 디코딩 단계에서 축소 (가장 큰 변환본보다 작아지지 않는 범위에서)
+            ratio = largest / max(image.size)
+            image.draft('RGB', (int(image.width * ratio) + 1, int(image.height * ratio) + 1))
+        image = ImageOps.exif_transpose(image)
+        image = image.convert('RGBA' if image.mode in ('RGBA', 'LA', 'P') else 'RGB')
+
+        results = {}
+        for name, size in VARIANT_SIZES.items():
+            variant = image.copy()
+            variant.thumbnail((size, size), Image.LANCZOS)
+            buffer = io.BytesIO()
+            variant.save(buffer, 'WEBP', quality=WEBP_QUALITY, method=4)
+            results[name] = (buffer.getvalue(), variant.width, variant.height)
+    return results
+
+
+def generate_variants(field_file):
+    """
+    이미지 필드 파일의 WebP 변환본 생성 후 저장 정보 반환
+    파일 이름은 원본 내용 해시 기반 - 같은 이미지는 다시 저장하지 않음
+    """
+    storage = field_file.storage
+    with field_file.open('rb') as source:
+        data = source.read()
+    digest = hashlib.sha256(data).hexdigest()[:20]
+
+    variants = {'source': field_file.name}
+    for name, (content, width, height) in render_variants(data).items():
+        path = f'{VARIANT_DIR}/{digest[:2]}/{digest}_{name}.webp'
+        if not storage.exists(path):
+            path = storage.save(path, ContentFile(content))
+        variants[name] = {'name': path, 'width': width, 'height': height}
+    return variants
+
+
+def update_variants(instance, field_name):
+    """인스턴스 이미지의 변환본 갱신 (이미 최신이면 False)"""
+    field_file = getattr(instance, field_name)
+    current = getattr(instance, variants_field(field_name)) or {}
+    if not field_file:
+        if not current:
+            return False
+        variants = {}
+    elif current.get('source') == field_file.name:
+        return False
+    else:
+        variants = generate_variants(field_file)
+
+    # 변환 중에 이미지가 다시 바뀌었으면 저장하지 않음 (새 이미지는 별도 작업에서 처리)
+    if field_file:
+        unchanged = Q(**{field_name: field_file.name})
+    else:
+        unchanged = Q(**{field_name: ''}) | Q(**{f'{field_name}__isnull': True})
+    values = {variants_field(field_name): variants}
+    # update()는 auto_now를 갱신하지 않으므로 직접 갱신 (updated_at 기반 ETag가 변환본 반영 후 바뀌도록)
+    if any(field.name == 'updated_at' for field in type(instance)._meta.concrete_fields):
+        values['updated_at'] = timezone.now()
+    type(instance).objects.filter(unchanged, pk=instance.pk).update(**values)
+    return True
+
+
+@outbox_handler(IMAGE_TOPIC, dedicated=True)
+def build_image_variants(payload):
+    """아웃박스 작업: 업로드된 이미지의 변환본 생성 (웹 워커가 아닌 process_outbox 프로세스에서만 실행)"""
+    model = apps.get_model(payload['model'])
+    field_name = IMAGE_FIELDS[payload['model']]
+    instance = model.objects.filter(pk=payload['pk']).only(
+        'pk', field_name, variants_field(field_name)
+    ).first()
+    if instance is not None:
+        update_variants(instance, field_name)
+
+
+def needs_variants(instance, field_name):
+    """변환본이 현재 이미지와 다르면 True (이미지를 지운 경우 남은 변환본 정보 정리 포함)"""
+    field_file = getattr(instance, field_name)
+    current = getattr(instance, variants_field(field_name)) or {}
+    return current.get('source') != (field_file.name if field_file else None)
+
+
+def enqueue_image_variants(sender, instance, update_fields=None, **kwargs):
+    """이미지가 새로 저장되면 변환 작업을 아웃박스에 저장 (저장과 같은 트랜잭션)"""
+    label = sender._meta.label
+    field_name = IMAGE_FIELDS[label]
+    if update_fields is not None and field_name not in update_fields:
+        return
+    if needs_variants(instance, field_name):
+        enqueue(IMAGE_TOPIC, {'model': label, 'pk': instance.pk})
+
+
+def connect_image_signals():
+    for label in IMAGE_FIELDS:
+        post_save.connect(enqueue_image_variants, sender=label, dispatch_uid=f'image_variants:{label}')
+
+
+def media_url(name, request=None):
+    """저장된 파일 URL (request가 있으면 ImageField 직렬화와 같이 절대 URL)"""
+    if not name:
+        return None
+    value = default_storage.url(name)
+    return request.build_absolute_uri(value) if request is not None else value
+
+
+def image_variant_urls(name, variants, request=None):
+    """
+    변환본 URL과 srcset ({'thumbnail', 'medium', 'large', 'srcset'})
+    아직 변환되지 않았거나 원본이 바뀐 뒤면 None (원본 URL 사용)
+    """
+    if not name or not variants or variants.get('source') != name:
+        return None
+
+    urls = {size: media_url(variants[size]['name'], request) for size in VARIANT_SIZES if size in variants}
+    # 원본이 작으면 여러 변환본의 너비가 같을 수 있으므로 너비별 하나만 사용
+    widths = {}
+    for size in VARIANT_SIZES:
+        if size in variants:
+            widths.setdefault(variants[size]['width'], urls[size])
+    urls['srcset'] = ', '.join(f'{value} {width}w' for width, value in widths.items())
+    return urls
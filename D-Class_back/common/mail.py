@@ -0,0 +1,158 @@
+import logging
+import smtplib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .cache import incr_counter
+from .outbox import enqueue, outbox_handler
+
+
+logger = logging.getLogger(__name__)
+
+EMAIL_TOPIC = 'email.send'
+STATS_PREFIX = 'email_queue'
+STATS_COUNTERS = ('sent', 'failed', 'batches', 'queue_latency_ms', 'send_latency_ms')
+
+_renderers = {}
+
+
+def email_renderer(name):
+    """
+    발송 시점에 메일 내용을 만드는 함수 등록 (params dict -> queue_email 인자 dict, 보내지 않으면 None)
+    토큰처럼 아웃박스에 남기면 안 되는 값은 발송 직전에 생성
+    """
+    def decorator(func):
+        _renderers[name] = func
+        return func
+    return decorator
+
+
+def queue_email(subject, message, recipient_list, from_email=None, html_message=None):
+    """
+    이메일 발송을 아웃박스에 저장 (호출한 트랜잭션이 커밋된 뒤 워커가 묶어서 발송)
+    요청은 SMTP 서버 응답을 기다리지 않음
+    """
+    return enqueue(EMAIL_TOPIC, {
+        'subject': subject,
+        'message': message,
+        'recipient_list': list(recipient_list),
+        'from_email': from_email,
+        'html_message': html_message,
+        'queued_at': timezone.now().isoformat(),
+    })
+
+
+def queue_rendered_email(renderer, **params):
+    """발송 시점에 내용을 만드는 이메일을 아웃박스에 저장 (아웃박스에는 renderer 이름과 params만 저장)"""
+    if renderer not in _renderers:
+        raise ValueError(f'등록되지 않은 이메일 유형입니다: {renderer}')
+    return enqueue(EMAIL_TOPIC, {
+        'renderer': renderer,
+        'params': params,
+        'queued_at': timezone.now().isoformat(),
+    })
+
+
+def render_payload(payload):
+    """발송할 메일 내용 (renderer 작업은 이 시점에 생성, 보낼 필요가 없으면 None)"""
+    if 'renderer' not in payload:
+        return payload
+    return _renderers[payload['renderer']](payload['params'])
+
+
+def build_message(payload, connection):
+    message = EmailMultiAlternatives(
+        subject=payload['subject'],
+        body=payload['message'],
+        from_email=payload.get('from_email') or settings.DEFAULT_FROM_EMAIL,
+        to=payload['recipient_list'],
+        connection=connection,
+    )
+    if payload.get('html_message'):
+        message.attach_alternative(payload['html_message'], 'text/html')
+    return message
+
+
+def send_message(connection, payload):
+    try:
+        connection.send_messages([build_message(payload, connection)])
+    except smtplib.SMTPServerDisconnected:
+        # 서버가 유휴 세션을 끊은 경우 다시 연결하여 한 번 더 시도
+        connection.close()
+        connection.open()
+        connection.send_messages([build_message(payload, connection)])
+
+
+@outbox_handler(EMAIL_TOPIC, batch=True)
+def send_queued_emails(payloads):
+    """
+    대기 중인 이메일 묶음을 하나의 백엔드 연결(SMTP 세션)로 발송
+    메일별 실패는 해당 작업만 백오프 후 재시도 (연결 실패 시 묶음 전체 재시도)
+    """
+    connection = get_connection(fail_silently=False)
+    results = []
+    started = time.monotonic()
+    connection.open()
+    try:
+        for payload in payloads:
+            try:
+                message = render_payload(payload)
+                if message is not None:
+                    send_message(connection, message)
+            except Exception as exc:
+                results.append(exc)
+                continue
+            results.append(None)
+            record_queue_latency(payload)
+    finally:
+        connection.close()
+
+    sent = results.count(None)
+    record_batch(sent, len(results) - sent, time.monotonic() - started)
+    return results
+
+
+def record_queue_latency(payload):
+    """저장부터 발송까지 걸린 시간 누적 (재시도 대기 포함)"""
+    queued_at = parse_datetime(payload.get('queued_at') or '')
+    if queued_at is not None:
+        latency_ms = int((timezone.now() - queued_at).total_seconds() * 1000)
+        incr_counter(f'{STATS_PREFIX}:queue_latency_ms', max(latency_ms, 0))
+
+
+def record_batch(sent, failed, elapsed):
+    incr_counter(f'{STATS_PREFIX}:batches')
+    if sent:
+        incr_counter(f'{STATS_PREFIX}:sent', sent)
+        incr_counter(f'{STATS_PREFIX}:send_latency_ms', int(elapsed * 1000))
+    if failed:
+        incr_counter(f'{STATS_PREFIX}:failed', failed)
+    logger.info('이메일 묶음 발송: 성공 %d, 실패 %d, %.2f초', sent, failed, elapsed)
+
+
+def get_email_queue_stats():
+    """대기/실패 메일 수, 발송/실패 누적 수, 평균 대기 시간과 메일당 평균 발송 시간 (ms)"""
+    from .models import OutboxEvent
+
+    counters = cache.get_many([f'{STATS_PREFIX}:{name}' for name in STATS_COUNTERS])
+    values = {name: counters.get(f'{STATS_PREFIX}:{name}', 0) for name in STATS_COUNTERS}
+    queue = OutboxEvent.objects.filter(topic=EMAIL_TOPIC)
+    sent = values['sent']
+    return {
+        'queue_depth': queue.filter(status__in=['pending', 'processing']).count(),
+        'failed_in_queue': queue.filter(status='failed').count(),
+        'sent': sent,
+        'send_failures': values['failed'],
+        'batches': values['batches'],
+        'avg_queue_latency_ms': round(values['queue_latency_ms'] / sent) if sent else None,
+        'avg_send_latency_ms': round(values['send_latency_ms'] / sent, 1) if sent else None,
+    }
+
+
+def reset_email_queue_stats():
+    cache.delete_many([f'{STATS_PREFIX}:{name}' for name in STATS_COUNTERS])
@@ -0,0 +1,94 @@
+"""
+기존 업로드 이미지의 WebP 변환본 일괄 생성 (새 업로드는 process_outbox 프로세스에서 처리됨)
+Usage: python manage.py build_image_variants [--model boards.PostImage] [--workers 4] [--force]
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from common.images import IMAGE_FIELDS, needs_variants, update_variants, variants_field
+
+
+def build_one(label, pk, force=False):
+    """변환본 1건 생성 (작업 프로세스에서 실행) - (생성 여부, 실패 사유)"""
+    field_name = IMAGE_FIELDS[label]
+    instance = apps.get_model(label).objects.filter(pk=pk).only(
+        'pk', field_name, variants_field(field_name)
+    ).first()
+    if instance is None:
+        return False, None
+    if force:
+        setattr(instance, variants_field(field_name), {})
+    try:
+        return update_variants(instance, field_name), None
+    except Exception as exc:
+        # 파일 누락/손상 이미지 하나 때문에 전체 작업이 중단되지 않도록 사유만 반환
+        return False, f'{label} #{pk}: {exc}'
+
+
+class Command(BaseCommand):
+    help = 'Generate missing WebP variants for uploaded images'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            action='append',
+            choices=list(IMAGE_FIELDS),
+            help='대상 모델 (여러 번 지정 가능, 기본 전체)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='이미지 변환 프로세스 수 (기본 1 - 현재 프로세스에서 처리)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='이미 변환된 이미지도 다시 생성',
+        )
+
+    def handle(self, *args, **options):
+        if options['workers'] < 1:
+            raise CommandError('--workers는 1 이상이어야 합니다')
+        force = options['force']
+
+        jobs = []
+        for label in options['model'] or IMAGE_FIELDS:
+            field_name = IMAGE_FIELDS[label]
+            rows = apps.get_model(label).objects.exclude(**{field_name: ''}).exclude(
+                **{f'{field_name}__isnull': True}
+            ).only('pk', field_name, variants_field(field_name))
+            jobs.extend(
+                (label, instance.pk) for instance in rows.iterator()
+                if force or needs_variants(instance, field_name)
+            )
+        if not jobs:
+            self.stdout.write(self.style.SUCCESS('All image variants are up to date'))
+            return
+
+        if options['workers'] == 1:
+            results = [build_one(label, pk, force) for label, pk in jobs]
+        else:
+            # 설정이 끝난 Django를 그대로 쓰도록 fork로 시작하고, 부모의 DB 연결은 공유하지 않도록 fork 전에 닫음
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=options['workers'], mp_context=multiprocessing.get_context('fork')
+            ) as executor:
+                results = list(executor.map(
+                    build_one,
+                    [label for label, _ in jobs],
+                    [pk for _, pk in jobs],
+                    [force] * len(jobs),
+                    chunksize=16,
+                ))
+        errors = [error for _, error in results if error]
+        for error in errors:
+            self.stderr.write(error)
+        self.stdout.write(self.style.SUCCESS(
+            f'Generated variants for {sum(built for built, _ in results)} of {len(jobs)} images'
+            f' ({len(errors)} failed)'
+        ))
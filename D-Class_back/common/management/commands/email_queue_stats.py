@@ -0,0 +1,26 @@
+"""
+이메일 발송 큐 현황 (대기 메일 수, 발송/실패 수, 평균 대기·발송 시간)
+Usage: python manage.py email_queue_stats [--reset]
+"""
+from django.core.management.base import BaseCommand
+
+from common.mail import get_email_queue_stats, reset_email_queue_stats
+
+
+class Command(BaseCommand):
+    help = 'Show queue depth and delivery latency of the outbox email queue'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='통계 출력 후 발송 카운터 초기화',
+        )
+
+    def handle(self, *args, **options):
+        for key, value in get_email_queue_stats().items():
+            self.stdout.write(f'  {key}: {value if value is not None else "-"}')
+
+        if options['reset']:
+            reset_email_queue_stats()
+            self.stdout.write(self.style.SUCCESS('Counters reset'))
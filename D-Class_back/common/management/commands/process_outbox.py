@@ -0,0 +1,57 @@
+"""
+아웃박스 작업 처리 (gunicorn 워커 외에 별도 프로세스로 처리하거나 대기/실패 현황 확인)
+웹 워커에서 처리하지 않는 dedicated 작업(이미지 변환 등)도 이 명령에서 처리
+Usage: python manage.py process_outbox [--loop] [--stats] [--retry-failed]
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from common.outbox import POLL_INTERVAL, drain_outbox, get_outbox_stats, retry_failed_events
+
+
+class Command(BaseCommand):
+    help = 'Deliver pending transactional outbox events (notifications, emails)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='종료하지 않고 주기적으로 DB를 확인하며 처리',
+        )
+        parser.add_argument(
+            '--stats',
+            action='store_true',
+            help='상태별 작업 수만 출력',
+        )
+        parser.add_argument(
+            '--retry-failed',
+            action='store_true',
+            help='failed 작업을 다시 대기 상태로 변경',
+        )
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            for key, value in get_outbox_stats().items():
+                self.stdout.write(f'  {key}: {value}')
+            return
+
+        if options['retry_failed']:
+            self.stdout.write(f'Requeued {retry_failed_events()} failed events')
+
+        if not options['loop']:
+            processed = drain_outbox()
+            self.stdout.write(self.style.SUCCESS(f'Processed {processed} outbox events'))
+            return
+
+        self.stdout.write(f'Polling outbox every {POLL_INTERVAL}s (Ctrl+C to stop)')
+        try:
+            while True:
+                processed = drain_outbox()
+                if processed:
+                    self.stdout.write(f'Processed {processed} outbox events')
+                close_old_connections()
+                time.sleep(POLL_INTERVAL)
+        except KeyboardInterrupt:
+            pass
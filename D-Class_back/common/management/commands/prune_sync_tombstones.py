@@ -0,0 +1,25 @@
+"""
+보관 기간이 지난 삭제 기록(증분 동기화용) 삭제
+Usage: python manage.py prune_sync_tombstones [--days 30]
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from common.sync import TOMBSTONE_RETENTION, prune_tombstones
+
+
+class Command(BaseCommand):
+    help = 'Delete sync tombstones older than the delta-sync retention window'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=TOMBSTONE_RETENTION.days,
+            help='보관 일수 (기본 30일, 이보다 오래된 커서는 410 응답)',
+        )
+
+    def handle(self, *args, **options):
+        deleted = prune_tombstones(timedelta(days=options['days']))
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} tombstones'))
@@ -0,0 +1,29 @@
+"""
+인기 검색어 재계산 (검색 로그 버퍼 저장 스레드에서도 주기적으로 실행됨)
+Usage: python manage.py refresh_popular_keywords [--prune-days 30]
+"""
+from django.core.management.base import BaseCommand
+
+from common.search_log import prune_search_logs, refresh_popular_keywords
+
+
+class Command(BaseCommand):
+    help = 'Recompute the cached time-decayed popular search keywords'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--prune-days',
+            type=int,
+            default=None,
+            help='지정한 일수보다 오래된 검색 로그 삭제',
+        )
+
+    def handle(self, *args, **options):
+        if options['prune_days'] is not None:
+            deleted = prune_search_logs(options['prune_days'])
+            self.stdout.write(f'Deleted {deleted} search logs')
+
+        keywords = refresh_popular_keywords()
+        for rank, row in enumerate(keywords, start=1):
+            self.stdout.write(f"  {rank}. {row['keyword']} ({row['count']})")
+        self.stdout.write(self.style.SUCCESS(f'Refreshed {len(keywords)} popular keywords'))
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('keyword', models.CharField(max_length=100, verbose_name='검색어')),
+                ('source', models.CharField(choices=[('search', '공고 검색')], max_length=20, verbose_name='검색 경로')),
+                ('count', models.PositiveIntegerField(default=1, verbose_name='검색 수')),
+                ('created_at', models.DateTimeField(verbose_name='집계 시각')),
+            ],
+            options={
+                'verbose_name': '검색 로그',
+                'verbose_name_plural': '검색 로그',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['created_at'], name='common_sear_created_114eb7_idx')],
+            },
+        ),
+    ]
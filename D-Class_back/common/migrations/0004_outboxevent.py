@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0003_searchlog'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('topic', models.CharField(max_length=50, verbose_name='작업 유형')),
+                ('payload', models.JSONField(default=dict, verbose_name='작업 데이터')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('failed', '실패')], default='pending', max_length=20, verbose_name='상태')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='시도 횟수')),
+                ('available_at', models.DateTimeField(verbose_name='처리 가능 시각')),
+                ('last_error', models.TextField(blank=True, verbose_name='마지막 오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+            ],
+            options={
+                'verbose_name': '아웃박스 작업',
+                'verbose_name_plural': '아웃박스 작업',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['status', 'available_at'], name='common_outb_status_ecaa18_idx')],
+            },
+        ),
+    ]
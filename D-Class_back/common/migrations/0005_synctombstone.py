@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0004_outboxevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_label', models.CharField(max_length=50, verbose_name='모델')),
+                ('object_id', models.BigIntegerField(verbose_name='삭제된 객체 ID')),
+                ('user_id', models.BigIntegerField(verbose_name='사용자 ID')),
+                ('deleted_at', models.DateTimeField(auto_now_add=True, verbose_name='삭제일')),
+            ],
+            options={
+                'verbose_name': '삭제 기록',
+                'verbose_name_plural': '삭제 기록',
+                'indexes': [models.Index(fields=['user_id', 'model_label', 'deleted_at'], name='common_sync_user_id_1db4e7_idx')],
+            },
+        ),
+    ]
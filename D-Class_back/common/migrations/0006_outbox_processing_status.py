@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0005_synctombstone'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='outboxevent',
+            name='status',
+            field=models.CharField(choices=[('pending', '대기'), ('processing', '처리 중'), ('failed', '실패')], default='pending', max_length=20, verbose_name='상태'),
+        ),
+    ]
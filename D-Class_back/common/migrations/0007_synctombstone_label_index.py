@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0006_outbox_processing_status'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='synctombstone',
+            index=models.Index(fields=['model_label', 'deleted_at'], name='common_sync_model_l_13aaba_idx'),
+        ),
+    ]
@@ -0,0 +1,63 @@
+import hashlib
+from datetime import datetime
+
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework import status
+
+
+class ConditionalResponseMixin:
+    """
+    ETag / Last-Modified 조건부 응답
+    get_conditional_validators()로 updated_at·개수 등 가벼운 값만 조회하여
+    If-None-Match / If-Modified-Since가 일치하면 직렬화 없이 304 반환
+    """
+    conditional_actions = ['retrieve']
+
+    def get_conditional_validators(self, request):
+        """
+        응답 내용을 결정하는 값 목록 (updated_at, 개수, 버전 등)
+        None을 반환하면 조건부 응답을 사용하지 않음 (예: 대상이 없어 404가 나갈 경우)
+        """
+        return None
+
+    def get_conditional_headers(self, request):
+        validators = self.get_conditional_validators(request)
+        if validators is None:
+            return None, None
+        validators = list(validators)
+        # Last-Modified는 검증값이 모두 수정 시각일 때만 사용 (개수 등은 시각으로 표현되지 않음)
+        last_modified = None
+        timestamps = [value for value in validators if value is not None]
+        if timestamps and all(isinstance(value, datetime) for value in timestamps):
+            last_modified = int(max(timestamps).timestamp())
+        # 지원/찜 여부 등 사용자별로 달라지는 응답이 섞이지 않도록 사용자도 포함
+        validators.append(request.user.pk if request.user.is_authenticated else None)
+        digest = hashlib.md5(repr(validators).encode()).hexdigest()
+        return f'W/"{digest}"', last_modified
+
+    def conditional_response(self, request, handler, *args, **kwargs):
+        """검증값이 일치하면 304, 아니면 handler 응답에 ETag/Last-Modified 헤더 추가"""
+        # generic view는 action이 없으므로 항상 적용
+        action = getattr(self, 'action', None)
+        if request.method not in ('GET', 'HEAD') or (action is not None and action not in self.conditional_actions):
+            return handler(request, *args, **kwargs)
+
+        etag, last_modified = self.get_conditional_headers(request)
+        if etag is None:
+            return handler(request, *args, **kwargs)
+
+        not_modified = get_conditional_response(
+            request._request, etag=etag, last_modified=last_modified
+        )
+        if not_modified is not None:
+            response = not_modified
+        else:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+        response.headers['ETag'] = etag
+        if last_modified is not None:
+            response.headers['Last-Modified'] = http_date(last_modified)
+        patch_vary_headers(response, ['Authorization'])
+        return response
@@ -116,3 +116,94 @@ class Inquiry(models.Model):
     
     def __str__(self):
         return f'{self.user.name} - {self.title}'
+
+
+class SearchLog(models.Model):
+    """검색 로그 (요청마다 저장하지 않고 프로세스 버퍼에서 검색어별로 합산해 일괄 저장)"""
+    
+    SOURCE_CHOICES = [
+        ('search', '공고 검색'),
+    ]
+    
+    keyword = models.CharField(max_length=100, verbose_name='검색어')
+    source = models.CharField(
+        max_length=20,
+        choices=SOURCE_CHOICES,
+        verbose_name='검색 경로'
+    )
+    count = models.PositiveIntegerField(default=1, verbose_name='검색 수')
+    created_at = models.DateTimeField(verbose_name='집계 시각')
+    
+    class Meta:
+        verbose_name = '검색 로그'
+        verbose_name_plural = '검색 로그'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at']),
+        ]
+    
+    def __str__(self):
+        return f'{self.keyword} ({self.count})'
+
+
+class OutboxEvent(models.Model):
+    """
+    트랜잭셔널 아웃박스 - 도메인 변경과 같은 트랜잭션에서 저장되는 후속 작업 (알림, 이메일 등)
+    커밋 이후 아웃박스 워커가 처리하며, 처리에 성공하면 삭제
+    """
+    
+    STATUS_CHOICES = [
+        ('pending', '대기'),
+        ('processing', '처리 중'),
+        ('failed', '실패'),
+    ]
+    
+    topic = models.CharField(max_length=50, verbose_name='작업 유형')
+    payload = models.JSONField(default=dict, verbose_name='작업 데이터')
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='pending',
+        verbose_name='상태'
+    )
+    attempts = models.PositiveIntegerField(default=0, verbose_name='시도 횟수')
+    # processing 상태에서는 선점 제한 시각 (지나면 다른 워커가 다시 처리)
+    available_at = models.DateTimeField(verbose_name='처리 가능 시각')
+    last_error = models.TextField(blank=True, verbose_name='마지막 오류')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
+    
+    class Meta:
+        verbose_name = '아웃박스 작업'
+        verbose_name_plural = '아웃박스 작업'
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['status', 'available_at']),
+        ]
+    
+    def __str__(self):
+        return f'{self.topic} #{self.pk} ({self.get_status_display()})'
+
+
+class SyncTombstone(models.Model):
+    """
+    삭제 기록 - ?since= 증분 동기화 응답과 자동완성 인덱스 갱신에서 삭제된 행(예: 취소된 지원, 삭제된 공고)을 알리기 위해 보관
+    보관 기간이 지난 기록은 prune_sync_tombstones 명령으로 삭제
+    """
+    
+    model_label = models.CharField(max_length=50, verbose_name='모델')
+    object_id = models.BigIntegerField(verbose_name='삭제된 객체 ID')
+    # 사용자 삭제 시 연쇄 삭제되는 행의 기록도 남을 수 있으므로 FK 대신 ID만 저장
+    user_id = models.BigIntegerField(verbose_name='사용자 ID')
+    deleted_at = models.DateTimeField(auto_now_add=True, verbose_name='삭제일')
+    
+    class Meta:
+        verbose_name = '삭제 기록'
+        verbose_name_plural = '삭제 기록'
+        indexes = [
+            models.Index(fields=['user_id', 'model_label', 'deleted_at']),
+            # 사용자와 관계없이 최근 삭제를 조회 (자동완성 인덱스 갱신)
+            models.Index(fields=['model_label', 'deleted_at']),
+        ]
+    
+    def __str__(self):
+        return f'{self.model_label} #{self.object_id}'
@@ -0,0 +1,258 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+# 대기 작업 확인 주기 (초) - 커밋 직후에는 주기와 관계없이 바로 처리
+POLL_INTERVAL = 5
+BATCH_SIZE = 100
+# 이 횟수만큼 실패하면 failed 상태로 두고 더 이상 재시도하지 않음
+MAX_ATTEMPTS = 8
+# 재시도 대기 시간: 10초, 20초, 40초 ... 최대 1시간
+RETRY_BASE_DELAY = 10
+RETRY_MAX_DELAY = 3600
+# 선점한 작업의 처리 제한 시간 - 이 시간 안에 끝나지 않으면 (프로세스 종료 등) 다른 워커가 다시 처리
+LEASE_TIMEOUT = timedelta(minutes=10)
+
+_handlers = {}
+_batch_topics = set()
+_dedicated_topics = set()
+
+
+def outbox_handler(topic, batch=False, dedicated=False):
+    """
+    아웃박스 작업 처리 함수 등록
+    batch=False: payload dict 하나를 받음
+    batch=True: 같은 유형의 payload 목록을 받아 작업별 결과(성공 None, 실패 예외) 목록을 반환
+    dedicated=True: 웹 프로세스의 아웃박스 스레드에서는 처리하지 않고 process_outbox 명령 프로세스에서만 처리
+    (이미지 변환처럼 CPU를 오래 쓰는 작업)
+    """
+    def decorator(func):
+        _handlers[topic] = func
+        if batch:
+            _batch_topics.add(topic)
+        if dedicated:
+            _dedicated_topics.add(topic)
+        return func
+    return decorator
+
+
+def enqueue(topic, payload, delay=None):
+    """
+    후속 작업을 아웃박스에 저장 (호출한 곳의 트랜잭션에 포함)
+    트랜잭션이 롤백되면 작업도 함께 취소되고, 커밋되면 워커가 처리
+    """
+    from .models import OutboxEvent
+
+    if topic not in _handlers:
+        raise ValueError(f'등록되지 않은 아웃박스 작업 유형입니다: {topic}')
+    available_at = timezone.now() + (delay or timedelta())
+    event = OutboxEvent.objects.create(topic=topic, payload=payload, available_at=available_at)
+    transaction.on_commit(outbox_worker.notify)
+    return event
+
+
+def retry_delay(attempts):
+    return timedelta(seconds=min(RETRY_BASE_DELAY * 2 ** (attempts - 1), RETRY_MAX_DELAY))
+
+
+def mark_failed(event, exc):
+    """지수 백오프로 재시도 예약 (최대 횟수 초과 시 failed)"""
+    event.attempts += 1
+    event.last_error = f'{type(exc).__name__}: {exc}'[:2000]
+    if event.attempts >= MAX_ATTEMPTS:
+        event.status = 'failed'
+        logger.error('아웃박스 작업 최종 실패: %s - %s', event, event.last_error)
+    else:
+        event.status = 'pending'
+        event.available_at = timezone.now() + retry_delay(event.attempts)
+        logger.warning('아웃박스 작업 실패 (%d회): %s - %s', event.attempts, event, event.last_error)
+    event.save(update_fields=['attempts', 'last_error', 'status', 'available_at'])
+
+
+def process_event(event):
+    """작업 하나를 savepoint 안에서 처리 (성공 여부 반환)"""
+    handler = _handlers.get(event.topic)
+    try:
+        if handler is None:
+            raise LookupError(f'등록되지 않은 아웃박스 작업 유형입니다: {event.topic}')
+        with transaction.atomic():
+            handler(event.payload)
+    except Exception as exc:
+        mark_failed(event, exc)
+        return False
+    return True
+
+
+def process_batch(topic, events):
+    """같은 유형의 작업 묶음을 한 번에 처리 (성공한 작업 목록 반환)"""
+    try:
+        # 처리 중 DB 오류가 나면 묶음 전체를 롤백하고 실패 기록은 트랜잭션 밖에서 저장
+        with transaction.atomic():
+            results = _handlers[topic]([event.payload for event in events])
+    except Exception as exc:
+        results = [exc] * len(events)
+    done = []
+    for event, error in zip(events, results):
+        if error is None:
+            done.append(event)
+        else:
+            mark_failed(event, error)
+    return done
+
+
+def claim_events(batch_size=BATCH_SIZE, include_dedicated=True):
+    """
+    처리 가능한 작업을 짧은 트랜잭션에서 선점 (processing 상태 + 제한 시간)
+    PostgreSQL에서는 SKIP LOCKED로 다른 워커가 선점 중인 행을 건너뛰어 같은 작업을 중복 처리하지 않음
+    제한 시간이 지난 processing 작업은 처리하던 프로세스가 종료된 것으로 보고 다시 선점
+    """
+    from .models import OutboxEvent
+
+    now = timezone.now()
+    queryset = OutboxEvent.objects.select_for_update(skip_locked=True).filter(
+        status__in=['pending', 'processing'], available_at__lte=now
+    )
+    if not include_dedicated and _dedicated_topics:
+        queryset = queryset.exclude(topic__in=_dedicated_topics)
+    with transaction.atomic():
+        events = list(queryset.order_by('id')[:batch_size])
+        if events:
+            lease_until = now + LEASE_TIMEOUT
+            OutboxEvent.objects.filter(pk__in=[event.pk for event in events]).update(
+                status='processing', available_at=lease_until
+            )
+            for event in events:
+                event.status = 'processing'
+                event.available_at = lease_until
+    return events
+
+
+def process_outbox(batch_size=BATCH_SIZE, include_dedicated=True):
+    """
+    처리 가능한 대기 작업 일괄 처리 (처리한 작업 수 반환)
+    선점 후 작업별로 트랜잭션 밖에서 처리하므로 SMTP 발송/이미지 변환 동안 행 잠금을 유지하지 않음
+    성공한 작업은 삭제
+    """
+    from .models import OutboxEvent
+
+    events = claim_events(batch_size, include_dedicated)
+    done = []
+    batches = {}
+    for event in events:
+        if event.topic in _batch_topics:
+            batches.setdefault(event.topic, []).append(event)
+        elif process_event(event):
+            done.append(event)
+    for topic, topic_events in batches.items():
+        done.extend(process_batch(topic, topic_events))
+    if done:
+        OutboxEvent.objects.filter(pk__in=[event.pk for event in done]).delete()
+    return len(events)
+
+
+def drain_outbox(batch_size=BATCH_SIZE, include_dedicated=True):
+    """처리 가능한 작업이 없을 때까지 반복 처리"""
+    total = 0
+    while True:
+        processed = process_outbox(batch_size, include_dedicated)
+        total += processed
+        if processed < batch_size:
+            return total
+
+
+def get_outbox_stats():
+    """상태별 작업 수와 가장 오래된 대기 작업의 지연 시간 (초)"""
+    from django.db.models import Count, Min
+    from .models import OutboxEvent
+
+    stats = {'pending': 0, 'processing': 0, 'failed': 0, 'oldest_pending_seconds': None}
+    for row in OutboxEvent.objects.order_by().values('status').annotate(total=Count('id')):
+        stats[row['status']] = row['total']
+    oldest = OutboxEvent.objects.filter(status='pending').aggregate(oldest=Min('created_at'))['oldest']
+    if oldest is not None:
+        stats['oldest_pending_seconds'] = round((timezone.now() - oldest).total_seconds(), 1)
+    return stats
+
+
+def retry_failed_events(topic=None):
+    """failed 작업을 다시 대기 상태로 변경"""
+    from .models import OutboxEvent
+
+    queryset = OutboxEvent.objects.filter(status='failed')
+    if topic:
+        queryset = queryset.filter(topic=topic)
+    return queryset.update(status='pending', attempts=0, available_at=timezone.now())
+
+
+class OutboxWorker:
+    """
+    프로세스별 아웃박스 처리 스레드
+    커밋 직후 notify()로 깨어나 바로 처리하고, 그 외에는 주기적으로 DB를 확인하여
+    재시도 대상과 다른 프로세스가 처리하지 못한 작업(재시작 등)을 처리
+    웹 프로세스에서 실행되므로 dedicated 작업은 처리하지 않음 (process_outbox 명령 프로세스에서 처리)
+    OUTBOX_WORKER_THREAD=False이면 시작하지 않고 모든 작업을 process_outbox --loop 프로세스에서 처리
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.thread = None
+        self.pid = None
+
+    def notify(self):
+        if getattr(settings, 'OUTBOX_RUN_EAGERLY', False):
+            # 테스트/개발용: 요청 스레드에서 바로 처리
+            drain_outbox()
+            return
+        if not getattr(settings, 'OUTBOX_WORKER_THREAD', True):
+            return
+        self.start()
+        self.wake.set()
+
+    def start(self):
+        """현재 프로세스의 처리 스레드 시작 (gunicorn fork 이후 워커별로 시작)"""
+        if self.pid == os.getpid() and self.thread is not None:
+            return
+        with self.lock:
+            if self.pid == os.getpid() and self.thread is not None:
+                return
+            if self.pid is None:
+                atexit.register(self.shutdown)
+            self.pid = os.getpid()
+            self.thread = threading.Thread(target=self.run, name='outbox-worker', daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while True:
+            self.wake.wait(POLL_INTERVAL)
+            self.wake.clear()
+            try:
+                drain_outbox(include_dedicated=False)
+            except Exception:
+                logger.exception('아웃박스 처리 실패')
+                time.sleep(POLL_INTERVAL)
+            finally:
+                close_old_connections()
+
+    def shutdown(self):
+        """프로세스 종료 전 커밋된 작업 처리 (남은 작업은 다른 워커가 처리)"""
+        if self.pid != os.getpid():
+            return
+        try:
+            process_outbox(include_dedicated=False)
+        except Exception:
+            logger.exception('아웃박스 처리 실패')
+
+
+outbox_worker = OutboxWorker()
+
@@ -0,0 +1,151 @@
+import base64
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Keyset(커서) 페이지네이션
+    (정렬 키, id) 위치 이후의 행만 조회하므로 COUNT(*)/OFFSET 없이 몇 번째 페이지든 첫 페이지와 같은 비용
+    """
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = 'cursor'
+    # 커서 키로 사용할 수 있는 필드 (뷰의 cursor_ordering_fields로 변경 가능)
+    ordering_fields = ['created_at']
+    default_ordering = '-created_at'
+    invalid_cursor_message = '유효하지 않은 커서입니다'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.key_field, self.descending = self.get_key(queryset, view)
+        position = self.decode_cursor(request, queryset)
+
+        reverse = bool(position and position['reverse'])
+        descending = self.descending != reverse
+        key, tiebreak = (f'-{self.key_field}', '-id') if descending else (self.key_field, 'id')
+        queryset = queryset.order_by(key, tiebreak)
+
+        if position is not None:
+            queryset = queryset.filter(
+                self.build_position_filter(position['value'], position['id'], descending)
+            )
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.page = results
+        return results
+
+    def get_key(self, queryset, view):
+        """쿼리셋 정렬(OrderingFilter 적용 결과 또는 Meta.ordering)의 첫 번째 필드를 커서 키로 사용"""
+        allowed = getattr(view, 'cursor_ordering_fields', self.ordering_fields)
+        ordering = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+        term = ordering[0] if ordering and isinstance(ordering[0], str) else self.default_ordering
+        if term.lstrip('-') not in allowed:
+            term = self.default_ordering
+        return term.lstrip('-'), term.startswith('-')
+
+    def build_position_filter(self, value, pk, descending):
+        """
+        (key, id) 이후 위치 조건
+        key 범위 조건을 별도로 두어 (status, -created_at) 같은 기존 인덱스로 범위 스캔이 가능하도록 함
+        """
+        field = self.key_field
+        if descending:
+            return Q(**{f'{field}__lte': value}) & (Q(**{f'{field}__lt': value}) | Q(id__lt=pk))
+        return Q(**{f'{field}__gte': value}) & (Q(**{f'{field}__gt': value}) | Q(id__gt=pk))
+
+    def encode_cursor(self, obj, reverse=False):
+        value = getattr(obj, self.key_field)
+        if hasattr(value, 'isoformat'):
+            # 마이크로초까지 보존해야 같은 밀리초 내 행이 누락되지 않음
+            value = value.isoformat()
+        payload = {
+            'k': self.key_field,
+            'v': value,
+            'i': obj.pk,
+            'r': int(reverse),
+        }
+        raw = json.dumps(payload, separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, request, queryset):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+            payload = json.loads(raw)
+            if payload['k'] != self.key_field:
+                raise ValueError('cursor ordering mismatch')
+            field = queryset.model._meta.get_field(self.key_field)
+            return {
+                'value': field.to_python(payload['v']),
+                'id': int(payload['i']),
+                'reverse': bool(payload.get('r')),
+            }
+        except (TypeError, ValueError, KeyError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), 'page')
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), 'page')
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.page[0], reverse=True)
+        )
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+
+class CursorOrPageNumberPagination(PageNumberPagination):
+    """
+    기본은 페이지 번호 페이지네이션
+    ?pagination=cursor 또는 ?cursor=... 요청 시 keyset 커서 페이지네이션 사용 (opt-in)
+    """
+    cursor_pagination_class = KeysetCursorPagination
+
+    def use_cursor(self, request):
+        return (
+            request.query_params.get('pagination') == 'cursor' or
+            self.cursor_pagination_class.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+        if self.use_cursor(request):
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -0,0 +1,141 @@
+import asyncio
+import json
+import logging
+import threading
+from contextlib import asynccontextmanager
+
+from django.conf import settings
+from django.db import transaction
+
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = 'push:user:'
+# 연결별 대기 메시지 최대 개수 (느린 클라이언트는 오래된 메시지부터 버림)
+MAX_QUEUE_SIZE = 100
+# Redis 구독이 끊겼을 때 다시 연결하기까지 대기 (초)
+RELAY_RETRY_DELAY = 3
+
+
+class PushHub:
+    """
+    사용자별 실시간 이벤트 중계 (Server-Sent Events 연결용)
+    - 같은 프로세스의 구독자: 이벤트 루프별 asyncio.Queue로 전달
+    - PUSH_REDIS_URL 설정 시: Redis pub/sub으로 발행하고, ASGI 프로세스마다 패턴 구독 1개로
+      받은 메시지를 해당 프로세스의 구독자에게 전달 (gunicorn 워커/아웃박스 워커에서 발행 가능)
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # user_id -> {(loop, queue), ...}
+        self.subscribers = {}
+        self.redis = None
+        self.relay_task = None
+
+    @property
+    def redis_url(self):
+        return getattr(settings, 'PUSH_REDIS_URL', '')
+
+    def get_redis(self):
+        if self.redis is None:
+            import redis
+            self.redis = redis.Redis.from_url(self.redis_url)
+        return self.redis
+
+    # 발행
+
+    def publish(self, user_id, event, data):
+        self.publish_many([user_id], event, data)
+
+    def publish_many(self, user_ids, event, data, chunk_size=1000):
+        """여러 사용자에게 같은 이벤트 발행 (Redis는 pipeline으로 묶어 전송)"""
+        message = json.dumps({'event': event, 'data': data}, ensure_ascii=False, default=str)
+        user_ids = list(user_ids)
+        if not self.redis_url:
+            for user_id in user_ids:
+                self.deliver(user_id, message)
+            return
+        try:
+            client = self.get_redis()
+            for start in range(0, len(user_ids), chunk_size):
+                pipeline = client.pipeline(transaction=False)
+                for user_id in user_ids[start:start + chunk_size]:
+                    pipeline.publish(f'{CHANNEL_PREFIX}{user_id}', message)
+                pipeline.execute()
+        except Exception:
+            # 실시간 전달 실패는 알림 저장에 영향을 주지 않음 (클라이언트는 재연결 시 목록으로 동기화)
+            logger.exception('실시간 이벤트 발행 실패')
+
+    def publish_on_commit(self, user_id, event, data):
+        transaction.on_commit(lambda: self.publish(user_id, event, data))
+
+    # 구독
+
+    def deliver(self, user_id, message):
+        with self.lock:
+            targets = list(self.subscribers.get(user_id, ()))
+        for loop, queue in targets:
+            try:
+                loop.call_soon_threadsafe(self._put, queue, message)
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료됨
+                pass
+
+    @staticmethod
+    def _put(queue, message):
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(message)
+
+    @asynccontextmanager
+    async def subscribe(self, user_id):
+        """사용자 이벤트 구독 (JSON 문자열 {'event', 'data'}가 들어오는 큐 반환)"""
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
+        entry = (loop, queue)
+        with self.lock:
+            self.subscribers.setdefault(user_id, set()).add(entry)
+        self.ensure_relay(loop)
+        try:
+            yield queue
+        finally:
+            with self.lock:
+                entries = self.subscribers.get(user_id)
+                if entries is not None:
+                    entries.discard(entry)
+                    if not entries:
+                        del self.subscribers[user_id]
+
+    def ensure_relay(self, loop):
+        if not self.redis_url:
+            return
+        if self.relay_task is None or self.relay_task.done():
+            self.relay_task = loop.create_task(self.relay())
+
+    async def relay(self):
+        """Redis 패턴 구독 메시지를 이 프로세스의 구독자에게 전달 (프로세스당 연결 1개)"""
+        import redis.asyncio as aioredis
+
+        while True:
+            client = aioredis.Redis.from_url(self.redis_url)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.psubscribe(f'{CHANNEL_PREFIX}*')
+                async for item in pubsub.listen():
+                    if item['type'] != 'pmessage':
+                        continue
+                    channel = item['channel'].decode()
+                    user_id = int(channel[len(CHANNEL_PREFIX):])
+                    if user_id in self.subscribers:
+                        self.deliver(user_id, item['data'].decode())
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception('실시간 이벤트 구독 실패')
+                await asyncio.sleep(RELAY_RETRY_DELAY)
+            finally:
+                await pubsub.aclose()
+                await client.aclose()
+
+
+push_hub = PushHub()
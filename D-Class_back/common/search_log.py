@@ -0,0 +1,210 @@
+import atexit
+import heapq
+import logging
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import close_old_connections
+from django.db.models import Sum
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+# 버퍼를 DB로 일괄 저장하는 주기 (초)
+FLUSH_INTERVAL = 5
+# 버퍼의 검색어 종류가 이 개수를 넘으면 주기와 관계없이 저장
+MAX_BUFFER_SIZE = 1000
+MIN_KEYWORD_LENGTH = 2
+MAX_KEYWORD_LENGTH = 100
+
+# 인기 검색어
+POPULAR_CACHE_KEY = 'search_popular:keywords'
+POPULAR_LOCK_KEY = 'search_popular:refresh_lock'
+POPULAR_SIZE = 10
+POPULAR_WINDOW = timedelta(days=7)
+# 반감기 - 하루 전 검색은 지금 검색의 절반으로 계산
+POPULAR_HALF_LIFE_HOURS = 24
+# 인기 검색어 재계산 주기 (초)
+POPULAR_REFRESH_INTERVAL = 300
+# 인기 검색어에 반영하는 검색 경로별 가중치 (자동완성 입력 중 접두어는 기록/반영하지 않음)
+SOURCE_WEIGHTS = {'search': 1.0}
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_keyword(query):
+    """공백 정리 + 소문자 변환 (너무 짧으면 None)"""
+    keyword = WHITESPACE_RE.sub(' ', (query or '').strip()).lower()[:MAX_KEYWORD_LENGTH]
+    if len(keyword) < MIN_KEYWORD_LENGTH:
+        return None
+    return keyword
+
+
+class SearchLogBuffer:
+    """
+    검색 로그 프로세스 버퍼
+    요청에서는 메모리 Counter만 증가시키고, 백그라운드 스레드가 주기적으로 bulk_create 및 인기 검색어 갱신
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = Counter()
+        self.wake = threading.Event()
+        self.thread = None
+        self.pid = None
+
+    def record(self, query, source):
+        keyword = normalize_keyword(query)
+        if keyword is None:
+            return
+        self.ensure_worker()
+        with self.lock:
+            self.counts[(keyword, source)] += 1
+            size = len(self.counts)
+        if size >= MAX_BUFFER_SIZE:
+            self.wake.set()
+
+    def drain(self):
+        with self.lock:
+            counts, self.counts = self.counts, Counter()
+        return counts
+
+    def flush(self):
+        """버퍼 내용을 검색어별 1행으로 일괄 저장"""
+        from .models import SearchLog
+
+        counts = self.drain()
+        if not counts:
+            return 0
+        now = timezone.now()
+        try:
+            SearchLog.objects.bulk_create([
+                SearchLog(keyword=keyword, source=source, count=count, created_at=now)
+                for (keyword, source), count in counts.items()
+            ], batch_size=500)
+        except Exception:
+            # 저장 실패 시 다음 주기에 다시 시도 (버퍼가 과도하게 커지면 버림)
+            with self.lock:
+                if len(self.counts) + len(counts) <= MAX_BUFFER_SIZE * 10:
+                    self.counts.update(counts)
+            raise
+        return len(counts)
+
+    def ensure_worker(self):
+        """현재 프로세스의 저장/갱신 스레드 시작 (gunicorn fork 이후 워커별로 시작)"""
+        if self.pid == os.getpid() and self.thread is not None:
+            return
+        with self.lock:
+            if self.pid == os.getpid() and self.thread is not None:
+                return
+            if self.pid is not None:
+                # fork 이전 부모 프로세스의 버퍼는 부모가 저장
+                self.counts = Counter()
+            else:
+                atexit.register(self.shutdown)
+            self.pid = os.getpid()
+            self.thread = threading.Thread(target=self.run, name='search-log-flush', daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while True:
+            self.wake.wait(FLUSH_INTERVAL)
+            self.wake.clear()
+            try:
+                self.flush()
+                refresh_popular_keywords_if_stale()
+            except Exception:
+                logger.exception('검색 로그 저장 실패')
+            finally:
+                close_old_connections()
+
+    def shutdown(self):
+        if self.pid != os.getpid():
+            return
+        try:
+            self.flush()
+        except Exception:
+            logger.exception('검색 로그 저장 실패')
+
+
+search_log = SearchLogBuffer()
+
+
+def compute_popular_keywords(limit=POPULAR_SIZE, now=None):
+    """
+    최근 검색 로그의 시간 감쇠 점수 상위 K개
+    시간 단위로 합산한 뒤 score = Σ 검색 수 × 경로 가중치 × 0.5^(경과 시간 / 반감기)
+    """
+    from .models import SearchLog
+
+    now = now or timezone.now()
+    rows = SearchLog.objects.filter(
+        created_at__gte=now - POPULAR_WINDOW, source__in=SOURCE_WEIGHTS
+    ).annotate(
+        hour=TruncHour('created_at')
+    ).order_by().values('keyword', 'source', 'hour').annotate(total=Sum('count'))
+
+    scores = defaultdict(float)
+    for row in rows:
+        age_hours = max((now - row['hour']).total_seconds() / 3600, 0)
+        decay = 0.5 ** (age_hours / POPULAR_HALF_LIFE_HOURS)
+        scores[row['keyword']] += row['total'] * SOURCE_WEIGHTS.get(row['source'], 1.0) * decay
+
+    top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+    return [
+        {'keyword': keyword, 'count': max(round(score), 1)}
+        for keyword, score in top
+    ]
+
+
+def refresh_popular_keywords():
+    """인기 검색어 재계산 후 캐시에 저장 (만료 없음, 갱신 시각으로 재계산 시점 판단)"""
+    keywords = compute_popular_keywords()
+    cache.set(POPULAR_CACHE_KEY, {
+        'keywords': keywords,
+        'refreshed_at': timezone.now(),
+    }, timeout=None)
+    return keywords
+
+
+def refresh_popular_keywords_if_stale():
+    """갱신 주기가 지났으면 재계산 (여러 워커 중 한 곳에서만 실행)"""
+    cached = cache.get(POPULAR_CACHE_KEY)
+    if cached and timezone.now() - cached['refreshed_at'] < timedelta(seconds=POPULAR_REFRESH_INTERVAL):
+        return
+    if not cache.add(POPULAR_LOCK_KEY, 1, timeout=POPULAR_REFRESH_INTERVAL):
+        return
+    try:
+        refresh_popular_keywords()
+    finally:
+        cache.delete(POPULAR_LOCK_KEY)
+
+
+def get_popular_keywords():
+    """
+    캐시된 인기 검색어 (요청에서는 재계산하지 않음)
+    캐시가 비어 있으면 빈 목록을 반환하고 백그라운드 스레드가 바로 채움 (재계산은 cache.add 잠금으로 한 곳에서만)
+    """
+    # 검색 요청을 받지 않는 프로세스에서도 갱신 스레드가 돌도록 조회 시에도 시작
+    search_log.ensure_worker()
+    cached = cache.get(POPULAR_CACHE_KEY)
+    if cached is not None:
+        return cached['keywords']
+    search_log.wake.set()
+    return []
+
+
+def prune_search_logs(days):
+    """보관 기간이 지난 검색 로그 삭제"""
+    from .models import SearchLog
+
+    deleted, _ = SearchLog.objects.filter(
+        created_at__lt=timezone.now() - timedelta(days=days)
+    ).delete()
+    return deleted
@@ -0,0 +1,122 @@
+import base64
+import json
+from datetime import timedelta
+
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+
+
+# 삭제 기록 보관 기간 - 이보다 오래된 커서는 전체 목록을 다시 받아야 함
+TOMBSTONE_RETENTION = timedelta(days=30)
+# 커밋이 늦은 트랜잭션의 변경이 누락되지 않도록 다음 커서를 응답 시각보다 앞당기는 여유 (겹치는 행은 ID로 중복 제거)
+SYNC_SKEW = timedelta(seconds=5)
+SYNC_PAGE_SIZE = 200
+INITIAL_CURSOR = '0'
+
+
+def record_tombstone(model_label, object_id, user_id):
+    from .models import SyncTombstone
+
+    SyncTombstone.objects.create(model_label=model_label, object_id=object_id, user_id=user_id)
+
+
+def record_tombstones(model_label, rows):
+    """일괄 삭제 기록 - rows: (object_id, user_id) 목록"""
+    from .models import SyncTombstone
+
+    SyncTombstone.objects.bulk_create([
+        SyncTombstone(model_label=model_label, object_id=object_id, user_id=user_id)
+        for object_id, user_id in rows
+    ])
+
+
+def prune_tombstones(older_than=TOMBSTONE_RETENTION):
+    from .models import SyncTombstone
+
+    deleted, _ = SyncTombstone.objects.filter(deleted_at__lt=timezone.now() - older_than).delete()
+    return deleted
+
+
+def encode_sync_cursor(timestamp, pk=0):
+    raw = json.dumps({'t': timestamp.isoformat(), 'i': pk}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_sync_cursor(token):
+    """(시각, ID) 위치 반환 - '0'은 처음부터 (최초 동기화)"""
+    if token == INITIAL_CURSOR:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+        timestamp = parse_datetime(payload['t'])
+        if timestamp is None:
+            raise ValueError('invalid timestamp')
+        return timestamp, int(payload['i'])
+    except (TypeError, ValueError, KeyError):
+        raise NotFound('유효하지 않은 동기화 커서입니다')
+
+
+class DeltaSyncMixin:
+    """
+    ?since=<커서> 증분 동기화
+    커서 이후 생성/수정된 행(sync_timestamp_fields 중 가장 늦은 시각 기준)과 삭제된 행 ID만 반환
+    최초 동기화는 ?since=0, 이후에는 응답의 next_since로 요청 (has_more면 바로 이어서 요청)
+    """
+    sync_query_param = 'since'
+    sync_timestamp_fields = ['updated_at']
+    # 삭제 기록(SyncTombstone)의 모델 구분값
+    sync_tombstone_label = None
+    sync_page_size = SYNC_PAGE_SIZE
+
+    def is_sync_request(self, request):
+        return self.sync_query_param in request.query_params
+
+    def get_sync_queryset(self):
+        return self.get_queryset()
+
+    def get_sync_deleted_ids(self, request, since):
+        from .models import SyncTombstone
+
+        if self.sync_tombstone_label is None or since is None:
+            return []
+        return list(SyncTombstone.objects.filter(
+            user_id=request.user.pk,
+            model_label=self.sync_tombstone_label,
+            deleted_at__gte=since,
+        ).order_by('deleted_at').values_list('object_id', flat=True).distinct())
+
+    def sync_response(self, request):
+        started = timezone.now()
+        position = decode_sync_cursor(request.query_params[self.sync_query_param])
+        if position is not None and position[0] < started - TOMBSTONE_RETENTION:
+            return Response(
+                {'detail': '동기화 기간이 만료되었습니다. 전체 목록을 다시 조회해주세요'},
+                status=status.HTTP_410_GONE
+            )
+
+        fields = self.sync_timestamp_fields
+        sync_at = Greatest(*fields) if len(fields) > 1 else F(fields[0])
+        queryset = self.get_sync_queryset().annotate(sync_at=sync_at).order_by('sync_at', 'id')
+        if position is not None:
+            timestamp, pk = position
+            queryset = queryset.filter(Q(sync_at__gt=timestamp) | Q(sync_at=timestamp, id__gt=pk))
+
+        rows = list(queryset[:self.sync_page_size + 1])
+        has_more = len(rows) > self.sync_page_size
+        rows = rows[:self.sync_page_size]
+        if has_more:
+            next_cursor = encode_sync_cursor(rows[-1].sync_at, rows[-1].pk)
+        else:
+            next_cursor = encode_sync_cursor(started - SYNC_SKEW)
+
+        return Response({
+            'results': self.get_serializer(rows, many=True).data,
+            'deleted': self.get_sync_deleted_ids(request, position[0] if position else None),
+            'next_since': next_cursor,
+            'has_more': has_more,
+        })
@@ -1,6 +1,8 @@
 from rest_framework import generics, viewsets, status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from django.db.models import Count, Max
+from .mixins import ConditionalResponseMixin
 from .models import Term, FAQCategory, FAQ, Inquiry
 from .serializers import (
     TermSerializer,
@@ -10,11 +12,23 @@ from .serializers import (
 )
 
 
-class TermServiceView(generics.RetrieveAPIView):
+def get_term_validators(term_type):
+    """약관 ETag/Last-Modified 검증값 (약관이 없으면 None)"""
+    updated_at = Term.objects.filter(type=term_type).values_list('updated_at', flat=True).first()
+    return None if updated_at is None else [updated_at]
+
+
+class TermServiceView(ConditionalResponseMixin, generics.RetrieveAPIView):
     """이용약관 조회"""
     permission_classes = [AllowAny]
     serializer_class = TermSerializer
     
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().retrieve, *args, **kwargs)
+    
+    def get_conditional_validators(self, request):
+        return get_term_validators('service')
+    
     def get_object(self):
         term, created = Term.objects.get_or_create(
             type='service',
@@ -27,11 +41,17 @@ class TermServiceView(generics.RetrieveAPIView):
         return term
 
 
-class TermPrivacyView(generics.RetrieveAPIView):
+class TermPrivacyView(ConditionalResponseMixin, generics.RetrieveAPIView):
     """개인정보처리방침 조회"""
     permission_classes = [AllowAny]
     serializer_class = TermSerializer
     
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().retrieve, *args, **kwargs)
+    
+    def get_conditional_validators(self, request):
+        return get_term_validators('privacy')
+    
     def get_object(self):
         term, created = Term.objects.get_or_create(
             type='privacy',
@@ -44,13 +64,22 @@ class TermPrivacyView(generics.RetrieveAPIView):
         return term
 
 
-class FAQListView(generics.ListAPIView):
+class FAQListView(ConditionalResponseMixin, generics.ListAPIView):
     """FAQ 목록 조회"""
     permission_classes = [AllowAny]
     serializer_class = FAQCategorySerializer
     queryset = FAQCategory.objects.prefetch_related('faqs').all()
     
+    def get_conditional_validators(self, request):
+        """FAQ 최종 수정 시각/개수 + 카테고리 목록"""
+        faqs = FAQ.objects.aggregate(updated_at=Max('updated_at'), count=Count('id'))
+        categories = list(FAQCategory.objects.values_list('id', 'name', 'order'))
+        return [faqs['updated_at'], faqs['count'], categories]
+    
     def list(self, request, *args, **kwargs):
+        return self.conditional_response(request, self.get_faq_response, *args, **kwargs)
+    
+    def get_faq_response(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
         serializer = self.get_serializer(queryset, many=True)
         return Response({
@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 
 from pathlib import Path
 from decouple import config, Csv
+from django.core.exceptions import ImproperlyConfigured
 from datetime import timedelta
 import dj_database_url
 
@@ -123,6 +124,30 @@ else:
     }
 
 
+# Cache
+# REDIS_CACHE_URL이 있으면 Redis (운영, gunicorn 워커 간 공유), 없으면 로컬 메모리 (개발/테스트)
+REDIS_CACHE_URL = config('REDIS_CACHE_URL', default='')
+
+if REDIS_CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_CACHE_URL,
+            'KEY_PREFIX': 'dclass',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'dclass',
+        }
+    }
+
+# 비로그인 응답 캐시 유지 시간 (초) - 공고 변경 시에는 버전 변경으로 즉시 무효화
+RESPONSE_CACHE_TIMEOUT = config('RESPONSE_CACHE_TIMEOUT', default=60, cast=int)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -272,6 +297,12 @@ EMAIL_PORT = config('EMAIL_PORT', default=587, cast=int)
 EMAIL_USE_TLS = config('EMAIL_USE_TLS', default=True, cast=bool)
 EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
+DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default=EMAIL_HOST_USER or 'webmaster@localhost')
+# SMTP 연결/응답 대기 제한 (초) - 발송은 아웃박스 워커에서 묶음 단위로 하나의 연결을 재사용
+EMAIL_TIMEOUT = config('EMAIL_TIMEOUT', default=10, cast=int)
+# 테스트/개발용 파일 백엔드(django.core.mail.backends.filebased.EmailBackend) 저장 경로
+# (테스트 코드에서는 django.core.mail.backends.locmem.EmailBackend 사용)
+EMAIL_FILE_PATH = config('EMAIL_FILE_PATH', default=str(BASE_DIR / 'tmp' / 'emails'))
 
 # Celery Configuration (Optional)
 CELERY_BROKER_URL = config('CELERY_BROKER_URL', default='redis://localhost:6379/0')
@@ -280,3 +311,25 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+
+# 실시간 알림 스트림(SSE) 사용 여부 (ASGI 프로세스에서 제공, False이면 티켓 발급/스트림 모두 503)
+NOTIFICATION_STREAM_ENABLED = config('NOTIFICATION_STREAM_ENABLED', default=False, cast=bool)
+# 실시간 알림 스트림 이벤트 중계용 Redis (미설정 시 REDIS_CACHE_URL, 둘 다 없으면 같은 프로세스 내에서만 전달)
+PUSH_REDIS_URL = config('PUSH_REDIS_URL', default=REDIS_CACHE_URL)
+# 스트림 티켓은 gunicorn(발급)과 ASGI 프로세스(사용)가 캐시로 공유하고, 이벤트는 아웃박스/웹 워커에서 발행하므로
+# 프로세스 간에 공유되지 않는 로컬 메모리 캐시/프로세스 내 중계로는 동작하지 않음
+if NOTIFICATION_STREAM_ENABLED and not (REDIS_CACHE_URL and PUSH_REDIS_URL):
+    raise ImproperlyConfigured(
+        'NOTIFICATION_STREAM_ENABLED requires REDIS_CACHE_URL and PUSH_REDIS_URL '
+        '(stream tickets and events must be shared between processes)'
+    )
+
+# Transactional Outbox (알림/이메일 등 후속 작업)
+# 기본: gunicorn 워커별 아웃박스 스레드가 작업 저장 커밋 직후부터 처리
+# 이미지 변환 등 dedicated 작업과 재시작 전 남은 작업은 별도 프로세스(python manage.py process_outbox --loop)에서 처리
+# True이면 커밋 직후 요청 스레드에서 바로 처리 (테스트용)
+OUTBOX_RUN_EAGERLY = config('OUTBOX_RUN_EAGERLY', default=False, cast=bool)
+# False이면 웹 프로세스에서는 처리하지 않고 모든 작업을 process_outbox --loop 프로세스에서 처리
+OUTBOX_WORKER_THREAD = config('OUTBOX_WORKER_THREAD', default=True, cast=bool)
+# True이면 웹 워커 시작 시 바로 처리 스레드 시작 (process_outbox --loop 프로세스 없이 남은 작업 처리)
+OUTBOX_START_ON_BOOT = config('OUTBOX_START_ON_BOOT', default=False, cast=bool)
@@ -14,3 +14,10 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dclass_backend.settings')
 
 application = get_wsgi_application()
+
+# 선택: 재시작 전 처리하지 못한 아웃박스 작업을 웹 워커에서 바로 처리 (기본은 process_outbox --loop 프로세스)
+from django.conf import settings  # noqa: E402
+
+if settings.OUTBOX_START_ON_BOOT and settings.OUTBOX_WORKER_THREAD:
+    from common.outbox import outbox_worker
+    outbox_worker.start()
@@ -4,6 +4,7 @@ from rest_framework.response import Response
 from .models import Favorite
 from .serializers import FavoriteSerializer
 from job_postings.models import JobPosting
+from job_postings.mixins import PostingFlagsContextMixin
 
 
 class FavoriteToggleView(generics.GenericAPIView):
@@ -52,16 +53,19 @@ class FavoriteToggleView(generics.GenericAPIView):
         })
 
 
-class FavoriteListView(generics.ListAPIView):
+class FavoriteListView(PostingFlagsContextMixin, generics.ListAPIView):
     """찜한 공고 목록"""
     permission_classes = [IsAuthenticated]
     serializer_class = FavoriteSerializer
     
+    def get_posting_id(self, obj):
+        return obj.job_posting_id
+    
     def get_queryset(self):
         if self.request.user.role != 'instructor':
             return Favorite.objects.none()
         return Favorite.objects.filter(
             instructor=self.request.user
-        ).select_related('job_posting').prefetch_related(
-            'job_posting__academy__academy_profile'
+        ).select_related(
+            'job_posting', 'job_posting__academy', 'job_posting__academy__academy_profile'
         ).order_by('-created_at')
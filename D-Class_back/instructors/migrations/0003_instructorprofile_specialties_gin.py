@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:00
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+import common.db
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('instructors', '0002_initial'),
+    ]
+
+    operations = [
+        common.db.PostgresAddIndex(
+            model_name='instructorprofile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['specialties'], name='instructor_specialties_gin'),
+        ),
+    ]
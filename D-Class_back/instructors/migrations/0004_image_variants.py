@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('instructors', '0003_instructorprofile_specialties_gin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='instructorprofile',
+            name='profile_image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='프로필 이미지 변환본'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MaxLengthValidator
 
 
@@ -28,6 +29,13 @@ class InstructorProfile(models.Model):
         blank=True,
         verbose_name='프로필 이미지'
     )
+    # WebP 변환본 정보 (common.images에서 백그라운드로 생성, 원본 이름이 source와 다르면 갱신 전)
+    profile_image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name='프로필 이미지 변환본'
+    )
     specialties = models.JSONField(
         default=list,
         verbose_name='전문 분야',
@@ -49,6 +57,10 @@ class InstructorProfile(models.Model):
     class Meta:
         verbose_name = '강사 프로필'
         verbose_name_plural = '강사 프로필'
+        indexes = [
+            # 전문 분야 필터 (specialties ?| array[...])
+            GinIndex(fields=['specialties'], name='instructor_specialties_gin'),
+        ]
     
     def __str__(self):
         return f'{self.user.name}의 프로필'
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from django.db.models import Avg
+from common.images import image_variant_urls
 from .models import InstructorProfile, Experience, Education
 from users.serializers import UserSerializer
 
@@ -24,6 +24,7 @@ class InstructorProfileSerializer(serializers.ModelSerializer):
     """강사 프로필 시리얼라이저 (공개)"""
     name = serializers.CharField(source='user.name', read_only=True)
     profile_image = serializers.ImageField(read_only=True)
+    profile_image_variants = serializers.SerializerMethodField()
     is_verified = serializers.BooleanField(source='user.is_verified', read_only=True)
     experiences = ExperienceSerializer(many=True, read_only=True)
     educations = EducationSerializer(many=True, read_only=True)
@@ -34,19 +35,19 @@ class InstructorProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = InstructorProfile
         fields = [
-            'id', 'name', 'profile_image', 'is_verified', 'specialties',
+            'id', 'name', 'profile_image', 'profile_image_variants', 'is_verified', 'specialties',
             'bio', 'experiences', 'educations', 'average_rating',
             'review_count', 'contact_visible'
         ]
     
+    def get_profile_image_variants(self, obj):
+        return image_variant_urls(obj.profile_image.name, obj.profile_image_variants, self.context.get('request'))
+    
     def get_average_rating(self, obj):
-        from reviews.models import Review
-        reviews = Review.objects.filter(instructor=obj.user)
-        if reviews.exists():
-            return round(reviews.aggregate(avg=Avg('rating'))['avg'], 1)
-        return None
+        from reviews.stats import get_review_stats
+        return get_review_stats(obj.user).average_rating
     
     def get_review_count(self, obj):
-        from reviews.models import Review
-        return Review.objects.filter(instructor=obj.user).count()
+        from reviews.stats import get_review_stats
+        return get_review_stats(obj.user).review_count
 
@@ -1,7 +1,9 @@
 from rest_framework import status, generics, viewsets
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
+from django.db.models import Count, Max
 from django.shortcuts import get_object_or_404
+from common.mixins import ConditionalResponseMixin
 from .models import InstructorProfile, Experience, Education
 from .serializers import ExperienceSerializer, EducationSerializer, InstructorProfileSerializer
 from users.models import User
@@ -37,7 +39,7 @@ class EducationViewSet(viewsets.ModelViewSet):
         serializer.save(instructor=profile)
 
 
-class InstructorProfileDetailView(generics.RetrieveAPIView):
+class InstructorProfileDetailView(ConditionalResponseMixin, generics.RetrieveAPIView):
     """강사 프로필 조회 (공개)"""
     permission_classes = [AllowAny]
     serializer_class = InstructorProfileSerializer
@@ -49,8 +51,30 @@ class InstructorProfileDetailView(generics.RetrieveAPIView):
             'experiences', 'educations'
         )
     
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().retrieve, *args, **kwargs)
+    
+    def get_conditional_validators(self, request):
+        """강사 프로필/평점 통계 + 경력·학력의 최종 수정 시각과 개수 (쿼리 1회)"""
+        return InstructorProfile.objects.filter(
+            user_id=self.kwargs.get('instructor_id'), user__role='instructor'
+        ).annotate(
+            experiences_updated_at=Max('experiences__updated_at'),
+            experience_count=Count('experiences', distinct=True),
+            educations_updated_at=Max('educations__updated_at'),
+            education_count=Count('educations', distinct=True),
+        ).values_list(
+            'updated_at', 'user__name', 'user__is_verified', 'user__review_stats__updated_at',
+            'experiences_updated_at', 'experience_count',
+            'educations_updated_at', 'education_count'
+        ).first()
+    
     def get_object(self):
         instructor_id = self.kwargs.get('instructor_id')
-        user = get_object_or_404(User, id=instructor_id, role='instructor')
+        user = get_object_or_404(
+            User.objects.select_related('review_stats'), id=instructor_id, role='instructor'
+        )
         profile, created = InstructorProfile.objects.get_or_create(user=user)
+        # 리뷰 통계를 함께 조회한 사용자 객체 재사용
+        profile.user = user
         return profile
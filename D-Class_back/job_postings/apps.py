@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class JobPostingsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'job_postings'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,42 @@
+from rest_framework import filters
+
+from .search import is_full_text_search_available, search_postings
+
+
+class JobPostingSearchFilter(filters.SearchFilter):
+    """
+    공고 검색 필터
+    PostgreSQL에서는 search_vector(GIN 인덱스) 전문 검색, 그 외 DB는 기존 ILIKE 검색
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        if not is_full_text_search_available():
+            return super().filter_queryset(request, queryset, view)
+        query = request.query_params.get(self.search_param, '').strip()
+        if not query:
+            return queryset
+        return search_postings(queryset, query)
+
+
+class JobPostingOrderingFilter(filters.OrderingFilter):
+    """
+    공고 정렬 필터
+    distance는 반경 검색(lat/lng/radius), relevance는 전문 검색(search) 시에만 허용
+    """
+    annotated_fields = ['distance', 'relevance']
+
+    def remove_invalid_fields(self, queryset, fields, view, request):
+        valid_fields = super().remove_invalid_fields(queryset, fields, view, request)
+        annotations = queryset.query.annotations
+        return [
+            term for term in valid_fields
+            if term.lstrip('-') not in self.annotated_fields or term.lstrip('-') in annotations
+        ]
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        # relevance는 점수가 높은 순서가 자연스러우므로 방향 지정이 없으면 내림차순
+        return [
+            '-relevance' if term == 'relevance' else term
+            for term in ordering
+        ] if ordering else ordering
@@ -0,0 +1,137 @@
+import math
+
+from django.db.models import Avg, Count, F, FloatField, Max, Min, Value
+from django.db.models.functions import ASin, Cast, Cos, Floor, Power, Radians, Sin, Sqrt
+
+
+EARTH_RADIUS_KM = 6371.0
+# 위도 1도당 거리 (km)
+KM_PER_DEGREE = 111.045
+# 반경 검색 최대값 (km) - 인덱스 범위 스캔이 과도하게 넓어지지 않도록 제한
+MAX_RADIUS_KM = 50.0
+
+# 지도 클러스터링
+MIN_ZOOM = 0
+MAX_ZOOM = 21
+DEFAULT_ZOOM = 14
+# 256px 타일 기준 클러스터 한 칸의 크기 (px)
+CLUSTER_CELL_PX = 64
+# 영역 내 공고가 이 개수 이하일 때만 개별 핀으로 반환
+MAX_MAP_PINS = 50
+# 응답에 포함할 최대 클러스터 수
+MAX_MAP_CLUSTERS = 200
+
+
+def parse_coordinates(lat, lng, radius=None):
+    """쿼리 파라미터의 위도/경도/반경을 float로 변환 (잘못된 값이면 ValueError)"""
+    lat = float(lat)
+    lng = float(lng)
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        raise ValueError('invalid coordinates')
+    if radius is None:
+        return lat, lng, None
+    radius = float(radius)
+    if radius <= 0:
+        raise ValueError('invalid radius')
+    return lat, lng, min(radius, MAX_RADIUS_KM)
+
+
+def bounding_box(lat, lng, radius_km):
+    """중심 좌표와 반경을 감싸는 위도/경도 사각형 (south, north, west, east)"""
+    lat_delta = radius_km / KM_PER_DEGREE
+    cos_lat = math.cos(math.radians(lat))
+    if cos_lat < 1e-6:
+        lng_delta = 180.0
+    else:
+        lng_delta = min(radius_km / (KM_PER_DEGREE * cos_lat), 180.0)
+    return (
+        max(lat - lat_delta, -90.0),
+        min(lat + lat_delta, 90.0),
+        lng - lng_delta,
+        lng + lng_delta,
+    )
+
+
+def haversine_distance(lat, lng, lat_field='latitude', lng_field='longitude'):
+    """중심 좌표로부터의 거리(km)를 계산하는 DB 표현식 (PostGIS 불필요)"""
+    lat_rad = math.radians(lat)
+    row_lat = Radians(Cast(F(lat_field), FloatField()))
+    row_lng = Radians(Cast(F(lng_field), FloatField()))
+    d_lat = (row_lat - Value(lat_rad, output_field=FloatField())) / 2
+    d_lng = (row_lng - Value(math.radians(lng), output_field=FloatField())) / 2
+    a = (
+        Power(Sin(d_lat), 2)
+        + Value(math.cos(lat_rad), output_field=FloatField()) * Cos(row_lat) * Power(Sin(d_lng), 2)
+    )
+    return Value(2 * EARTH_RADIUS_KM, output_field=FloatField()) * ASin(Sqrt(a))
+
+
+def filter_by_radius(queryset, lat, lng, radius_km):
+    """
+    반경 검색
+    1) 위도/경도 인덱스를 타는 사각형 범위로 후보를 좁힌 뒤
+    2) 후보에 대해서만 haversine 거리를 계산하여 정확히 필터링
+    """
+    south, north, west, east = bounding_box(lat, lng, radius_km)
+    return queryset.filter(
+        latitude__gte=south,
+        latitude__lte=north,
+        longitude__gte=west,
+        longitude__lte=east,
+    ).annotate(
+        distance=haversine_distance(lat, lng)
+    ).filter(distance__lte=radius_km)
+
+
+def parse_zoom(zoom):
+    """줌 레벨 파싱 (잘못된 값이면 ValueError)"""
+    if zoom in (None, ''):
+        return DEFAULT_ZOOM
+    zoom = int(zoom)
+    if not MIN_ZOOM <= zoom <= MAX_ZOOM:
+        raise ValueError('invalid zoom')
+    return zoom
+
+
+def cluster_cell_size(zoom):
+    """줌 레벨별 격자 한 칸의 크기 (도 단위)"""
+    return 360.0 / (2 ** zoom) * CLUSTER_CELL_PX / 256
+
+
+def cluster_by_grid(queryset, zoom):
+    """
+    줌 레벨에 맞춘 격자 단위로 공고를 묶어 SQL GROUP BY로 집계
+    (개수, 중심점, 경계 영역) - 결과 크기는 공고 수가 아니라 화면 격자 수에 비례
+    """
+    cell = cluster_cell_size(zoom)
+    lat = Cast(F('latitude'), FloatField())
+    lng = Cast(F('longitude'), FloatField())
+    rows = queryset.filter(
+        latitude__isnull=False,
+        longitude__isnull=False,
+    ).annotate(
+        cell_y=Floor(lat / Value(cell, output_field=FloatField())),
+        cell_x=Floor(lng / Value(cell, output_field=FloatField())),
+    ).order_by().values('cell_y', 'cell_x').annotate(
+        count=Count('id'),
+        center_lat=Avg(lat),
+        center_lng=Avg(lng),
+        south=Min(lat),
+        north=Max(lat),
+        west=Min(lng),
+        east=Max(lng),
+    ).order_by('-count')[:MAX_MAP_CLUSTERS]
+
+    return [{
+        'center': {
+            'lat': round(row['center_lat'], 6),
+            'lng': round(row['center_lng'], 6)
+        },
+        'count': row['count'],
+        'bounds': {
+            'north': row['north'],
+            'south': row['south'],
+            'east': row['east'],
+            'west': row['west']
+        }
+    } for row in rows]
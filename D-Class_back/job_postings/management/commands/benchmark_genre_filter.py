@@ -0,0 +1,105 @@
+"""
+장르 필터 성능 비교 (인덱스 없는 기존 OR contains 조건 vs GIN 인덱스 ?| 조건)
+Usage: python manage.py benchmark_genre_filter --postings 100000
+벤치마크용 데이터는 트랜잭션 롤백으로 삭제됩니다 (PostgreSQL 전용)
+"""
+import json
+import random
+import statistics
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Q
+
+from common.db import is_postgresql, json_array_overlap
+from job_postings.models import JobPosting
+from users.models import User
+
+
+GENRES = ['ballet', 'contemporary', 'korean', 'jazz', 'hiphop', 'ballroom', 'etc']
+GENRES_INDEX = 'job_posting_genres_gin'
+
+
+class Command(BaseCommand):
+    help = 'Benchmark genre filtering on JobPosting.genres (unindexed OR contains vs GIN ?|)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--postings', type=int, default=100000, help='생성할 공고 수')
+        parser.add_argument('--repeat', type=int, default=5, help='쿼리별 반복 횟수')
+        parser.add_argument(
+            '--genres',
+            default='korean,ballroom',
+            help='필터할 장르 (쉼표 구분)'
+        )
+
+    def handle(self, *args, **options):
+        if not is_postgresql():
+            raise CommandError('PostgreSQL에서만 실행할 수 있습니다')
+
+        genres = [g.strip() for g in options['genres'].split(',') if g.strip()]
+
+        with transaction.atomic():
+            self.create_postings(options['postings'])
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE job_postings_jobposting')
+
+            base = JobPosting.objects.filter(status='active')
+            legacy = Q()
+            for genre in genres:
+                legacy |= Q(genres__contains=[genre])
+
+            self.report('GIN ?|', base.filter(json_array_overlap('genres', genres)), options['repeat'])
+            self.report('OR contains + GIN', base.filter(legacy), options['repeat'])
+            # 인덱스 추가 전 상태 (DROP INDEX도 아래 롤백으로 취소됨)
+            with connection.cursor() as cursor:
+                cursor.execute(f'DROP INDEX {GENRES_INDEX}')
+            self.report('OR contains (no index)', base.filter(legacy), options['repeat'])
+
+            transaction.set_rollback(True)
+
+    def create_postings(self, count):
+        """벤치마크용 공고 생성"""
+        academy = User.objects.create_user(
+            email='benchmark-academy@example.com',
+            password=None,
+            name='벤치마크 학원',
+            phone='010-0000-0000',
+            role='academy'
+        )
+        batch = []
+        for i in range(count):
+            batch.append(JobPosting(
+                academy=academy,
+                title=f'벤치마크 공고 {i}',
+                region='seoul',
+                district='강남구',
+                # 희소 장르 필터 효과를 보기 위해 분포를 치우치게 생성
+                genres=random.sample(GENRES[:3], k=1) if i % 50 else random.sample(GENRES, k=2),
+                work_days=['monday'],
+                work_time='14:00-18:00',
+                salary_type='hourly',
+                salary=50000,
+                description='벤치마크',
+                address='서울시 강남구',
+                status='active'
+            ))
+            if len(batch) >= 5000:
+                JobPosting.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            JobPosting.objects.bulk_create(batch)
+        self.stdout.write(f'Created {count} postings')
+
+    def report(self, label, queryset, repeat):
+        timings = []
+        plan = None
+        for _ in range(repeat):
+            plan = json.loads(queryset.explain(format='json', analyze=True))[0]
+            timings.append(plan['Execution Time'])
+        node = plan['Plan']
+        while node.get('Plans') and node['Node Type'] not in ('Bitmap Heap Scan', 'Index Scan', 'Seq Scan'):
+            node = node['Plans'][0]
+        self.stdout.write(self.style.SUCCESS(
+            f'{label}: median {statistics.median(timings):.2f}ms '
+            f'(rows={plan["Plan"]["Actual Rows"]}, scan={node["Node Type"]})'
+        ))
@@ -0,0 +1,32 @@
+"""
+비로그인 공고 응답 캐시 hit/miss 통계
+Usage: python manage.py job_posting_cache_stats [--reset]
+"""
+from django.core.management.base import BaseCommand
+
+from common.cache import get_response_cache_stats, reset_response_cache_stats
+from job_postings.views import JobPostingViewSet
+
+
+class Command(BaseCommand):
+    help = 'Show hit/miss counters of the anonymous job posting response cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='통계 출력 후 카운터 초기화',
+        )
+
+    def handle(self, *args, **options):
+        namespace = JobPostingViewSet.response_cache_namespace
+        actions = JobPostingViewSet.response_cache_actions
+
+        stats = get_response_cache_stats(namespace, actions)
+        for action, row in stats.items():
+            ratio = f"{row['hit_ratio']:.1%}" if row['hit_ratio'] is not None else '-'
+            self.stdout.write(f"  - {action}: hits {row['hits']}, misses {row['misses']}, hit ratio {ratio}")
+
+        if options['reset']:
+            reset_response_cache_stats(namespace, actions)
+            self.stdout.write(self.style.SUCCESS('Counters reset'))
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_postings', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['status', 'latitude', 'longitude'], name='job_posting_status_3af1d2_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_postings', '0003_jobposting_location_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['status', 'salary'], name='job_posting_status_f6dc3d_idx'),
+        ),
+    ]
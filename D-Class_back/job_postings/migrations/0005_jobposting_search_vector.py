@@ -0,0 +1,118 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:59
+
+import re
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    # GIN 인덱스는 PostgreSQL 전용 (개발용 SQLite에서는 생략)
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    JobPosting = apps.get_model('job_postings', 'JobPosting')
+    schema_editor.add_index(
+        JobPosting,
+        django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='job_posting_search_gin'),
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    JobPosting = apps.get_model('job_postings', 'JobPosting')
+    schema_editor.remove_index(
+        JobPosting,
+        django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='job_posting_search_gin'),
+    )
+
+
+# 마이그레이션 시점의 토큰화 규칙 (job_postings.search.tokenize 변경이 이 마이그레이션에 영향을 주지 않도록 복사)
+TOKEN_RE = re.compile(r'[가-힣]+|[0-9a-z]+')
+HANGUL_RE = re.compile(r'^[가-힣]+$')
+BATCH_SIZE = 1000
+# (열, 가중치) - 제목/학원명 > 담당 수업 > 우대 사항/상세 설명
+WEIGHTED_COLUMNS = [('title', 'A'), ('academy_name', 'A'), ('classes', 'B'), ('preferred', 'C'), ('description', 'D')]
+
+
+def to_search_document(text):
+    tokens = []
+    for word in TOKEN_RE.findall((text or '').lower()):
+        if HANGUL_RE.match(word) and len(word) > 2:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return ' '.join(tokens)
+
+
+def populate_search_vectors(apps, schema_editor):
+    """기존 공고 검색 벡터 일괄 생성 (BATCH_SIZE개씩 UPDATE ... FROM (VALUES ...) 1회)"""
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+    JobPosting = apps.get_model('job_postings', 'JobPosting')
+    rows = JobPosting.objects.using(connection.alias).order_by('pk').values_list(
+        'pk', 'title', 'academy__name', 'academy__academy_profile__academy_name',
+        'classes', 'preferred_qualifications', 'description',
+    )
+
+    vector = ' || '.join(
+        f"setweight(to_tsvector('simple'::regconfig, v.{column}), '{weight}')"
+        for column, weight in WEIGHTED_COLUMNS
+    )
+    columns = ', '.join(['id'] + [column for column, _ in WEIGHTED_COLUMNS])
+
+    def flush(batch):
+        values = ', '.join(['(%s, %s, %s, %s, %s, %s)'] * len(batch))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {connection.ops.quote_name(JobPosting._meta.db_table)} AS p '
+                f'SET search_vector = {vector} '
+                f'FROM (VALUES {values}) AS v({columns}) WHERE p.id = v.id',
+                [param for row in batch for param in row],
+            )
+
+    batch = []
+    for pk, title, user_name, academy_name, classes, preferred, description in rows.iterator(chunk_size=BATCH_SIZE):
+        batch.append((
+            pk,
+            to_search_document(title),
+            to_search_document(academy_name or user_name),
+            to_search_document(classes),
+            to_search_document(preferred),
+            to_search_document(description),
+        ))
+        if len(batch) == BATCH_SIZE:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_postings', '0004_jobposting_salary_index'),
+        ('academies', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobposting',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='jobposting',
+                    index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='job_posting_search_gin'),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(create_search_index, drop_search_index),
+            ],
+        ),
+        migrations.RunPython(populate_search_vectors, migrations.RunPython.noop),
+    ]
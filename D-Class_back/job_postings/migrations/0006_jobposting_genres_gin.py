@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:00
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+import common.db
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_postings', '0005_jobposting_search_vector'),
+    ]
+
+    operations = [
+        common.db.PostgresAddIndex(
+            model_name='jobposting',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['genres'], name='job_posting_genres_gin'),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:04
+
+from django.db import migrations, models
+
+
+def populate_application_counts(apps, schema_editor):
+    JobPosting = apps.get_model('job_postings', 'JobPosting')
+    db_alias = schema_editor.connection.alias
+
+    statuses = ['pending', 'reviewing', 'accepted', 'rejected']
+    postings = JobPosting.objects.using(db_alias).annotate(
+        total=models.Count('applications'),
+        **{
+            f'total_{status}': models.Count('applications', filter=models.Q(applications__status=status))
+            for status in statuses
+        }
+    ).filter(total__gt=0)
+    for posting in postings:
+        JobPosting.objects.using(db_alias).filter(pk=posting.pk).update(
+            application_count=posting.total,
+            **{f'{status}_count': getattr(posting, f'total_{status}') for status in statuses}
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0002_initial'),
+        ('job_postings', '0006_jobposting_genres_gin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobposting',
+            name='accepted_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='최종 합격 수'),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='application_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='지원 수'),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='pending_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='지원 완료 수'),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='rejected_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='불합격 수'),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='reviewing_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='검토중 수'),
+        ),
+        migrations.RunPython(populate_application_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:13
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_existing_postings_notified(apps, schema_editor):
+    # 기존 공고는 다시 게시중으로 전환되어도 새 공고 알림을 보내지 않음
+    JobPosting = apps.get_model('job_postings', 'JobPosting')
+    JobPosting.objects.using(schema_editor.connection.alias).exclude(
+        status__in=['draft', 'pending']
+    ).update(new_posting_notified_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_postings', '0007_jobposting_application_counts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobposting',
+            name='new_posting_notified_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='새 공고 알림 발송일'),
+        ),
+        migrations.RunPython(mark_existing_postings_notified, migrations.RunPython.noop),
+    ]
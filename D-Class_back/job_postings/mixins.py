@@ -0,0 +1,69 @@
+from django.db.models import Value, CharField
+
+
+def get_posting_flags(user, posting_ids):
+    """강사가 지원/찜한 공고 ID를 한 번의 쿼리로 조회"""
+    from applications.models import Application
+    from favorites.models import Favorite
+
+    applied_ids = set()
+    favorited_ids = set()
+    if not posting_ids:
+        return applied_ids, favorited_ids
+
+    applied = Application.objects.filter(
+        instructor=user,
+        job_posting_id__in=posting_ids
+    ).annotate(
+        kind=Value('applied', output_field=CharField())
+    ).values_list('job_posting_id', 'kind').order_by()
+    favorited = Favorite.objects.filter(
+        instructor=user,
+        job_posting_id__in=posting_ids
+    ).annotate(
+        kind=Value('favorited', output_field=CharField())
+    ).values_list('job_posting_id', 'kind').order_by()
+
+    for posting_id, kind in applied.union(favorited, all=True):
+        if kind == 'applied':
+            applied_ids.add(posting_id)
+        else:
+            favorited_ids.add(posting_id)
+    return applied_ids, favorited_ids
+
+
+class PostingFlagsContextMixin:
+    """
+    페이지 단위로 지원/찜 여부를 미리 계산해 serializer context로 전달
+    (공고마다 exists() 쿼리가 발생하지 않도록 함)
+    """
+    # ViewSet이 아닌 generic view는 action이 없으므로 항상 적용
+    posting_flags_actions = ['list', 'retrieve']
+
+    def get_posting_id(self, obj):
+        return obj.id
+
+    def get_serializer(self, *args, **kwargs):
+        action_name = getattr(self, 'action', None)
+        if args and (action_name is None or action_name in self.posting_flags_actions):
+            context = kwargs.setdefault('context', self.get_serializer_context())
+            context.update(self.get_posting_flags_context(args[0]))
+        return super().get_serializer(*args, **kwargs)
+
+    def get_posting_flags_context(self, instance):
+        user = self.request.user
+        if not (user.is_authenticated and user.role == 'instructor'):
+            return {
+                'applied_posting_ids': set(),
+                'favorited_posting_ids': set()
+            }
+
+        objs = instance if isinstance(instance, (list, tuple)) else (
+            list(instance) if hasattr(instance, '__iter__') else [instance]
+        )
+        posting_ids = [self.get_posting_id(obj) for obj in objs]
+        applied_ids, favorited_ids = get_posting_flags(user, posting_ids)
+        return {
+            'applied_posting_ids': applied_ids,
+            'favorited_posting_ids': favorited_ids
+        }
@@ -1,7 +1,11 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator
 
+from .search import SEARCH_SOURCE_FIELDS
+
 
 class JobPosting(models.Model):
     """구인 공고"""
@@ -109,6 +113,16 @@ class JobPosting(models.Model):
         default='pending',
         verbose_name='상태'
     )
+    # 지원 수 카운터 - 지원 생성/상태 변경/취소 시 F() 표현식으로만 갱신
+    application_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='지원 수')
+    pending_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='지원 완료 수')
+    reviewing_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='검토중 수')
+    accepted_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='최종 합격 수')
+    rejected_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='불합격 수')
+    # 새 공고 알림 발송 시각 - 발송 작업이 알림 저장과 같은 트랜잭션에서 조건부 기록하여 재게시 시 중복 발송 방지
+    new_posting_notified_at = models.DateTimeField(null=True, blank=True, editable=False, verbose_name='새 공고 알림 발송일')
+    # 전문 검색용 (제목, 상세 설명, 담당 수업, 우대 사항, 학원명) - signals에서 갱신
+    search_vector = SearchVectorField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
     
@@ -119,7 +133,61 @@ class JobPosting(models.Model):
         indexes = [
             models.Index(fields=['status', '-created_at']),
             models.Index(fields=['region', 'district']),
+            # 반경/지도 검색의 위도/경도 범위 조회용
+            models.Index(fields=['status', 'latitude', 'longitude']),
+            # 급여순 정렬/커서 페이지네이션용
+            models.Index(fields=['status', 'salary']),
+            GinIndex(fields=['search_vector'], name='job_posting_search_gin'),
+            # 장르 필터 (genres ?| array[...])
+            GinIndex(fields=['genres'], name='job_posting_genres_gin'),
         ]
     
+    # F() 표현식으로만 갱신되는 카운터 필드 (일반 저장 시 제외)
+    COUNTER_FIELDS = (
+        'application_count', 'pending_count', 'reviewing_count', 'accepted_count', 'rejected_count'
+    )
+    # 백그라운드 작업/시그널에서 update()로만 갱신되는 필드 (일반 저장 시 제외)
+    BACKGROUND_FIELDS = ('new_posting_notified_at', 'search_vector')
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 게시중 전환 여부 확인(새 공고 알림)을 위해 DB에 저장된 상태 보관
+        instance._loaded_status = instance.__dict__.get('status')
+        # 검색 벡터 갱신 필요 여부 확인을 위해 DB에 저장된 검색 대상 필드 값 보관
+        instance._loaded_search_sources = instance.search_sources()
+        return instance
+    
+    @property
+    def became_active(self):
+        """이번 저장으로 게시중 상태가 되었는지 여부"""
+        return self.status == 'active' and getattr(self, '_loaded_status', None) != 'active'
+    
+    def search_sources(self):
+        """검색 벡터를 만드는 필드 값 (불러오지 않은 필드는 None)"""
+        return {
+            name: self.__dict__.get(self._meta.get_field(name).attname)
+            for name in SEARCH_SOURCE_FIELDS
+        }
+    
+    @property
+    def search_sources_changed(self):
+        """DB에서 불러온 뒤 검색 대상 필드(제목/설명 등)가 바뀌었는지 여부"""
+        loaded = getattr(self, '_loaded_search_sources', None)
+        return loaded is None or loaded != self.search_sources()
+    
+    def save(self, *args, **kwargs):
+        # 공고 수정 시 메모리의 오래된 카운터 값으로 동시 갱신된 값을 덮어쓰지 않도록 제외
+        if not self._state.adding and not kwargs.get('force_insert') and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS + self.BACKGROUND_FIELDS
+            ]
+        # 공고와 시그널의 아웃박스 작업(새 공고 알림)을 같은 트랜잭션에서 저장
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+        self._loaded_status = self.status
+        self._loaded_search_sources = self.search_sources()
+    
     def __str__(self):
         return f'{self.title} - {self.academy.academy_profile.academy_name if hasattr(self.academy, "academy_profile") else self.academy.name}'
@@ -0,0 +1,108 @@
+import re
+
+from django.db.models import F, Value
+
+from common.db import is_postgresql
+
+
+SEARCH_CONFIG = 'simple'
+# search_vector 갱신이 필요한 공고 필드
+SEARCH_SOURCE_FIELDS = {'title', 'description', 'classes', 'preferred_qualifications', 'academy'}
+
+TOKEN_RE = re.compile(r'[가-힣]+|[0-9a-z]+')
+HANGUL_RE = re.compile(r'^[가-힣]+$')
+
+
+def is_full_text_search_available():
+    """PostgreSQL에서만 tsvector 검색 사용 (그 외 DB는 기존 ILIKE 검색)"""
+    return is_postgresql()
+
+
+def tokenize(text):
+    """
+    한국어 친화적 토큰화
+    한글은 띄어쓰기 없이 붙여 쓰는 경우가 많아 2글자 단위(bigram)로 분리
+    예: '발레강사' -> ['발레', '레강', '강사']
+    """
+    tokens = []
+    for word in TOKEN_RE.findall((text or '').lower()):
+        if HANGUL_RE.match(word) and len(word) > 2:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def to_search_document(text):
+    """tsvector로 변환할 토큰 문자열"""
+    return ' '.join(tokenize(text))
+
+
+def build_search_query(query):
+    """
+    검색어를 tsquery 문자열로 변환 (모든 토큰 AND)
+    한 글자 한글은 bigram과 매칭되도록 접두사 검색 사용
+    """
+    from django.contrib.postgres.search import SearchQuery
+
+    terms = []
+    for token in tokenize(query):
+        if HANGUL_RE.match(token) and len(token) == 1:
+            terms.append(f"'{token}':*")
+        else:
+            terms.append(f"'{token}'")
+    if not terms:
+        return None
+    return SearchQuery(' & '.join(terms), search_type='raw', config=SEARCH_CONFIG)
+
+
+def build_search_vector(posting):
+    """공고의 검색 벡터 표현식 (제목/학원명 > 담당 수업 > 우대 사항/상세 설명 순 가중치)"""
+    from django.contrib.postgres.search import SearchVector
+
+    academy = posting.academy
+    academy_name = academy.name
+    if hasattr(academy, 'academy_profile'):
+        academy_name = academy.academy_profile.academy_name
+
+    weighted_texts = [
+        (posting.title, 'A'),
+        (academy_name, 'A'),
+        (posting.classes, 'B'),
+        (posting.preferred_qualifications, 'C'),
+        (posting.description, 'D'),
+    ]
+    vector = None
+    for text, weight in weighted_texts:
+        part = SearchVector(
+            Value(to_search_document(text)),
+            config=SEARCH_CONFIG,
+            weight=weight
+        )
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def update_search_vectors(queryset):
+    """공고 검색 벡터 갱신 (공고별 UPDATE 1회)"""
+    if not is_full_text_search_available():
+        return 0
+    count = 0
+    for posting in queryset.select_related('academy', 'academy__academy_profile'):
+        queryset.model.objects.filter(pk=posting.pk).update(
+            search_vector=build_search_vector(posting)
+        )
+        count += 1
+    return count
+
+
+def search_postings(queryset, query):
+    """tsvector 검색 + 관련도(relevance) 계산"""
+    from django.contrib.postgres.search import SearchRank
+
+    search_query = build_search_query(query)
+    if search_query is None:
+        return queryset
+    return queryset.filter(search_vector=search_query).annotate(
+        relevance=SearchRank(F('search_vector'), search_query)
+    )
@@ -9,13 +9,15 @@ class JobPostingListSerializer(serializers.ModelSerializer):
     is_applied = serializers.SerializerMethodField()
     is_favorited = serializers.SerializerMethodField()
     location = serializers.SerializerMethodField()
+    distance_km = serializers.SerializerMethodField()
     
     class Meta:
         model = JobPosting
         fields = [
             'id', 'title', 'academy', 'region', 'district', 'genres',
             'work_days', 'work_time', 'salary_type', 'salary',
-            'created_at', 'status', 'is_applied', 'is_favorited', 'location'
+            'created_at', 'status', 'is_applied', 'is_favorited', 'location',
+            'distance_km'
         ]
     
     def get_academy(self, obj):
@@ -32,12 +34,19 @@ class JobPostingListSerializer(serializers.ModelSerializer):
         }
     
     def get_is_applied(self, obj):
+        # 뷰에서 페이지 단위로 미리 계산한 값이 있으면 사용
+        applied_ids = self.context.get('applied_posting_ids')
+        if applied_ids is not None:
+            return obj.id in applied_ids
         request = self.context.get('request')
         if request and request.user.is_authenticated and request.user.role == 'instructor':
             return obj.applications.filter(instructor=request.user).exists()
         return False
     
     def get_is_favorited(self, obj):
+        favorited_ids = self.context.get('favorited_posting_ids')
+        if favorited_ids is not None:
+            return obj.id in favorited_ids
         request = self.context.get('request')
         if request and request.user.is_authenticated and request.user.role == 'instructor':
             return obj.favorites.filter(instructor=request.user).exists()
@@ -50,6 +59,13 @@ class JobPostingListSerializer(serializers.ModelSerializer):
                 'lng': float(obj.longitude)
             }
         return None
+    
+    def get_distance_km(self, obj):
+        # 반경 검색(lat/lng/radius) 시에만 계산됨
+        distance = getattr(obj, 'distance', None)
+        if distance is None:
+            return None
+        return round(distance, 2)
 
 
 class JobPostingDetailSerializer(serializers.ModelSerializer):
@@ -57,7 +73,6 @@ class JobPostingDetailSerializer(serializers.ModelSerializer):
     academy = serializers.SerializerMethodField()
     is_applied = serializers.SerializerMethodField()
     is_favorited = serializers.SerializerMethodField()
-    application_count = serializers.SerializerMethodField()
     location = serializers.SerializerMethodField()
     
     class Meta:
@@ -73,20 +88,15 @@ class JobPostingDetailSerializer(serializers.ModelSerializer):
     def get_academy(self, obj):
         if hasattr(obj.academy, 'academy_profile'):
             profile = obj.academy.academy_profile
-            from reviews.models import Review
-            from django.db.models import Avg
-            reviews = Review.objects.filter(academy=obj.academy)
-            avg_rating = None
-            review_count = reviews.count()
-            if reviews.exists():
-                avg_rating = round(reviews.aggregate(avg=Avg('rating'))['avg'], 1)
+            from reviews.stats import get_review_stats
+            review_stats = get_review_stats(obj.academy)
             
             return {
                 'id': obj.academy.id,
                 'name': profile.academy_name,
                 'is_verified': obj.academy.is_verified,
-                'average_rating': avg_rating,
-                'review_count': review_count,
+                'average_rating': review_stats.average_rating,
+                'review_count': review_stats.review_count,
                 'address': profile.address,
                 'location': {
                     'lat': float(profile.latitude) if profile.latitude else None,
@@ -100,20 +110,24 @@ class JobPostingDetailSerializer(serializers.ModelSerializer):
         }
     
     def get_is_applied(self, obj):
+        # 뷰에서 페이지 단위로 미리 계산한 값이 있으면 사용
+        applied_ids = self.context.get('applied_posting_ids')
+        if applied_ids is not None:
+            return obj.id in applied_ids
         request = self.context.get('request')
         if request and request.user.is_authenticated and request.user.role == 'instructor':
             return obj.applications.filter(instructor=request.user).exists()
         return False
     
     def get_is_favorited(self, obj):
+        favorited_ids = self.context.get('favorited_posting_ids')
+        if favorited_ids is not None:
+            return obj.id in favorited_ids
         request = self.context.get('request')
         if request and request.user.is_authenticated and request.user.role == 'instructor':
             return obj.favorites.filter(instructor=request.user).exists()
         return False
     
-    def get_application_count(self, obj):
-        return obj.applications.count()
-    
     def get_location(self, obj):
         if obj.latitude and obj.longitude:
             return {
@@ -146,15 +160,12 @@ class JobPostingCreateSerializer(serializers.ModelSerializer):
 
 class JobPostingMySerializer(serializers.ModelSerializer):
     """내 공고 목록 시리얼라이저"""
-    application_count = serializers.SerializerMethodField()
     
     class Meta:
         model = JobPosting
         fields = [
             'id', 'title', 'status', 'genres', 'salary', 'salary_type',
-            'application_count', 'created_at'
+            'application_count', 'pending_count', 'reviewing_count',
+            'accepted_count', 'rejected_count', 'created_at'
         ]
     
-    def get_application_count(self, obj):
-        return obj.applications.count()
-
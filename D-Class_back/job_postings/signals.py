@@ -0,0 +1,76 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from academies.models import AcademyProfile
+from common.autocomplete import ACADEMY_TOMBSTONE, POSTING_TOMBSTONE, autocomplete
+from common.cache import bump_cache_version_on_commit
+from common.sync import record_tombstone
+from .models import JobPosting
+from .search import SEARCH_SOURCE_FIELDS, update_search_vectors
+
+
+@receiver(post_save, sender=JobPosting)
+def update_posting_search_vector(sender, instance, created=False, update_fields=None, **kwargs):
+    """
+    공고 저장 시 해당 공고의 검색 벡터만 갱신
+    공고 저장은 항상 update_fields를 지정하므로, 상태 변경·마감 등 검색 대상 값이 그대로면 건너뜀
+    """
+    if update_fields is not None and not SEARCH_SOURCE_FIELDS.intersection(update_fields):
+        return
+    if not created and not instance.search_sources_changed:
+        return
+    update_search_vectors(JobPosting.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=AcademyProfile)
+def update_academy_postings_search_vector(sender, instance, created=False, update_fields=None, **kwargs):
+    """학원명 변경 시 해당 학원 공고들의 검색 벡터 갱신"""
+    if update_fields is not None and 'academy_name' not in update_fields:
+        return
+    if not created and not instance.academy_name_changed:
+        return
+    update_search_vectors(JobPosting.objects.filter(academy_id=instance.user_id))
+
+
+@receiver([post_save, post_delete], sender=JobPosting)
+@receiver([post_save, post_delete], sender=AcademyProfile)
+def invalidate_job_posting_response_cache(sender, **kwargs):
+    """공고/학원 프로필 변경 시 비로그인 공고 응답 캐시 무효화 (커밋 이후)"""
+    bump_job_posting_response_cache()
+
+
+def bump_job_posting_response_cache():
+    """
+    비로그인 공고 응답 캐시 무효화 (커밋 이후)
+    시그널이 없는 update() 갱신(지원 수 카운터, 학원 평점 통계)에서도 호출
+    """
+    from .views import JobPostingViewSet
+    bump_cache_version_on_commit(JobPostingViewSet.response_cache_namespace)
+
+
+@receiver([post_save, post_delete], sender=JobPosting)
+@receiver([post_save, post_delete], sender=AcademyProfile)
+def update_autocomplete(sender, **kwargs):
+    """검색어 자동완성 인덱스에 공고/학원명 변경 반영 (커밋 이후 각 워커의 갱신 스레드가 반영)"""
+    transaction.on_commit(autocomplete.changed)
+
+
+@receiver(post_delete, sender=JobPosting)
+def record_posting_tombstone(sender, instance, **kwargs):
+    """자동완성 인덱스에서 삭제된 공고를 제거할 수 있도록 삭제 기록"""
+    record_tombstone(POSTING_TOMBSTONE, instance.pk, instance.academy_id)
+
+
+@receiver(post_delete, sender=AcademyProfile)
+def record_academy_tombstone(sender, instance, **kwargs):
+    record_tombstone(ACADEMY_TOMBSTONE, instance.user_id, instance.user_id)
+
+
+@receiver(post_save, sender=JobPosting)
+def fanout_new_posting_notifications(sender, instance, **kwargs):
+    """공고가 게시중으로 전환되면 새 공고 알림 발송을 아웃박스에 저장 (커밋 이후 워커가 발송)"""
+    if not instance.became_active:
+        return
+    from common.outbox import enqueue
+    enqueue('notification.new_posting', {'posting_id': instance.pk})
@@ -1,11 +1,24 @@
-from rest_framework import viewsets, generics, status, filters
+from rest_framework import viewsets, generics, status
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.decorators import action
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q
+from common.cache import AnonymousResponseCacheMixin
+from common.mixins import ConditionalResponseMixin
+from common.db import json_array_overlap
+from common.pagination import CursorOrPageNumberPagination
+from common.search_log import search_log
 from .models import JobPosting
+from .filters import JobPostingOrderingFilter, JobPostingSearchFilter
+from .geo import (
+    MAX_MAP_PINS,
+    cluster_by_grid,
+    filter_by_radius,
+    parse_coordinates,
+    parse_zoom
+)
+from .mixins import PostingFlagsContextMixin, get_posting_flags
 from .serializers import (
     JobPostingListSerializer,
     JobPostingDetailSerializer,
@@ -14,17 +27,62 @@ from .serializers import (
 )
 
 
-class JobPostingViewSet(viewsets.ModelViewSet):
+class JobPostingViewSet(
+    ConditionalResponseMixin,
+    AnonymousResponseCacheMixin,
+    PostingFlagsContextMixin,
+    viewsets.ModelViewSet
+):
     """공고 관리 ViewSet"""
-    queryset = JobPosting.objects.select_related('academy').prefetch_related(
-        'applications', 'favorites'
-    )
+    # 지원/찜 여부는 PostingFlagsContextMixin에서 페이지 단위로 조회
+    queryset = JobPosting.objects.select_related(
+        'academy', 'academy__academy_profile'
+    ).defer('search_vector')
+    posting_flags_actions = ['list', 'retrieve', 'my']
     permission_classes = [AllowAny]  # 목록/상세는 공개, 생성/수정/삭제는 권한 체크
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, JobPostingSearchFilter, JobPostingOrderingFilter]
     filterset_fields = ['region', 'district', 'status']
+    # PostgreSQL에서는 search_vector 전문 검색 사용, search_fields는 그 외 DB용
     search_fields = ['title', 'description', 'academy__academy_profile__academy_name']
-    ordering_fields = ['created_at', 'salary']
+    # distance는 lat/lng/radius 반경 검색, relevance는 search 검색 시에만 적용
+    ordering_fields = ['created_at', 'salary', 'distance', 'relevance']
     ordering = ['-created_at']
+    pagination_class = CursorOrPageNumberPagination
+    # 커서 페이지네이션 키: (created_at, id) 또는 (salary, id)
+    cursor_ordering_fields = ['created_at', 'salary']
+    # 비로그인 목록/상세/지도 응답 캐시 (공고/학원 프로필 변경 시 signals에서 버전 변경)
+    response_cache_namespace = 'job_postings'
+    response_cache_actions = ['list', 'retrieve', 'map']
+    
+    def list(self, request, *args, **kwargs):
+        # 검색어는 버퍼에만 기록 (DB 저장은 백그라운드에서 일괄 처리)
+        # 검색 제출 시의 첫 페이지만 기록 (다음 페이지 조회는 같은 검색)
+        if not request.query_params.get('cursor') and request.query_params.get('page', '1') == '1':
+            search_log.record(request.query_params.get('search'), 'search')
+        return self.cached_response(request, super().list, *args, **kwargs)
+    
+    def retrieve(self, request, *args, **kwargs):
+        # ETag가 일치하면 304, 아니면 비로그인 응답 캐시 -> 직렬화 순서로 처리
+        return self.conditional_response(
+            request, self.cached_response, super().retrieve, *args, **kwargs
+        )
+    
+    def get_conditional_validators(self, request):
+        """공고/학원 프로필/평점 통계의 수정 시각 + 지원 수 + 내 지원·찜 여부"""
+        pk = self.kwargs.get('pk')
+        if not str(pk).isdigit():
+            return None
+        row = JobPosting.objects.filter(pk=pk).values_list(
+            'pk', 'updated_at', 'application_count', 'academy__is_verified',
+            'academy__academy_profile__updated_at', 'academy__review_stats__updated_at'
+        ).first()
+        if row is None:
+            return None
+        validators = list(row)
+        if request.user.is_authenticated and request.user.role == 'instructor':
+            applied_ids, favorited_ids = get_posting_flags(request.user, [row[0]])
+            validators += [row[0] in applied_ids, row[0] in favorited_ids]
+        return validators
     
     def get_serializer_class(self):
         if self.action == 'list':
@@ -51,25 +109,29 @@ class JobPostingViewSet(viewsets.ModelViewSet):
             # 목록 조회 시 기본적으로 active만 표시
             queryset = queryset.filter(status='active')
         
+        if self.action == 'retrieve':
+            # 상세 조회 시 학원 평점 통계를 함께 조회
+            queryset = queryset.select_related('academy__review_stats')
+        
         # 장르 필터 (다중 지원: 쉼표로 구분된 여러 장르 중 하나라도 포함)
         genre = self.request.query_params.get('genre')
         if genre:
             genres = [g.strip() for g in genre.split(',') if g.strip()]
             if genres:
-                # OR 조건: 여러 장르 중 하나라도 포함된 공고
-                q_objects = Q()
-                for g in genres:
-                    q_objects |= Q(genres__contains=[g])
-                queryset = queryset.filter(q_objects)
+                # OR 조건: 여러 장르 중 하나라도 포함된 공고 (GIN 인덱스를 타는 단일 ?| 조건)
+                queryset = queryset.filter(json_array_overlap('genres', genres))
         
         # 지도 뷰 필터 (위도/경도/반경)
         lat = self.request.query_params.get('lat')
         lng = self.request.query_params.get('lng')
         radius = self.request.query_params.get('radius')
         if lat and lng and radius:
-            # 간단한 거리 계산 (PostGIS 사용 시 더 정확)
-            # 여기서는 기본 필터링만 구현
-            pass
+            try:
+                lat, lng, radius = parse_coordinates(lat, lng, radius)
+            except ValueError:
+                raise ValidationError({'detail': '위치 정보(lat, lng, radius)가 올바르지 않습니다'})
+            # 위도/경도 인덱스로 사각형 범위를 먼저 좁히고 haversine 거리로 정확히 필터링
+            queryset = filter_by_radius(queryset, lat, lng, radius)
         
         return queryset
     
@@ -137,6 +199,9 @@ class JobPostingViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], permission_classes=[AllowAny])
     def map(self, request):
         """지도용 공고 목록"""
+        return self.cached_response(request, self.get_map_response)
+    
+    def get_map_response(self, request):
         # 지도 뷰용 간소화된 데이터
         queryset = self.get_queryset().filter(status='active')
         
@@ -154,8 +219,26 @@ class JobPostingViewSet(viewsets.ModelViewSet):
                 longitude__lte=east
             )
         
+        try:
+            zoom = parse_zoom(request.query_params.get('zoom'))
+        except ValueError:
+            return Response(
+                {'detail': '줌 레벨이 올바르지 않습니다'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        # 영역 내 공고가 적으면 개별 핀, 많으면 줌 레벨별 격자 클러스터로 반환
+        total = queryset.count()
+        if total > MAX_MAP_PINS:
+            return Response({
+                'zoom': zoom,
+                'total': total,
+                'postings': [],
+                'clusters': cluster_by_grid(queryset, zoom)
+            })
+        
         postings = []
-        for posting in queryset[:100]:  # 최대 100개
+        for posting in queryset:
             postings.append({
                 'id': posting.id,
                 'title': posting.title,
@@ -172,6 +255,8 @@ class JobPostingViewSet(viewsets.ModelViewSet):
             })
         
         return Response({
+            'zoom': zoom,
+            'total': total,
             'postings': postings,
-            'clusters': []  # 클러스터링은 프론트엔드에서 처리
+            'clusters': []
         })
@@ -1,10 +1,10 @@
 from django.contrib import admin
-from .models import Notification, NotificationSettings
+from .models import ArchivedNotification, Notification, NotificationSettings
 
 
 @admin.register(NotificationSettings)
 class NotificationSettingsAdmin(admin.ModelAdmin):
-    list_display = ['user', 'application_result', 'verification_result', 'new_posting']
+    list_display = ['user', 'application_result', 'verification_result', 'new_posting', 'new_posting_regions']
     search_fields = ['user__name', 'user__email']
 
 
@@ -14,3 +14,11 @@ class NotificationAdmin(admin.ModelAdmin):
     search_fields = ['user__name', 'title', 'content']
     list_filter = ['type', 'is_read', 'created_at']
     readonly_fields = ['created_at']
+
+
+@admin.register(ArchivedNotification)
+class ArchivedNotificationAdmin(admin.ModelAdmin):
+    list_display = ['user', 'type', 'title', 'created_at', 'archived_at']
+    search_fields = ['user__name', 'title', 'content']
+    list_filter = ['type', 'created_at']
+    readonly_fields = ['created_at', 'updated_at', 'archived_at']
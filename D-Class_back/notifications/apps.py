@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class NotificationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'notifications'
+
+    def ready(self):
+        # 아웃박스 작업 처리 함수 등록
+        from . import delivery  # noqa: F401
+        from . import signals  # noqa: F401
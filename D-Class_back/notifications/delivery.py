@@ -0,0 +1,33 @@
+from common.outbox import enqueue, outbox_handler
+from common.push import push_hub
+from .models import Notification
+from .unread import adjust_unread_count
+
+
+def notify(user_id, type, title, content, related_url=''):
+    """알림 생성을 아웃박스에 저장 (호출한 트랜잭션이 커밋된 뒤 워커가 생성)"""
+    return enqueue('notification.create', {
+        'user_id': user_id,
+        'type': type,
+        'title': title,
+        'content': content,
+        'related_url': related_url,
+    })
+
+
+@outbox_handler('notification.create')
+def create_notification(payload):
+    from .serializers import NotificationSerializer
+    
+    notification = Notification.objects.create(**payload)
+    adjust_unread_count(payload['user_id'], 1)
+    # 실시간 알림 스트림 연결 중인 사용자에게 전달
+    push_hub.publish_on_commit(
+        payload['user_id'], 'notification', NotificationSerializer(notification).data
+    )
+
+
+@outbox_handler('notification.new_posting')
+def fanout_new_posting_notifications(payload):
+    from .fanout import fanout_new_posting
+    fanout_new_posting(payload['posting_id'])
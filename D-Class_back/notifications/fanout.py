@@ -0,0 +1,136 @@
+import csv
+import io
+import logging
+import time
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from common.db import is_postgresql, json_array_overlap
+from common.push import push_hub
+from .models import Notification
+from .unread import invalidate_unread_counts
+
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 저장하는 알림 수 (bulk_create 배치 / COPY 묶음)
+CHUNK_SIZE = 5000
+NOTIFICATION_COLUMNS = (
+    'user_id', 'type', 'title', 'content', 'is_read', 'related_url', 'created_at', 'updated_at'
+)
+
+
+def get_new_posting_recipient_ids(posting):
+    """
+    새 공고 알림 대상 강사 ID 목록 (단일 쿼리)
+    전문 분야가 공고 장르와 겹치고(GIN ?|), 새 공고 알림을 켜 두었으며,
+    알림 지역을 지정하지 않았거나 공고 지역을 포함한 활성 강사
+    알림 설정이 없는 강사는 기본값(전체 지역 수신)으로 취급
+    장르가 없는 공고는 관심 분야가 겹치는 강사가 없으므로 대상 없음 (전체 강사에게 발송하지 않음)
+    """
+    from users.models import User
+
+    genres = [genre for genre in posting.genres or [] if genre]
+    if not genres:
+        return []
+    queryset = User.objects.filter(
+        json_array_overlap('instructor_profile__specialties', genres),
+        role='instructor', is_active=True, instructor_profile__isnull=False,
+    )
+    queryset = queryset.filter(
+        Q(notification_settings__isnull=True) |
+        Q(notification_settings__new_posting=True) & (
+            Q(notification_settings__new_posting_regions=[]) |
+            json_array_overlap('notification_settings__new_posting_regions', [posting.region])
+        )
+    )
+    return list(queryset.order_by('id').values_list('id', flat=True))
+
+
+def new_posting_message(posting):
+    academy = posting.academy
+    academy_name = academy.academy_profile.academy_name if hasattr(academy, 'academy_profile') else academy.name
+    return {
+        'type': 'new_posting',
+        'title': '새 공고 알림',
+        'content': f'{academy_name}에서 관심 분야의 새 공고 "{posting.title}"를 등록했습니다.',
+        'related_url': f'/job-postings/{posting.pk}/',
+    }
+
+
+def _copy_notifications(user_ids, message, created_at):
+    """PostgreSQL COPY로 알림 일괄 저장"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for user_id in user_ids:
+        writer.writerow([
+            user_id, message['type'], message['title'], message['content'],
+            'f', message['related_url'], created_at.isoformat(), created_at.isoformat(),
+        ])
+    buffer.seek(0)
+    sql = 'COPY {} ({}) FROM STDIN WITH (FORMAT csv)'.format(
+        connection.ops.quote_name(Notification._meta.db_table),
+        ', '.join(connection.ops.quote_name(column) for column in NOTIFICATION_COLUMNS),
+    )
+    with connection.cursor() as cursor:
+        cursor.cursor.copy_expert(sql, buffer)
+
+
+def bulk_create_notifications(user_ids, message, chunk_size=CHUNK_SIZE):
+    """
+    같은 내용의 알림을 여러 사용자에게 일괄 저장
+    PostgreSQL은 묶음별 COPY, 그 외 DB는 bulk_create
+    (개별 save()를 거치지 않으므로 Notification post_save 시그널은 발생하지 않음)
+    """
+    created_at = timezone.now()
+    for start in range(0, len(user_ids), chunk_size):
+        chunk = user_ids[start:start + chunk_size]
+        if is_postgresql():
+            _copy_notifications(chunk, message, created_at)
+        else:
+            Notification.objects.bulk_create([
+                Notification(user_id=user_id, created_at=created_at, updated_at=created_at, **message)
+                for user_id in chunk
+            ], batch_size=chunk_size)
+    return len(user_ids)
+
+
+def fanout_new_posting(posting_id, force=False):
+    """
+    게시중 공고의 새 공고 알림 발송 (백그라운드 작업)
+    알림 저장 후 같은 트랜잭션 마지막에 new_posting_notified_at을 조건부 update로 기록하여 한 번만 발송
+    공고 행은 이 UPDATE부터 커밋까지만 잠기므로 발송 중에도 학원의 공고 수정/마감이 대기하지 않음
+    (동시에 실행된 작업은 기록에 실패하면 저장한 알림을 롤백, 실패 시에는 기록이 남지 않아 다시 발송 가능)
+    """
+    from job_postings.models import JobPosting
+
+    started = time.monotonic()
+    posting = JobPosting.objects.select_related(
+        'academy', 'academy__academy_profile'
+    ).defer('search_vector').filter(pk=posting_id, status='active').first()
+    if posting is None or (posting.new_posting_notified_at is not None and not force):
+        return 0
+    user_ids = get_new_posting_recipient_ids(posting)
+    message = new_posting_message(posting)
+
+    with transaction.atomic():
+        created = bulk_create_notifications(user_ids, message)
+        claim = JobPosting.objects.filter(pk=posting_id, status='active')
+        if not force:
+            claim = claim.filter(new_posting_notified_at__isnull=True)
+        if not claim.update(new_posting_notified_at=timezone.now()):
+            # 그 사이 다른 작업이 발송했거나 공고가 마감됨
+            transaction.set_rollback(True)
+            return 0
+        invalidate_unread_counts(user_ids)
+        # 일괄 저장은 ID를 반환하지 않으므로 ID 없이 내용만 실시간 전달
+        transaction.on_commit(lambda: push_hub.publish_many(
+            user_ids, 'notification', {**message, 'is_read': False, 'created_at': timezone.now()}
+        ))
+
+    logger.info(
+        '새 공고 알림 발송: 공고 %s, %d명, %.2f초', posting_id, created, time.monotonic() - started
+    )
+    return created
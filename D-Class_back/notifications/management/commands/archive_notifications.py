@@ -0,0 +1,65 @@
+"""
+오래된 읽은 알림을 보관 테이블로 이전하고, 선택적으로 오래된 보관 알림 삭제 (cron 등으로 주기 실행)
+Usage: python manage.py archive_notifications [--days 90] [--batch-size 5000] [--max-batches N] [--pause 0.5] [--purge-days 730]
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from notifications.retention import (
+    ARCHIVE_AFTER, BATCH_SIZE, archive_read_notifications, purge_archived_notifications
+)
+
+
+class Command(BaseCommand):
+    help = 'Move old read notifications to the archive table in bounded batches and optionally purge old archived ones'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=ARCHIVE_AFTER.days,
+            help='이 기간보다 오래된 읽은 알림을 보관 (기본 90일)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH_SIZE,
+            help='트랜잭션 하나에서 처리할 최대 행 수',
+        )
+        parser.add_argument(
+            '--max-batches',
+            type=int,
+            default=None,
+            help='이번 실행에서 처리할 최대 배치 수 (기본 제한 없음)',
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0,
+            help='배치 사이 대기 시간 (초)',
+        )
+        parser.add_argument(
+            '--purge-days',
+            type=int,
+            default=None,
+            help='이 기간보다 오래된 보관 알림 영구 삭제 (기본 삭제하지 않음)',
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] <= 0:
+            raise CommandError('--batch-size must be positive')
+        if options['purge_days'] is not None and options['purge_days'] < options['days']:
+            raise CommandError('--purge-days must not be shorter than --days')
+        limits = {
+            'batch_size': options['batch_size'],
+            'max_batches': options['max_batches'],
+            'pause': options['pause'],
+        }
+
+        moved = archive_read_notifications(timedelta(days=options['days']), **limits)
+        self.stdout.write(self.style.SUCCESS(f'Archived {moved} notifications'))
+
+        if options['purge_days'] is not None:
+            purged = purge_archived_notifications(timedelta(days=options['purge_days']), **limits)
+            self.stdout.write(self.style.SUCCESS(f'Purged {purged} archived notifications'))
@@ -0,0 +1,30 @@
+"""
+게시중 공고의 새 공고 알림 발송 (백그라운드 발송 누락/실패 시 재실행용)
+Usage: python manage.py fanout_new_posting <posting_id> [--force]
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from job_postings.models import JobPosting
+from notifications.fanout import fanout_new_posting
+
+
+class Command(BaseCommand):
+    help = 'Send new_posting notifications for an active job posting to matching instructors'
+
+    def add_arguments(self, parser):
+        parser.add_argument('posting_id', type=int)
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='이미 발송된 공고도 다시 발송',
+        )
+
+    def handle(self, *args, **options):
+        posting_id = options['posting_id']
+        if not JobPosting.objects.filter(pk=posting_id, status='active').exists():
+            raise CommandError(f'Active job posting {posting_id} does not exist')
+        count = fanout_new_posting(posting_id, force=options['force'])
+        if count == 0 and not options['force']:
+            self.stdout.write('Already notified (use --force to resend) or no matching instructors')
+            return
+        self.stdout.write(self.style.SUCCESS(f'Created {count} new_posting notifications'))
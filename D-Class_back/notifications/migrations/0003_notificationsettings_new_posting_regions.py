@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationsettings',
+            name='new_posting_regions',
+            field=models.JSONField(blank=True, default=list, verbose_name='새 공고 알림 지역'),
+        ),
+    ]
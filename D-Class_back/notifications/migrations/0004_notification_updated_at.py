@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:22
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def copy_created_at(apps, schema_editor):
+    # 기존 알림의 변경 시각은 생성 시각으로 채움 (마이그레이션 시각이면 첫 동기화에 모두 포함됨)
+    Notification = apps.get_model('notifications', 'Notification')
+    Notification.objects.using(schema_editor.connection.alias).update(updated_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_notificationsettings_new_posting_regions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='수정일'),
+        ),
+        migrations.RunPython(copy_created_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'updated_at'], name='notificatio_user_id_7c286f_idx'),
+        ),
+    ]
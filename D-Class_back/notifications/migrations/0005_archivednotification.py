@@ -0,0 +1,55 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:24
+
+from django.conf import settings
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.deletion
+
+import common.db
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('notifications', '0004_notification_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedNotification',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('type', models.CharField(choices=[('application_accepted', '지원 합격'), ('application_rejected', '지원 불합격'), ('verification_approved', '인증 승인'), ('verification_rejected', '인증 반려'), ('new_posting', '새 공고 알림'), ('new_application', '새 지원 알림')], max_length=50, verbose_name='알림 유형')),
+                ('title', models.CharField(max_length=200, verbose_name='제목')),
+                ('content', models.TextField(verbose_name='내용')),
+                ('is_read', models.BooleanField(default=True, verbose_name='읽음 여부')),
+                ('related_url', models.CharField(blank=True, max_length=500, verbose_name='관련 URL')),
+                ('created_at', models.DateTimeField(verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(verbose_name='수정일')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='보관일')),
+            ],
+            options={
+                'verbose_name': '보관된 알림',
+                'verbose_name_plural': '보관된 알림',
+                'ordering': ['-created_at'],
+            },
+        ),
+        common.db.PostgresAddIndex(
+            model_name='notification',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['created_at'], name='notification_created_brin'),
+        ),
+        migrations.AddField(
+            model_name='archivednotification',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_notifications', to=settings.AUTH_USER_MODEL, verbose_name='사용자'),
+        ),
+        migrations.AddIndex(
+            model_name='archivednotification',
+            index=models.Index(fields=['user', '-created_at'], name='notificatio_user_id_0b7536_idx'),
+        ),
+        common.db.PostgresAddIndex(
+            model_name='archivednotification',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['created_at'], name='archived_notif_created_brin'),
+        ),
+    ]
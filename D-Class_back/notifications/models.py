@@ -1,3 +1,4 @@
+from django.contrib.postgres.indexes import BrinIndex
 from django.db import models
 from django.conf import settings
 
@@ -23,6 +24,12 @@ class NotificationSettings(models.Model):
         default=True,
         verbose_name='새 공고 알림'
     )
+    # 새 공고 알림을 받을 지역 코드 목록 (JobPosting.REGION_CHOICES, 비어 있으면 전체 지역)
+    new_posting_regions = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name='새 공고 알림 지역'
+    )
     marketing = models.BooleanField(
         default=False,
         verbose_name='마케팅 알림'
@@ -70,6 +77,8 @@ class Notification(models.Model):
         verbose_name='관련 URL'
     )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
+    # 읽음 처리 등 변경 시각 (?since= 증분 동기화 기준, update() 시에도 함께 갱신)
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
     
     class Meta:
         verbose_name = '알림'
@@ -77,6 +86,53 @@ class Notification(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', 'is_read', '-created_at']),
+            models.Index(fields=['user', 'updated_at']),
+            # 생성 순서대로 쌓이는 테이블이라 작은 BRIN 인덱스로 기간 범위 조회(보관 이전 대상 선정 등)
+            BrinIndex(fields=['created_at'], name='notification_created_brin'),
+        ]
+    
+    def __str__(self):
+        return f'{self.user.name} - {self.title}'
+
+
+class ArchivedNotification(models.Model):
+    """
+    보관된 알림 (오래된 읽은 알림을 archive_notifications 명령으로 이전)
+    알림함 조회는 최근 알림 테이블만 사용하고, 지난 알림은 /notifications/history/로 조회
+    """
+    
+    # 원래 알림 ID 유지 (클라이언트에 저장된 ID와 동일)
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archived_notifications',
+        verbose_name='사용자'
+    )
+    type = models.CharField(
+        max_length=50,
+        choices=Notification.TYPE_CHOICES,
+        verbose_name='알림 유형'
+    )
+    title = models.CharField(max_length=200, verbose_name='제목')
+    content = models.TextField(verbose_name='내용')
+    is_read = models.BooleanField(default=True, verbose_name='읽음 여부')
+    related_url = models.CharField(
+        max_length=500,
+        blank=True,
+        verbose_name='관련 URL'
+    )
+    created_at = models.DateTimeField(verbose_name='생성일')
+    updated_at = models.DateTimeField(verbose_name='수정일')
+    archived_at = models.DateTimeField(auto_now_add=True, verbose_name='보관일')
+    
+    class Meta:
+        verbose_name = '보관된 알림'
+        verbose_name_plural = '보관된 알림'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+            BrinIndex(fields=['created_at'], name='archived_notif_created_brin'),
         ]
     
     def __str__(self):
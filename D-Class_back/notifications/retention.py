@@ -0,0 +1,117 @@
+import time
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from common.db import is_postgresql
+from .models import ArchivedNotification, Notification
+
+
+# 읽은 알림을 보관 테이블로 옮기기까지의 기간
+ARCHIVE_AFTER = timedelta(days=90)
+# 한 트랜잭션에서 옮기거나 삭제할 최대 행 수 (잠금 시간/WAL 급증 제한)
+BATCH_SIZE = 5000
+
+ARCHIVE_COLUMNS = [
+    'id', 'user_id', 'type', 'title', 'content', 'is_read',
+    'related_url', 'created_at', 'updated_at',
+]
+# 같은 ID의 보관 행이 이미 있을 때 덮어쓰는 컬럼
+ARCHIVE_UPDATE_COLUMNS = [column for column in ARCHIVE_COLUMNS if column != 'id'] + ['archived_at']
+
+
+def _archive_batch_postgresql(cutoff, batch_size, archived_at):
+    """
+    DELETE ... RETURNING 결과를 바로 INSERT하는 단일 구문 (행을 애플리케이션으로 가져오지 않음)
+    같은 ID의 보관 행이 이미 있으면 삭제한 알림 내용으로 덮어씀 (삭제된 알림이 보관되지 않고 사라지지 않도록)
+    """
+    quote = connection.ops.quote_name
+    columns = ', '.join(quote(column) for column in ARCHIVE_COLUMNS)
+    updates = ', '.join(
+        f'{quote(column)} = EXCLUDED.{quote(column)}'
+        for column in ARCHIVE_UPDATE_COLUMNS
+    )
+    sql = f'''
+        WITH moved AS (
+            DELETE FROM {quote(Notification._meta.db_table)}
+            WHERE id IN (
+                SELECT id FROM {quote(Notification._meta.db_table)}
+                WHERE is_read AND created_at < %s
+                ORDER BY created_at
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING {columns}
+        )
+        INSERT INTO {quote(ArchivedNotification._meta.db_table)} ({columns}, {quote('archived_at')})
+        SELECT {columns}, %s FROM moved
+        ON CONFLICT (id) DO UPDATE SET {updates}
+    '''
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [cutoff, batch_size, archived_at])
+        return cursor.rowcount
+
+
+def _archive_batch(cutoff, batch_size, archived_at):
+    rows = list(
+        Notification.objects.filter(is_read=True, created_at__lt=cutoff)
+        .order_by('created_at')
+        .values(*ARCHIVE_COLUMNS)[:batch_size]
+    )
+    if not rows:
+        return 0
+    ArchivedNotification.objects.bulk_create(
+        [ArchivedNotification(archived_at=archived_at, **row) for row in rows],
+        update_conflicts=True,
+        unique_fields=['id'],
+        update_fields=ARCHIVE_UPDATE_COLUMNS,
+    )
+    # 삭제 시그널(증분 동기화 삭제 기록) 없이 삭제 - 보관 이전은 사용자 입장에서 삭제가 아님
+    Notification.objects.filter(id__in=[row['id'] for row in rows])._raw_delete(connection.alias)
+    return len(rows)
+
+
+def archive_read_notifications(older_than=ARCHIVE_AFTER, batch_size=BATCH_SIZE, max_batches=None, pause=0):
+    """
+    오래된 읽은 알림을 보관 테이블로 이전 (배치마다 별도 트랜잭션)
+    읽지 않은 알림은 옮기지 않으므로 읽지 않은 알림 수 캐시는 그대로 유효
+    """
+    cutoff = timezone.now() - older_than
+    archive_batch = _archive_batch_postgresql if is_postgresql() else _archive_batch
+    moved = batches = 0
+    while max_batches is None or batches < max_batches:
+        with transaction.atomic():
+            count = archive_batch(cutoff, batch_size, timezone.now())
+        moved += count
+        batches += 1
+        if count < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+    return moved
+
+
+def purge_archived_notifications(older_than, batch_size=BATCH_SIZE, max_batches=None, pause=0):
+    """보관 기간이 지난 보관 알림 영구 삭제 - 클라이언트에 남은 사본도 지우도록 동기화 삭제 기록 생성"""
+    from common.sync import record_tombstones
+
+    cutoff = timezone.now() - older_than
+    purged = batches = 0
+    while max_batches is None or batches < max_batches:
+        with transaction.atomic():
+            rows = list(
+                ArchivedNotification.objects.filter(created_at__lt=cutoff)
+                .order_by('created_at')
+                .values_list('id', 'user_id')[:batch_size]
+            )
+            if rows:
+                ArchivedNotification.objects.filter(id__in=[pk for pk, _ in rows]).delete()
+                record_tombstones('notification', rows)
+        purged += len(rows)
+        batches += 1
+        if len(rows) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+    return purged
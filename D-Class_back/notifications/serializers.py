@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Notification, NotificationSettings
+from .models import ArchivedNotification, Notification, NotificationSettings
 
 
 class NotificationSerializer(serializers.ModelSerializer):
@@ -13,12 +13,31 @@ class NotificationSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
 
 
+class ArchivedNotificationSerializer(serializers.ModelSerializer):
+    """보관된 알림 시리얼라이저 (알림과 같은 형식)"""
+    class Meta:
+        model = ArchivedNotification
+        fields = NotificationSerializer.Meta.fields
+        read_only_fields = fields
+
+
 class NotificationSettingsSerializer(serializers.ModelSerializer):
     """알림 설정 시리얼라이저"""
     class Meta:
         model = NotificationSettings
         fields = [
             'application_result', 'verification_result',
-            'new_posting', 'marketing'
+            'new_posting', 'new_posting_regions', 'marketing'
         ]
+    
+    def validate_new_posting_regions(self, value):
+        from job_postings.models import JobPosting
+        
+        if not isinstance(value, list):
+            raise serializers.ValidationError('지역 코드 목록을 입력해주세요.')
+        valid_regions = {code for code, _ in JobPosting.REGION_CHOICES}
+        invalid = [region for region in value if region not in valid_regions]
+        if invalid:
+            raise serializers.ValidationError(f'지원하지 않는 지역입니다: {", ".join(map(str, invalid))}')
+        return list(dict.fromkeys(value))
 
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from common.sync import record_tombstone
+from .models import Notification
+
+
+@receiver(post_delete, sender=Notification)
+def record_notification_tombstone(sender, instance, **kwargs):
+    """알림 삭제 기록 (?since= 증분 동기화 응답의 deleted)"""
+    record_tombstone('notification', instance.pk, instance.user_id)
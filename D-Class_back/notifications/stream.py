@@ -0,0 +1,114 @@
+import asyncio
+import hashlib
+import json
+import secrets
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from common.push import push_hub
+from .unread import get_unread_count
+
+
+# 연결 유지용 주석 전송 주기 (초) - 프록시 유휴 연결 종료 방지
+KEEPALIVE_INTERVAL = 20
+# 연결 최대 유지 시간 (초) - 종료 후 EventSource가 자동으로 재연결
+MAX_STREAM_SECONDS = 300
+# 재연결 대기 시간 (ms)
+RETRY_MS = 3000
+# 스트림 연결용 1회용 티켓 유효 시간 (초)
+STREAM_TICKET_TIMEOUT = 30
+# NOTIFICATION_STREAM_ENABLED=False일 때 응답 (클라이언트는 알림 목록 폴링으로 대체)
+STREAM_DISABLED_DETAIL = '실시간 알림이 비활성화되어 있습니다'
+
+
+def format_event(event, data):
+    payload = data if isinstance(data, str) else json.dumps(data, ensure_ascii=False, default=str)
+    return f'event: {event}\ndata: {payload}\n\n'
+
+
+def stream_ticket_key(ticket):
+    # 캐시에는 티켓 원문 대신 해시를 키로 저장
+    return 'notifications:stream_ticket:' + hashlib.sha256(ticket.encode()).hexdigest()
+
+
+def issue_stream_ticket(user_id):
+    """스트림 연결용 1회용 티켓 발급 (액세스 토큰이 URL/접근 로그에 남지 않도록 토큰 대신 사용)"""
+    ticket = secrets.token_urlsafe(32)
+    cache.set(stream_ticket_key(ticket), user_id, STREAM_TICKET_TIMEOUT)
+    return ticket
+
+
+def consume_stream_ticket(ticket):
+    """티켓의 사용자 ID (만료/이미 사용된 티켓은 None) - 삭제에 성공한 요청만 사용하므로 동시에 써도 1회만 유효"""
+    key = stream_ticket_key(ticket)
+    user_id = cache.get(key)
+    if user_id is None or not cache.delete(key):
+        return None
+    return user_id
+
+
+def get_stream_user_id(request):
+    """
+    스트림 연결 사용자 ID (DB 조회 없음)
+    EventSource는 헤더를 지정할 수 없으므로 POST /notifications/stream/ticket/ 으로 받은 ?ticket= 사용
+    (Authorization 헤더의 액세스 토큰도 허용)
+    """
+    ticket = request.GET.get('ticket')
+    if ticket:
+        return consume_stream_ticket(ticket)
+    header = request.headers.get('Authorization', '')
+    prefix, _, token = header.partition(' ')
+    if prefix not in jwt_settings.AUTH_HEADER_TYPES:
+        return None
+    try:
+        # 토큰에는 문자열로 저장되므로 발행 측(정수 PK)과 맞춤
+        return int(AccessToken(token)[jwt_settings.USER_ID_CLAIM])
+    except (TokenError, KeyError, TypeError, ValueError):
+        return None
+
+
+async def notification_stream(request):
+    """
+    실시간 알림 스트림 (Server-Sent Events)
+    이벤트: unread_count(연결 직후, 변경 시), notification(새 알림), application(지원 상태 변경)
+    ASGI 서버(uvicorn 등)에서만 제공 - 동기 gunicorn 워커는 연결 동안 점유되므로 거부
+    """
+    if not settings.NOTIFICATION_STREAM_ENABLED:
+        return JsonResponse({'detail': STREAM_DISABLED_DETAIL}, status=503)
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({'detail': '실시간 알림은 ASGI 서버에서만 지원됩니다'}, status=501)
+    user_id = await sync_to_async(get_stream_user_id)(request)
+    if user_id is None:
+        return JsonResponse({'detail': '인증 정보가 유효하지 않습니다'}, status=401)
+
+    async def events():
+        deadline = time.monotonic() + MAX_STREAM_SECONDS
+        async with push_hub.subscribe(user_id) as queue:
+            yield f'retry: {RETRY_MS}\n\n'
+            unread_count = await sync_to_async(get_unread_count)(user_id)
+            yield format_event('unread_count', {'unread_count': unread_count})
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                try:
+                    message = await asyncio.wait_for(queue.get(), min(KEEPALIVE_INTERVAL, remaining))
+                except asyncio.TimeoutError:
+                    yield ': keepalive\n\n'
+                    continue
+                message = json.loads(message)
+                yield format_event(message['event'], message['data'])
+
+    response = StreamingHttpResponse(events(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # nginx 등 프록시의 응답 버퍼링 비활성화
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,80 @@
+from django.core.cache import cache
+from django.db import transaction
+
+from common.push import push_hub
+from .models import Notification
+
+
+# 캐시 유지 시간 (초) - 동시 갱신으로 어긋난 값도 이 시간이 지나면 다시 계산
+UNREAD_COUNT_TIMEOUT = 600
+
+
+def unread_count_key(user_id):
+    return f'notifications:unread:{user_id}'
+
+
+def get_unread_count(user_id):
+    """
+    사용자의 읽지 않은 알림 수 (캐시 키 조회 1회)
+    캐시에 없을 때만 (user, is_read) 인덱스로 COUNT 후 저장
+    """
+    key = unread_count_key(user_id)
+    count = cache.get(key)
+    if count is None:
+        count = Notification.objects.filter(user_id=user_id, is_read=False).count()
+        cache.add(key, count, UNREAD_COUNT_TIMEOUT)
+    return count
+
+
+def _adjust(user_id, delta):
+    key = unread_count_key(user_id)
+    try:
+        if delta > 0:
+            cache.incr(key, delta)
+        else:
+            # 음수가 되지 않도록 현재 값 이하로만 차감
+            current = cache.get(key)
+            if current is None:
+                return
+            if current + delta < 0:
+                cache.delete(key)
+            else:
+                cache.decr(key, -delta)
+    except ValueError:
+        # 캐시에 없으면 다음 조회 시 COUNT로 다시 계산
+        pass
+
+
+def publish_unread_count(user_id):
+    """실시간 알림 스트림에 변경된 읽지 않은 알림 수 전달 (다른 기기/탭 배지 동기화)"""
+    push_hub.publish(user_id, 'unread_count', {'unread_count': get_unread_count(user_id)})
+
+
+def adjust_unread_count(user_id, delta):
+    """읽지 않은 알림 수 증감 (트랜잭션 커밋 이후 반영)"""
+    def apply():
+        _adjust(user_id, delta)
+        publish_unread_count(user_id)
+
+    if delta:
+        transaction.on_commit(apply)
+
+
+def reset_unread_count(user_id, count=0):
+    """모두 읽음 처리 등 전체 값이 확정된 경우 (커밋 이후 반영)"""
+    def apply():
+        cache.set(unread_count_key(user_id), count, UNREAD_COUNT_TIMEOUT)
+        publish_unread_count(user_id)
+
+    transaction.on_commit(apply)
+
+
+def invalidate_unread_counts(user_ids, chunk_size=1000):
+    """일괄 생성(새 공고 알림 등) 후 대상 사용자의 캐시 삭제 - 다음 조회 시 다시 계산"""
+    user_ids = list(user_ids)
+
+    def delete():
+        for start in range(0, len(user_ids), chunk_size):
+            cache.delete_many([unread_count_key(user_id) for user_id in user_ids[start:start + chunk_size]])
+
+    transaction.on_commit(delete)
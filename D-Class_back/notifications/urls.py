@@ -1,5 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+from .stream import notification_stream
 from .views import (
     NotificationViewSet,
     NotificationSettingsView
@@ -11,6 +12,8 @@ router = DefaultRouter()
 router.register(r'notifications', NotificationViewSet, basename='notification')
 
 urlpatterns = [
-    path('', include(router.urls)),
+    # 라우터의 notifications/{pk}/ 보다 먼저 매칭되도록 앞에 둠
     path('notifications/settings/', NotificationSettingsView.as_view(), name='notification-settings'),
+    path('notifications/stream/', notification_stream, name='notification-stream'),
+    path('', include(router.urls)),
 ]
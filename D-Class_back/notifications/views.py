@@ -3,36 +3,49 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.decorators import action
+from django.conf import settings
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import Notification, NotificationSettings
-from .serializers import NotificationSerializer, NotificationSettingsSerializer
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from common.pagination import CursorOrPageNumberPagination
+from common.sync import DeltaSyncMixin
+from .models import ArchivedNotification, Notification, NotificationSettings
+from .serializers import (
+    ArchivedNotificationSerializer, NotificationSerializer, NotificationSettingsSerializer
+)
+from .stream import STREAM_DISABLED_DETAIL, STREAM_TICKET_TIMEOUT, issue_stream_ticket
+from .unread import adjust_unread_count, get_unread_count, reset_unread_count
 
 
-class NotificationViewSet(viewsets.ModelViewSet):
+class NotificationViewSet(DeltaSyncMixin, viewsets.ModelViewSet):
     """알림 관리 ViewSet (읽기 전용 + 커스텀 액션)"""
     permission_classes = [IsAuthenticated]
     serializer_class = NotificationSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['is_read']
+    pagination_class = CursorOrPageNumberPagination
+    sync_tombstone_label = 'notification'
     
     def get_queryset(self):
         return Notification.objects.filter(user=self.request.user).order_by('-created_at')
     
     def list(self, request, *args, **kwargs):
+        if self.is_sync_request(request):
+            return self.sync_response(request)
         queryset = self.filter_queryset(self.get_queryset())
-        unread_count = Notification.objects.filter(
-            user=request.user,
-            is_read=False
-        ).count()
+        unread_count = get_unread_count(request.user.pk)
         
         page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response({
-                'unread_count': unread_count,
-                'count': queryset.count(),
-                'results': serializer.data
-            })
+            data = {'unread_count': unread_count}
+            # 페이지 번호 페이지네이션은 이미 계산한 전체 개수 재사용 (COUNT 중복 방지)
+            # 커서 페이지네이션은 COUNT 없이 조회하므로 전체 개수를 포함하지 않음
+            django_page = getattr(self.paginator, 'page', None)
+            if hasattr(django_page, 'paginator'):
+                data['count'] = django_page.paginator.count
+            data['results'] = serializer.data
+            return self.get_paginated_response(data)
         
         serializer = self.get_serializer(queryset, many=True)
         return Response({
@@ -46,7 +59,9 @@ class NotificationViewSet(viewsets.ModelViewSet):
         notification = self.get_object()
         if notification.user != request.user:
             raise PermissionDenied('권한이 없습니다')
-        notification.delete()
+        deleted, _ = notification.delete()
+        if deleted and not notification.is_read:
+            adjust_unread_count(request.user.pk, -1)
         return Response(status=status.HTTP_204_NO_CONTENT)
     
     @action(detail=True, methods=['patch'], permission_classes=[IsAuthenticated], url_path='read')
@@ -55,8 +70,11 @@ class NotificationViewSet(viewsets.ModelViewSet):
         notification = self.get_object()
         if notification.user != request.user:
             raise PermissionDenied('권한이 없습니다')
-        notification.is_read = True
-        notification.save()
+        # 읽지 않은 알림일 때만 카운터 차감 (중복 요청에도 한 번만)
+        if Notification.objects.filter(pk=notification.pk, is_read=False).update(
+            is_read=True, updated_at=timezone.now()
+        ):
+            adjust_unread_count(request.user.pk, -1)
         return Response({
             'id': notification.id,
             'is_read': True
@@ -68,12 +86,47 @@ class NotificationViewSet(viewsets.ModelViewSet):
         count = Notification.objects.filter(
             user=request.user,
             is_read=False
-        ).update(is_read=True)
+        ).update(is_read=True, updated_at=timezone.now())
+        reset_unread_count(request.user.pk)
         
         return Response({
             'message': '모든 알림이 읽음 처리되었습니다',
             'read_count': count
         })
+    
+    @action(
+        detail=False, methods=['get'], permission_classes=[IsAuthenticated], url_path='unread-count',
+        # 사용자 조회 없이 토큰의 user_id만 사용 (액세스 토큰 유효 시간이 짧아 비활성화 지연이 제한적)
+        authentication_classes=[JWTStatelessUserAuthentication]
+    )
+    def unread_count(self, request):
+        """읽지 않은 알림 수 (배지 폴링용 - DB 조회 없이 캐시 키 조회만 수행)"""
+        return Response({'unread_count': get_unread_count(request.user.pk)})
+    
+    @action(
+        detail=False, methods=['post'], permission_classes=[IsAuthenticated], url_path='stream/ticket',
+        authentication_classes=[JWTStatelessUserAuthentication]
+    )
+    def stream_ticket(self, request):
+        """실시간 알림 스트림 연결용 1회용 티켓 발급 (액세스 토큰을 스트림 URL에 넣지 않도록)"""
+        if not settings.NOTIFICATION_STREAM_ENABLED:
+            return Response({'detail': STREAM_DISABLED_DETAIL}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        return Response({
+            # 토큰에는 문자열로 저장되므로 스트림 구독 채널(정수 PK)과 맞춤
+            'ticket': issue_stream_ticket(int(request.user.pk)),
+            'expires_in': STREAM_TICKET_TIMEOUT,
+        })
+    
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated], url_path='history')
+    def history(self, request):
+        """보관된 지난 알림 목록 (알림함 목록에서 빠진 오래된 읽은 알림)"""
+        queryset = ArchivedNotification.objects.filter(user=request.user).order_by('-created_at')
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = ArchivedNotificationSerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = ArchivedNotificationSerializer(queryset, many=True)
+        return Response(serializer.data)
 
 
 class NotificationSettingsView(generics.RetrieveUpdateAPIView):
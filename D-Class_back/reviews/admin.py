@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Review
+from .models import Review, ReviewStats
 
 
 @admin.register(Review)
@@ -8,3 +8,13 @@ class ReviewAdmin(admin.ModelAdmin):
     search_fields = ['author__name', 'content']
     list_filter = ['rating', 'created_at']
     readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(ReviewStats)
+class ReviewStatsAdmin(admin.ModelAdmin):
+    list_display = ['user', 'review_count', 'rating_sum', 'updated_at']
+    search_fields = ['user__name', 'user__email']
+    readonly_fields = [
+        'user', 'review_count', 'rating_sum',
+        'rating_1', 'rating_2', 'rating_3', 'rating_4', 'rating_5', 'updated_at'
+    ]
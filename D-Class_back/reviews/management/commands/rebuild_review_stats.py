@@ -0,0 +1,24 @@
+"""
+리뷰 평점 통계(ReviewStats) 재계산
+Usage: python manage.py rebuild_review_stats [--user 1 --user 2]
+"""
+from django.core.management.base import BaseCommand
+
+from reviews.stats import rebuild_review_stats
+
+
+class Command(BaseCommand):
+    help = 'Rebuild denormalized review rating stats from Review rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='재계산할 리뷰 대상 사용자 ID (여러 번 지정 가능, 미지정 시 전체)',
+        )
+
+    def handle(self, *args, **options):
+        count = rebuild_review_stats(options['user_ids'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt review stats for {count} users'))
@@ -0,0 +1,58 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:02
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_review_stats(apps, schema_editor):
+    Review = apps.get_model('reviews', 'Review')
+    ReviewStats = apps.get_model('reviews', 'ReviewStats')
+    db_alias = schema_editor.connection.alias
+
+    aggregates = {
+        'review_count': models.Count('id'),
+        'rating_sum': models.Sum('rating'),
+        **{
+            f'rating_{rating}': models.Count('id', filter=models.Q(rating=rating))
+            for rating in range(1, 6)
+        },
+    }
+    stats = []
+    for target_field in ('instructor', 'academy'):
+        rows = Review.objects.using(db_alias).filter(
+            **{f'{target_field}__isnull': False}
+        ).order_by().values(target_field).annotate(**aggregates)
+        for row in rows:
+            stats.append(ReviewStats(user_id=row.pop(target_field), **row))
+    ReviewStats.objects.using(db_alias).bulk_create(stats)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_user_password_reset_token_and_more'),
+        ('reviews', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='review_stats', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='리뷰 대상')),
+                ('review_count', models.PositiveIntegerField(default=0, verbose_name='리뷰 수')),
+                ('rating_sum', models.PositiveIntegerField(default=0, verbose_name='평점 합계')),
+                ('rating_1', models.PositiveIntegerField(default=0, verbose_name='1점 수')),
+                ('rating_2', models.PositiveIntegerField(default=0, verbose_name='2점 수')),
+                ('rating_3', models.PositiveIntegerField(default=0, verbose_name='3점 수')),
+                ('rating_4', models.PositiveIntegerField(default=0, verbose_name='4점 수')),
+                ('rating_5', models.PositiveIntegerField(default=0, verbose_name='5점 수')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+            ],
+            options={
+                'verbose_name': '리뷰 통계',
+                'verbose_name_plural': '리뷰 통계',
+            },
+        ),
+        migrations.RunPython(populate_review_stats, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
 
@@ -77,6 +77,65 @@ class Review(models.Model):
             models.Index(fields=['academy', '-created_at']),
         ]
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 수정 시 평점 통계 갱신을 위해 DB에 저장된 값 보관
+        instance._loaded_rating = instance.__dict__.get('rating')
+        instance._loaded_target_id = instance.target_id
+        return instance
+    
+    @property
+    def target_id(self):
+        """리뷰 대상 사용자 ID (강사 또는 학원)"""
+        return self.__dict__.get('instructor_id') or self.__dict__.get('academy_id')
+    
+    def save(self, *args, **kwargs):
+        # 리뷰와 평점 통계(post_save 시그널)를 같은 트랜잭션에서 저장
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+    
     def __str__(self):
         target = self.instructor.name if self.instructor else self.academy.name
         return f'{self.author.name}의 리뷰 - {target}'
+
+
+class ReviewStats(models.Model):
+    """리뷰 대상(강사/학원)별 평점 통계 (리뷰 작성/수정/삭제 시 함께 갱신)"""
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='review_stats',
+        verbose_name='리뷰 대상'
+    )
+    review_count = models.PositiveIntegerField(default=0, verbose_name='리뷰 수')
+    rating_sum = models.PositiveIntegerField(default=0, verbose_name='평점 합계')
+    # 평점 분포 (1~5점)
+    rating_1 = models.PositiveIntegerField(default=0, verbose_name='1점 수')
+    rating_2 = models.PositiveIntegerField(default=0, verbose_name='2점 수')
+    rating_3 = models.PositiveIntegerField(default=0, verbose_name='3점 수')
+    rating_4 = models.PositiveIntegerField(default=0, verbose_name='4점 수')
+    rating_5 = models.PositiveIntegerField(default=0, verbose_name='5점 수')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
+
+    class Meta:
+        verbose_name = '리뷰 통계'
+        verbose_name_plural = '리뷰 통계'
+
+    def __str__(self):
+        return f'{self.user.name}의 리뷰 통계'
+
+    @property
+    def average_rating(self):
+        if not self.review_count:
+            return None
+        return round(self.rating_sum / self.review_count, 1)
+
+    @property
+    def rating_distribution(self):
+        return {
+            str(rating): getattr(self, f'rating_{rating}')
+            for rating, _ in Review.RATING_CHOICES
+        }
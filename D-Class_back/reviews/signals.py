@@ -0,0 +1,28 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Review
+from .stats import apply_rating
+
+
+@receiver(post_save, sender=Review)
+def update_review_stats_on_save(sender, instance, created, **kwargs):
+    """리뷰 작성/수정 시 평점 통계 갱신 (Review.save 트랜잭션 내에서 실행)"""
+    if not created:
+        previous = (getattr(instance, '_loaded_target_id', None), getattr(instance, '_loaded_rating', None))
+        if previous == (instance.target_id, instance.rating):
+            return
+        apply_rating(previous[0], previous[1], -1)
+    apply_rating(instance.target_id, instance.rating, 1)
+    instance._loaded_rating = instance.rating
+    instance._loaded_target_id = instance.target_id
+
+
+@receiver(post_delete, sender=Review)
+def update_review_stats_on_delete(sender, instance, **kwargs):
+    """리뷰 삭제 시 평점 통계 갱신 (사용자/지원 삭제로 인한 연쇄 삭제 포함)"""
+    apply_rating(
+        getattr(instance, '_loaded_target_id', instance.target_id),
+        getattr(instance, '_loaded_rating', instance.rating),
+        -1
+    )
@@ -0,0 +1,71 @@
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from .models import Review, ReviewStats
+
+
+RATINGS = [rating for rating, _ in Review.RATING_CHOICES]
+
+
+def get_review_stats(user):
+    """
+    리뷰 대상의 평점 통계 (리뷰가 없으면 빈 통계)
+    select_related('review_stats')로 함께 조회한 경우 추가 쿼리 없음
+    """
+    stats = getattr(user, 'review_stats', None)
+    if stats is None:
+        stats = ReviewStats(user_id=user.pk)
+    return stats
+
+
+def apply_rating(user_id, rating, delta):
+    """리뷰 대상 통계에 평점 1건 반영 (delta: 1 추가, -1 제거)"""
+    from job_postings.signals import bump_job_posting_response_cache
+
+    if not user_id or rating not in RATINGS:
+        return
+    if delta > 0:
+        ReviewStats.objects.get_or_create(user_id=user_id)
+    # F() 표현식으로 갱신하여 동시 요청에서도 값이 유실되지 않음
+    ReviewStats.objects.filter(user_id=user_id).update(**{
+        'review_count': F('review_count') + delta,
+        'rating_sum': F('rating_sum') + rating * delta,
+        f'rating_{rating}': F(f'rating_{rating}') + delta,
+        # update()는 auto_now를 적용하지 않으므로 직접 갱신 (ETag 검증값으로 사용)
+        'updated_at': timezone.now(),
+    })
+    # 공고 상세의 학원 평점이 바뀌므로 공개 공고 응답 캐시 무효화 (update()는 시그널 없음)
+    bump_job_posting_response_cache()
+
+
+def rebuild_review_stats(user_ids=None):
+    """Review 테이블에서 평점 통계 재계산 (user_ids 미지정 시 전체)"""
+    from job_postings.signals import bump_job_posting_response_cache
+
+    aggregates = {
+        'review_count': Count('id'),
+        'rating_sum': Sum('rating'),
+        **{
+            f'rating_{rating}': Count('id', filter=Q(rating=rating))
+            for rating in RATINGS
+        },
+    }
+    stats = {}
+    for target_field in ('instructor', 'academy'):
+        reviews = Review.objects.filter(**{f'{target_field}__isnull': False})
+        if user_ids is not None:
+            reviews = reviews.filter(**{f'{target_field}__in': user_ids})
+        rows = reviews.order_by().values(target_field).annotate(**aggregates)
+        for row in rows:
+            user_id = row.pop(target_field)
+            stats[user_id] = ReviewStats(user_id=user_id, **row)
+
+    with transaction.atomic():
+        existing = ReviewStats.objects.all()
+        if user_ids is not None:
+            existing = existing.filter(user_id__in=user_ids)
+        existing.delete()
+        ReviewStats.objects.bulk_create(stats.values())
+        bump_job_posting_response_cache()
+    return len(stats)
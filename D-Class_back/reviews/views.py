@@ -4,8 +4,9 @@ from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.decorators import action
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Avg, Count
+from common.pagination import CursorOrPageNumberPagination
 from .models import Review
+from .stats import get_review_stats
 from .serializers import ReviewCreateSerializer, ReviewSerializer, ReviewListSerializer
 from users.models import User
 from academies.models import AcademyProfile
@@ -47,30 +48,31 @@ class AcademyReviewListView(generics.ListAPIView):
     """학원 리뷰 목록 조회"""
     permission_classes = [AllowAny]
     serializer_class = ReviewSerializer
+    pagination_class = CursorOrPageNumberPagination
+    
+    def get_academy(self):
+        """리뷰 대상 학원 (평점 통계와 함께 한 번만 조회)"""
+        if not hasattr(self, '_academy'):
+            academy_id = self.kwargs.get('academy_id')
+            try:
+                self._academy = User.objects.select_related(
+                    'academy_profile', 'review_stats'
+                ).get(id=academy_id, role='academy')
+            except User.DoesNotExist:
+                from rest_framework.exceptions import NotFound
+                raise NotFound('학원을 찾을 수 없습니다')
+        return self._academy
     
     def get_queryset(self):
-        academy_id = self.kwargs.get('academy_id')
-        try:
-            academy = User.objects.get(id=academy_id, role='academy')
-        except User.DoesNotExist:
-            from rest_framework.exceptions import NotFound
-            raise NotFound('학원을 찾을 수 없습니다')
-        return Review.objects.filter(academy=academy).order_by('-created_at')
+        return Review.objects.filter(academy=self.get_academy()).order_by('-created_at')
     
     def list(self, request, *args, **kwargs):
-        academy_id = self.kwargs.get('academy_id')
-        try:
-            academy = User.objects.get(id=academy_id, role='academy')
-        except User.DoesNotExist:
-            from rest_framework.exceptions import NotFound
-            raise NotFound('학원을 찾을 수 없습니다')
-        
+        academy = self.get_academy()
+        review_stats = get_review_stats(academy)
         queryset = self.filter_queryset(self.get_queryset())
         
-        # 평점 분포 계산
-        rating_dist = {}
-        for rating in range(1, 6):
-            rating_dist[str(rating)] = queryset.filter(rating=rating).count()
+        # 평점 분포 (리뷰 통계 테이블에서 조회)
+        rating_dist = review_stats.rating_distribution
         
         # 학원 정보
         if hasattr(academy, 'academy_profile'):
@@ -78,15 +80,15 @@ class AcademyReviewListView(generics.ListAPIView):
             academy_info = {
                 'id': academy.id,
                 'name': profile.academy_name,
-                'average_rating': round(queryset.aggregate(avg=Avg('rating'))['avg'], 1) if queryset.exists() else None,
-                'review_count': queryset.count()
+                'average_rating': review_stats.average_rating,
+                'review_count': review_stats.review_count
             }
         else:
             academy_info = {
                 'id': academy.id,
                 'name': academy.name,
                 'average_rating': None,
-                'review_count': queryset.count()
+                'review_count': review_stats.review_count
             }
         
         page = self.paginate_queryset(queryset)
@@ -95,7 +97,7 @@ class AcademyReviewListView(generics.ListAPIView):
             return self.get_paginated_response({
                 'academy': academy_info,
                 'rating_distribution': rating_dist,
-                'count': queryset.count(),
+                'count': review_stats.review_count,
                 'results': serializer.data
             })
         
@@ -103,7 +105,7 @@ class AcademyReviewListView(generics.ListAPIView):
         return Response({
             'academy': academy_info,
             'rating_distribution': rating_dist,
-            'count': queryset.count(),
+            'count': review_stats.review_count,
             'results': serializer.data
         })
 
@@ -112,35 +114,35 @@ class InstructorReviewListView(generics.ListAPIView):
     """강사 리뷰 목록 조회"""
     permission_classes = [AllowAny]
     serializer_class = ReviewSerializer
+    pagination_class = CursorOrPageNumberPagination
+    
+    def get_instructor(self):
+        """리뷰 대상 강사 (평점 통계와 함께 한 번만 조회)"""
+        if not hasattr(self, '_instructor'):
+            instructor_id = self.kwargs.get('instructor_id')
+            try:
+                self._instructor = User.objects.select_related('review_stats').get(
+                    id=instructor_id, role='instructor'
+                )
+            except User.DoesNotExist:
+                from rest_framework.exceptions import NotFound
+                raise NotFound('강사를 찾을 수 없습니다')
+        return self._instructor
     
     def get_queryset(self):
-        instructor_id = self.kwargs.get('instructor_id')
-        try:
-            instructor = User.objects.get(id=instructor_id, role='instructor')
-        except User.DoesNotExist:
-            from rest_framework.exceptions import NotFound
-            raise NotFound('강사를 찾을 수 없습니다')
-        return Review.objects.filter(instructor=instructor).order_by('-created_at')
+        return Review.objects.filter(instructor=self.get_instructor()).order_by('-created_at')
     
     def list(self, request, *args, **kwargs):
-        instructor_id = self.kwargs.get('instructor_id')
-        try:
-            instructor = User.objects.get(id=instructor_id, role='instructor')
-        except User.DoesNotExist:
-            from rest_framework.exceptions import NotFound
-            raise NotFound('강사를 찾을 수 없습니다')
-        
+        instructor = self.get_instructor()
+        review_stats = get_review_stats(instructor)
         queryset = self.filter_queryset(self.get_queryset())
         
-        # 강사 정보
-        avg_rating = None
-        if queryset.exists():
-            avg_rating = round(queryset.aggregate(avg=Avg('rating'))['avg'], 1)
+        # 강사 정보 (리뷰 통계 테이블에서 조회)
         instructor_info = {
             'id': instructor.id,
             'name': instructor.name,
-            'average_rating': avg_rating,
-            'review_count': queryset.count()
+            'average_rating': review_stats.average_rating,
+            'review_count': review_stats.review_count
         }
         
         page = self.paginate_queryset(queryset)
@@ -153,7 +155,7 @@ class InstructorReviewListView(generics.ListAPIView):
         serializer = self.get_serializer(queryset, many=True)
         return Response({
             'instructor': instructor_info,
-            'count': queryset.count(),
+            'count': review_stats.review_count,
             'results': serializer.data
         })
 
@@ -162,6 +164,7 @@ class MyReviewsView(generics.ListAPIView):
     """내가 작성한 리뷰 목록"""
     permission_classes = [IsAuthenticated]
     serializer_class = ReviewSerializer
+    pagination_class = CursorOrPageNumberPagination
     
     def get_queryset(self):
         return Review.objects.filter(
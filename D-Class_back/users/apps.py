@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
+
+    def ready(self):
+        # 아웃박스 워커가 발송 시점에 메일 내용을 만들 수 있도록 등록
+        from . import password_reset  # noqa: F401
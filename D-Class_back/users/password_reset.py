@@ -0,0 +1,43 @@
+import hashlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.crypto import get_random_string
+
+from common.mail import email_renderer, queue_rendered_email
+
+
+PASSWORD_RESET_EMAIL = 'password_reset'
+PASSWORD_RESET_TIMEOUT = timedelta(hours=1)
+
+
+def queue_password_reset_email(user):
+    """
+    비밀번호 재설정 메일 발송 예약 (호출한 트랜잭션에 포함)
+    토큰은 발송 시점에 생성하므로 아웃박스에는 사용자 ID만 저장
+    """
+    return queue_rendered_email(PASSWORD_RESET_EMAIL, user_id=user.pk)
+
+
+@email_renderer(PASSWORD_RESET_EMAIL)
+def render_password_reset_email(params):
+    """새 재설정 토큰 생성 후 해시만 저장하고, 원본 토큰은 메일 본문에만 포함"""
+    from .models import User
+
+    email = User.objects.filter(pk=params['user_id']).values_list('email', flat=True).first()
+    if email is None:
+        return None
+
+    token = get_random_string(32)
+    User.objects.filter(pk=params['user_id']).update(
+        password_reset_token=hashlib.sha256(token.encode()).hexdigest(),
+        password_reset_token_expires=timezone.now() + PASSWORD_RESET_TIMEOUT,
+    )
+    reset_url = f"{settings.FRONTEND_URL}/password-reset/confirm?token={token}"
+    return {
+        'subject': 'D-Match 비밀번호 재설정',
+        'message': f'비밀번호를 재설정하려면 다음 링크를 클릭하세요: {reset_url}',
+        'recipient_list': [email],
+        'from_email': settings.EMAIL_HOST_USER,
+    }
@@ -4,13 +4,10 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenRefreshView
 from django.contrib.auth import authenticate
-from django.utils.crypto import get_random_string
-from django.core.mail import send_mail
-from django.conf import settings
 from django.utils import timezone
-from datetime import timedelta
 import hashlib
 
+from .password_reset import queue_password_reset_email
 from .models import User
 from .serializers import (
     EmailCheckSerializer,
@@ -153,25 +150,9 @@ class PasswordResetView(generics.GenericAPIView):
                 status=status.HTTP_200_OK
             )
         
-        # 비밀번호 재설정 토큰 생성
-        token = get_random_string(32)
-        user.password_reset_token = hashlib.sha256(token.encode()).hexdigest()
-        user.password_reset_token_expires = timezone.now() + timedelta(hours=1)
-        user.save()
-        
-        # 이메일 발송 (개발 환경에서는 콘솔에 출력)
-        reset_url = f"{settings.FRONTEND_URL}/password-reset/confirm?token={token}"
-        
-        if settings.EMAIL_BACKEND == 'django.core.mail.backends.console.EmailBackend':
-            print(f"비밀번호 재설정 링크: {reset_url}")
-        else:
-            send_mail(
-                subject='D-Match 비밀번호 재설정',
-                message=f'비밀번호를 재설정하려면 다음 링크를 클릭하세요: {reset_url}',
-                from_email=settings.EMAIL_HOST_USER,
-                recipient_list=[email],
-                fail_silently=False,
-            )
+        # 재설정 토큰은 아웃박스 워커가 발송 시점에 생성 (원본 토큰이 DB의 아웃박스 작업에 남지 않도록)
+        # 개발 환경(console 백엔드)에서는 워커가 메일 내용을 콘솔에 출력
+        queue_password_reset_email(user)
         
         return Response(
             {'message': '비밀번호 재설정 링크가 이메일로 발송되었습니다'},